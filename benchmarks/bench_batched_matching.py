@@ -0,0 +1,114 @@
+"""Compare batched multi-candidate agent calls with single-pair analysis.
+
+Usage:
+    python benchmarks/bench_batched_matching.py --cvs 10 --batch-sizes 1,5,10
+
+Runs the real agents against documents already stored in the configured
+vector backend, so it needs OPENAI_API_KEY and uploaded CVs and jobs.
+Every batch size scores the same job against the same CVs; batch size 1
+is the single-pair baseline that score drift and rank agreement are
+measured against.
+"""
+
+import argparse
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+from skillo.domain.enums import DocumentType
+from skillo.domain.events import DomainEventPublisher
+from skillo.domain.services import DocumentBuilder
+from skillo.main import create_container
+
+
+class TokenUsage(BaseCallbackHandler):
+    """Counts LLM calls and tokens of every chat model run."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        usage = (response.llm_output or {}).get("token_usage", {})
+        self.calls += 1
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+
+
+usage_var: ContextVar[Optional[TokenUsage]] = ContextVar(
+    "bench_token_usage", default=None
+)
+register_configure_hook(usage_var, inheritable=True)
+
+
+def _ranks(scores: List[float]) -> np.ndarray:
+    """Rank positions of scores, best first."""
+    return np.argsort(np.argsort(-np.asarray(scores)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--job-id", default=None)
+    parser.add_argument("--cvs", type=int, default=10)
+    parser.add_argument("--batch-sizes", default="1,5,10")
+    args = parser.parse_args()
+
+    container = create_container(DomainEventPublisher(), DocumentBuilder())
+    repository = container.document_repository()
+    supervisor = container.supervisor_agent()
+
+    jobs = repository.get_documents_by_type(DocumentType.JOB)
+    job = next(
+        (doc for doc in jobs if doc.id == args.job_id),
+        jobs[0] if jobs else None,
+    )
+    if job is None:
+        raise SystemExit("No job postings stored")
+    cvs = repository.find_similar_documents(
+        query=job.content, doc_type=DocumentType.CV, limit=args.cvs
+    )
+    if not cvs:
+        raise SystemExit("No CVs stored")
+
+    scores: Dict[int, List[float]] = {}
+    for batch_size in [int(size) for size in args.batch_sizes.split(",")]:
+        usage = TokenUsage()
+        usage_var.set(usage)
+        started = time.perf_counter()
+
+        analyses: List[Dict[str, Any]] = []
+        for start in range(0, len(cvs), batch_size):
+            batch = cvs[start : start + batch_size]
+            if batch_size == 1:
+                analyses.append(supervisor.analyze_match(batch[0], job))
+            else:
+                analyses.extend(supervisor.analyze_match_batch(batch, job))
+
+        elapsed = time.perf_counter() - started
+        usage_var.set(None)
+        scores[batch_size] = [a["weighted_final_score"] for a in analyses]
+
+        line = (
+            f"batch={batch_size:<3} pairs/min={len(cvs) / elapsed * 60:6.1f} "
+            f"calls={usage.calls:<4} prompt_tokens={usage.prompt_tokens:<7} "
+            f"completion_tokens={usage.completion_tokens:<6}"
+        )
+        if 1 in scores and batch_size != 1:
+            drift = np.abs(np.subtract(scores[batch_size], scores[1]))
+            agreement = np.corrcoef(
+                _ranks(scores[batch_size]), _ranks(scores[1])
+            )[0, 1]
+            line += (
+                f" mean_score_drift={drift.mean():.3f} "
+                f"rank_correlation={agreement:.3f}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare filtered search in a shared collection with per-type collections.
+
+Usage:
+    python benchmarks/bench_collection_layout.py --cvs 100000 --jobs 2000
+
+Vectors are random, so only latency and recall against exact search are
+meaningful; no embedding API calls are made.
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+import chromadb
+import numpy as np
+
+BATCH_SIZE = 5000
+
+
+def _fill(collection: Any, vectors: np.ndarray, doc_type: str) -> None:
+    """Insert vectors in batches."""
+    for start in range(0, len(vectors), BATCH_SIZE):
+        batch = vectors[start : start + BATCH_SIZE]
+        collection.add(
+            ids=[f"{doc_type}-{start + i}" for i in range(len(batch))],
+            embeddings=batch.tolist(),
+            metadatas=[{"document_type": doc_type}] * len(batch),
+        )
+
+
+def _exact_top_k(
+    vectors: np.ndarray, queries: np.ndarray, k: int
+) -> List[set[int]]:
+    """Exact nearest neighbours by L2 distance."""
+    truth = []
+    for query in queries:
+        distances = ((vectors - query) ** 2).sum(axis=1)
+        truth.append(set(np.argpartition(distances, k)[:k].tolist()))
+    return truth
+
+
+def _run(
+    collection: Any,
+    queries: np.ndarray,
+    truth: List[set[int]],
+    k: int,
+    where: Dict[str, str] | None,
+) -> Dict[str, float]:
+    """Query latency and recall@k."""
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        result = collection.query(
+            query_embeddings=[query.tolist()], n_results=k, where=where
+        )
+        latencies.append(time.perf_counter() - started)
+        found = {int(i.rsplit("-", 1)[1]) for i in result["ids"][0]}
+        hits += len(found & expected)
+
+    return {
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+        "recall": hits / (k * len(queries)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = {
+        "cv": rng.random((args.cvs, args.dim), dtype=np.float32),
+        "job": rng.random((args.jobs, args.dim), dtype=np.float32),
+    }
+    queries = rng.random((args.queries, args.dim), dtype=np.float32)
+
+    client = chromadb.EphemeralClient()
+    shared = client.create_collection("bench_shared")
+    for doc_type, type_vectors in vectors.items():
+        _fill(shared, type_vectors, doc_type)
+        partition = client.create_collection(f"bench_{doc_type}")
+        _fill(partition, type_vectors, doc_type)
+
+    for doc_type, type_vectors in vectors.items():
+        truth = _exact_top_k(type_vectors, queries, args.k)
+        filtered = _run(
+            shared, queries, truth, args.k, {"document_type": doc_type}
+        )
+        partitioned = _run(
+            client.get_collection(f"bench_{doc_type}"),
+            queries,
+            truth,
+            args.k,
+            None,
+        )
+        for layout, stats in (
+            ("shared+filter", filtered),
+            ("partitioned", partitioned),
+        ):
+            print(
+                f"{doc_type:<4} {layout:<14} p50={stats['p50_ms']:.2f}ms "
+                f"p95={stats['p95_ms']:.2f}ms recall@{args.k}="
+                f"{stats['recall']:.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Compare retrieval latency of the NumPy index with a Chroma collection.
+
+Usage:
+    python benchmarks/bench_vector_backend.py --documents 50000
+
+Vectors are random and inserted with precomputed embeddings, so no
+embedding API calls are made. Recall is measured against exact search.
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+import chromadb
+import numpy as np
+
+from skillo.domain.entities import Document
+from skillo.domain.enums import DocumentType
+from skillo.infrastructure.config.settings import Config
+from skillo.infrastructure.repositories.numpy_document_repository import (
+    NumpyDocumentRepository,
+)
+
+BATCH_SIZE = 5000
+
+
+def _measure(
+    search: Callable[[np.ndarray], List[str]],
+    queries: np.ndarray,
+    truth: List[set[str]],
+) -> Dict[str, float]:
+    """Query latency percentiles and recall."""
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        found = search(query)
+        latencies.append(time.perf_counter() - started)
+        hits += len(set(found) & expected)
+
+    return {
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+        "recall": hits / sum(len(expected) for expected in truth),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=64)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.documents, args.dim)).astype("f4")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = rng.standard_normal((args.queries, args.dim)).astype("f4")
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    ids = [f"cv-{i}" for i in range(args.documents)]
+
+    truth = []
+    for query in queries:
+        best = np.argpartition(-(vectors @ query), args.k)[: args.k]
+        truth.append({ids[i] for i in best})
+
+    with tempfile.TemporaryDirectory() as index_path:
+        config = Config()
+        config.NUMPY_INDEX_PATH = index_path
+        config.NUMPY_IVF_NLIST = args.nlist
+        config.NUMPY_IVF_NPROBE = args.nprobe
+        with patch(
+            "skillo.infrastructure.repositories."
+            "numpy_document_repository.OpenAIEmbeddings"
+        ):
+            repository = NumpyDocumentRepository(config)
+
+        for start in range(0, args.documents, BATCH_SIZE):
+            repository.upsert_embeddings(
+                [
+                    Document(doc_id, DocumentType.CV, "")
+                    for doc_id in ids[start : start + BATCH_SIZE]
+                ],
+                vectors[start : start + BATCH_SIZE],
+            )
+
+        def numpy_search(query: np.ndarray) -> List[str]:
+            documents = repository.search_by_vector(
+                query, DocumentType.CV, args.k
+            )
+            return [document.id for document in documents]
+
+        results = {"numpy flat": _measure(numpy_search, queries, truth)}
+        config.NUMPY_INDEX_TYPE = "ivf"
+        numpy_search(queries[0])
+        results["numpy ivf"] = _measure(numpy_search, queries, truth)
+
+    collection = chromadb.EphemeralClient().create_collection(
+        "bench", metadata={"hnsw:space": "cosine"}
+    )
+    for start in range(0, args.documents, BATCH_SIZE):
+        collection.add(
+            ids=ids[start : start + BATCH_SIZE],
+            embeddings=vectors[start : start + BATCH_SIZE],
+            metadatas=[{"document_type": "cv"}]
+            * len(ids[start : start + BATCH_SIZE]),
+        )
+
+    def chroma_search(query: np.ndarray) -> List[str]:
+        result = collection.query(
+            query_embeddings=[query],
+            n_results=args.k,
+            where={"document_type": "cv"},
+        )
+        return list(result["ids"][0])
+
+    results["chroma"] = _measure(chroma_search, queries, truth)
+
+    for backend, stats in results.items():
+        print(
+            f"{backend:<11} p50={stats['p50_ms']:.2f}ms "
+            f"p95={stats['p95_ms']:.2f}ms recall@{args.k}="
+            f"{stats['recall']:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
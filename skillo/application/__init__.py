@@ -1,14 +1,26 @@
+from skillo.domain.services import CancellationToken
+
 from .use_cases import (
+    CompactDatabase,
+    DeleteDocument,
     ExportToCSV,
     GetDocumentList,
     GetDocumentStats,
+    GetStoredMatches,
     MatchCVToJobs,
     MatchJobToCVs,
+    MatchNewDocument,
+    MigrateCollectionLayout,
+    RebuildIndex,
+    ReindexDocument,
+    RescoreStoredMatches,
     ResetDatabase,
+    RunBatchMatching,
     UploadDocument,
 )
 
 __all__ = [
+    "CancellationToken",
     "GetDocumentList",
     "GetDocumentStats",
     "MatchCVToJobs",
@@ -16,4 +28,13 @@ __all__ = [
     "ResetDatabase",
     "UploadDocument",
     "ExportToCSV",
+    "CompactDatabase",
+    "RebuildIndex",
+    "MigrateCollectionLayout",
+    "DeleteDocument",
+    "ReindexDocument",
+    "RunBatchMatching",
+    "GetStoredMatches",
+    "MatchNewDocument",
+    "RescoreStoredMatches",
 ]
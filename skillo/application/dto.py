@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 from skillo.domain.enums import DocumentType
@@ -60,6 +60,48 @@ class MatchResultDto:
     explanation: str
     agent_scores: Dict[str, float]
     detailed_results: Dict[str, Any]
+    degraded: bool = False
+
+
+@dataclass
+class MatchStreamUpdateDto:
+    """Streamed matching progress DTO."""
+
+    completed: int
+    total: int
+    new_matches: List[MatchResultDto]
+    top_matches: List[MatchResultDto]
+
+
+@dataclass
+class BatchMatchSummaryDto:
+    """All-pairs matching run summary DTO."""
+
+    total_pairs: int
+    computed: int
+    reused: int
+    failed: int
+
+
+@dataclass
+class RescoredPairDto:
+    """Stored pair re-weighted under trial weights DTO."""
+
+    cv_name: str
+    job_title: str
+    weighted_final_score: float
+    stored_score: float
+    recommendation: str
+
+
+@dataclass
+class RescoreSummaryDto:
+    """Re-weighted match matrix summary DTO."""
+
+    total_pairs: int
+    changed_recommendations: int
+    recommendation_counts: Dict[str, int]
+    top_pairs: List[RescoredPairDto]
 
 
 @dataclass
@@ -83,6 +125,8 @@ class ConfigDto:
     min_match_score: float
     top_candidates_count: int
     agent_weights: Dict[str, float]
+    index_settings: Dict[str, Any] = field(default_factory=dict)
+    chroma_server: str = ""
 
 
 @dataclass
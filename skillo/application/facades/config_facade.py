@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from skillo.application.dto import (
     ConfigDto,
@@ -8,6 +8,7 @@ from skillo.application.protocols import (
     ConfigProtocol,
     ConfigServiceProtocol,
     LoggerServiceProtocol,
+    MetricsServiceProtocol,
 )
 
 
@@ -18,13 +19,16 @@ class ConfigFacade(ConfigProtocol):
         self,
         config_service: ConfigServiceProtocol,
         logger_service: LoggerServiceProtocol,
+        metrics_service: Optional[MetricsServiceProtocol] = None,
     ) -> None:
         """Initialize with services."""
         self._config = config_service
         self._logger = logger_service
+        self._metrics = metrics_service
 
     def get_config_values(self) -> ConfigDto:
         """Configuration values."""
+        host = self._config.CHROMA_HOST
         return ConfigDto(
             chroma_db_path=self._config.CHROMA_DB_PATH,
             collection_name=self._config.COLLECTION_NAME,
@@ -32,6 +36,13 @@ class ConfigFacade(ConfigProtocol):
             min_match_score=self._config.MIN_MATCH_SCORE,
             top_candidates_count=self._config.TOP_CANDIDATES_COUNT,
             agent_weights=self._config.AGENT_WEIGHTS,
+            index_settings={
+                "space": self._config.CHROMA_HNSW_SPACE,
+                "ef_construction": self._config.CHROMA_HNSW_EF_CONSTRUCTION,
+                "ef_search": self._config.CHROMA_HNSW_EF_SEARCH,
+                "M": self._config.CHROMA_HNSW_M,
+            },
+            chroma_server=f"{host}:{self._config.CHROMA_PORT}" if host else "",
         )
 
     def get_logs(self, last_n: Optional[int] = None) -> List[LogEntryDto]:
@@ -41,3 +52,7 @@ class ConfigFacade(ConfigProtocol):
     def clear_logs(self) -> None:
         """Clears logs."""
         self._logger.clear_logs()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Runtime counters."""
+        return self._metrics.snapshot() if self._metrics else {}
@@ -1,13 +1,16 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 from skillo.application.dto import DocumentDto, StatisticsDto
 from skillo.application.mappers.dto_mapper import DTOMapper
 from skillo.application.protocols import (
+    CompactServiceProtocol,
+    DocumentBatchServiceProtocol,
     DocumentProcessorProtocol,
     DocumentProtocol,
     ExportServiceProtocol,
     FileSystemProtocol,
     ListServiceProtocol,
+    RebuildIndexServiceProtocol,
     ResetServiceProtocol,
     StatsServiceProtocol,
     UploadServiceProtocol,
@@ -17,6 +20,7 @@ from skillo.application.use_cases.process_and_upload_documents import (
     ProcessUploadedDocuments,
 )
 from skillo.domain.enums import DocumentType
+from skillo.domain.services import CancellationToken
 
 
 class DocumentFacade(DocumentProtocol):
@@ -32,6 +36,10 @@ class DocumentFacade(DocumentProtocol):
         document_processor: DocumentProcessorProtocol,
         process_and_upload_service: ProcessUploadedDocuments,
         filesystem: FileSystemProtocol,
+        compact_service: CompactServiceProtocol,
+        rebuild_index_service: RebuildIndexServiceProtocol,
+        delete_service: DocumentBatchServiceProtocol,
+        reindex_service: DocumentBatchServiceProtocol,
     ) -> None:
         """Initialize with services."""
         self._upload = upload_service
@@ -42,6 +50,10 @@ class DocumentFacade(DocumentProtocol):
         self._processor = document_processor
         self._process_uploaded = process_and_upload_service
         self._filesystem = filesystem
+        self._compact = compact_service
+        self._rebuild_index = rebuild_index_service
+        self._delete = delete_service
+        self._reindex = reindex_service
 
     def upload_document(self, document_dto: DocumentDto) -> bool:
         """Uploads document."""
@@ -61,6 +73,22 @@ class DocumentFacade(DocumentProtocol):
         """Resets database."""
         return self._reset.execute()
 
+    def compact_database(self) -> int:
+        """Collapses duplicate document entries."""
+        return self._compact.execute()
+
+    def rebuild_index(self, target_collection_name: str) -> int:
+        """Rebuilds vector index into a new collection."""
+        return self._rebuild_index.execute(target_collection_name)
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """Deletes selected documents."""
+        return self._delete.execute_batch(document_ids)
+
+    def reindex_documents(self, document_ids: List[str]) -> int:
+        """Re-embeds selected documents."""
+        return self._reindex.execute_batch(document_ids)
+
     def export_to_csv(self) -> str:
         """CSV export."""
         return self._export.execute()
@@ -72,13 +100,14 @@ class DocumentFacade(DocumentProtocol):
 
     def process_uploaded_documents_parallel(
         self,
-        files: List[Any],
+        files: Iterable[Any],
         file_type: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> BatchProcessResult:
         """Process and upload multiple documents in parallel with progress tracking."""
         return self._process_uploaded.execute_with_progress(
-            files, file_type, progress_callback
+            files, file_type, progress_callback, cancellation_token
         )
 
     def get_file_path(
@@ -1,10 +1,20 @@
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
-from skillo.application.dto import DocumentDto, MatchResultDto
+from skillo.application.dto import (
+    BatchMatchSummaryDto,
+    DocumentDto,
+    MatchResultDto,
+    MatchStreamUpdateDto,
+    RescoreSummaryDto,
+)
 from skillo.application.protocols import (
+    BatchMatchingServiceProtocol,
     MatchingProtocol,
     MatchingServiceProtocol,
+    RescoreServiceProtocol,
+    StoredMatchesServiceProtocol,
 )
+from skillo.domain.services import CancellationToken
 
 
 class MatchingFacade(MatchingProtocol):
@@ -14,10 +24,16 @@ class MatchingFacade(MatchingProtocol):
         self,
         cv_to_jobs_service: MatchingServiceProtocol,
         job_to_cvs_service: MatchingServiceProtocol,
+        stored_matches_service: StoredMatchesServiceProtocol,
+        batch_matching_service: BatchMatchingServiceProtocol,
+        rescore_service: RescoreServiceProtocol,
     ) -> None:
         """Initialize with services."""
         self._cv_to_jobs = cv_to_jobs_service
         self._job_to_cvs = job_to_cvs_service
+        self._stored_matches = stored_matches_service
+        self._batch_matching = batch_matching_service
+        self._rescore = rescore_service
 
     def match_cv_to_jobs(
         self, cv_document_dto: DocumentDto
@@ -29,10 +45,11 @@ class MatchingFacade(MatchingProtocol):
         self,
         cv_document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResultDto]:
         """Job matches for CV with progress tracking."""
         return self._cv_to_jobs.execute_dto_with_progress(
-            cv_document_dto, progress_callback
+            cv_document_dto, progress_callback, cancellation_token
         )
 
     def match_job_to_cvs(
@@ -45,8 +62,58 @@ class MatchingFacade(MatchingProtocol):
         self,
         job_document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResultDto]:
         """CV matches for job with progress tracking."""
         return self._job_to_cvs.execute_dto_with_progress(
-            job_document_dto, progress_callback
+            job_document_dto, progress_callback, cancellation_token
+        )
+
+    def stream_cv_to_jobs(
+        self,
+        cv_document_dto: DocumentDto,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """Job matches for CV, re-ranked as analyses complete."""
+        return self._cv_to_jobs.execute_dto_stream(
+            cv_document_dto, cancellation_token
+        )
+
+    def stream_job_to_cvs(
+        self,
+        job_document_dto: DocumentDto,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """CV matches for job, re-ranked as analyses complete."""
+        return self._job_to_cvs.execute_dto_stream(
+            job_document_dto, cancellation_token
+        )
+
+    def get_stored_cv_matches(
+        self, cv_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Precomputed job matches for CV."""
+        return self._stored_matches.execute_dto_for_cv(cv_document_dto)
+
+    def get_stored_job_matches(
+        self, job_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Precomputed CV matches for job."""
+        return self._stored_matches.execute_dto_for_job(job_document_dto)
+
+    def run_batch_matching(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummaryDto:
+        """Stored matches for all or selected pairs."""
+        return self._batch_matching.execute_dto(
+            cv_ids, job_ids, progress_callback
         )
+
+    def rescore_stored_matches(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummaryDto:
+        """Stored matches re-weighted under trial agent weights."""
+        return self._rescore.execute_dto(agent_weights, top_count)
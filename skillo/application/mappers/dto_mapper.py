@@ -1,8 +1,13 @@
 from typing import List
 
-from skillo.application.dto import DocumentDto, MatchResultDto
+from skillo.application.dto import (
+    DocumentDto,
+    MatchResultDto,
+    MatchStreamUpdateDto,
+)
 from skillo.domain.entities import Document, MatchResult
 from skillo.domain.enums import DocumentType
+from skillo.domain.services import MatchStreamUpdate
 
 
 class DTOMapper:
@@ -61,6 +66,7 @@ class DTOMapper:
                 "education": match_result.agent_scores.education_score,
             },
             detailed_results=match_result.detailed_results or {},
+            degraded=match_result.degraded,
         )
 
     @staticmethod
@@ -76,3 +82,15 @@ class DTOMapper:
         return [
             DTOMapper.match_result_to_dto(result) for result in match_results
         ]
+
+    @staticmethod
+    def match_stream_update_to_dto(
+        update: MatchStreamUpdate,
+    ) -> MatchStreamUpdateDto:
+        """Convert streamed matching progress to DTO."""
+        return MatchStreamUpdateDto(
+            completed=update.completed,
+            total=update.total,
+            new_matches=DTOMapper.match_results_to_dtos(update.new_matches),
+            top_matches=DTOMapper.match_results_to_dtos(update.top_matches),
+        )
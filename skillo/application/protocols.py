@@ -1,17 +1,30 @@
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+)
 
 if TYPE_CHECKING:
     from skillo.domain.entities import Document
+    from skillo.domain.services import CancellationToken
     from skillo.application.use_cases.process_and_upload_documents import (
         BatchProcessResult,
     )
 
 from skillo.application.dto import (
+    BatchMatchSummaryDto,
     ConfigDto,
     DocumentDto,
     EventDto,
     LogEntryDto,
     MatchResultDto,
+    MatchStreamUpdateDto,
+    RescoreSummaryDto,
     StatisticsDto,
 )
 
@@ -37,6 +50,22 @@ class DocumentProtocol(Protocol):
         """Reset the database."""
         ...
 
+    def compact_database(self) -> int:
+        """Collapse duplicate document entries."""
+        ...
+
+    def rebuild_index(self, target_collection_name: str) -> int:
+        """Rebuild vector index into a new collection."""
+        ...
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """Delete selected documents."""
+        ...
+
+    def reindex_documents(self, document_ids: List[str]) -> int:
+        """Re-embed selected documents from stored content."""
+        ...
+
     def export_to_csv(self) -> str:
         """Export documents to CSV."""
         ...
@@ -59,9 +88,10 @@ class DocumentProtocol(Protocol):
 
     def process_uploaded_documents_parallel(
         self,
-        files: List[object],
+        files: Iterable[object],
         file_type: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional["CancellationToken"] = None,
     ) -> "BatchProcessResult":
         """Process and upload multiple documents in parallel with progress tracking."""
         ...
@@ -86,6 +116,7 @@ class MatchingProtocol(Protocol):
         self,
         cv_document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional["CancellationToken"] = None,
     ) -> List[MatchResultDto]:
         """Find job matches for CV with progress tracking."""
         ...
@@ -94,10 +125,54 @@ class MatchingProtocol(Protocol):
         self,
         job_document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional["CancellationToken"] = None,
     ) -> List[MatchResultDto]:
         """Find CV matches for job with progress tracking."""
         ...
 
+    def stream_cv_to_jobs(
+        self,
+        cv_document_dto: DocumentDto,
+        cancellation_token: Optional["CancellationToken"] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """Stream job matches for CV as analyses complete."""
+        ...
+
+    def stream_job_to_cvs(
+        self,
+        job_document_dto: DocumentDto,
+        cancellation_token: Optional["CancellationToken"] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """Stream CV matches for job as analyses complete."""
+        ...
+
+    def get_stored_cv_matches(
+        self, cv_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Get precomputed job matches for CV."""
+        ...
+
+    def get_stored_job_matches(
+        self, job_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Get precomputed CV matches for job."""
+        ...
+
+    def run_batch_matching(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummaryDto:
+        """Compute stored matches for all or selected pairs."""
+        ...
+
+    def rescore_stored_matches(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummaryDto:
+        """Re-weight stored matches without re-running agents."""
+        ...
+
 
 class ConfigProtocol(Protocol):
     """Configuration operations protocol."""
@@ -114,6 +189,10 @@ class ConfigProtocol(Protocol):
         """Clear logs."""
         ...
 
+    def get_metrics(self) -> Dict[str, float]:
+        """Get runtime counters."""
+        ...
+
 
 class ApplicationFacadeProtocol(Protocol):
     """Application facade protocol."""
@@ -169,6 +248,10 @@ class UploadServiceProtocol(Protocol):
         """Execute upload with Domain entity."""
         ...
 
+    def execute_batch(self, documents: List["Document"]) -> bool:
+        """Execute upload of several Domain entities in one upsert."""
+        ...
+
     def execute_with_dto(self, document_dto: DocumentDto) -> bool:
         """Execute upload with DTO."""
         ...
@@ -202,6 +285,30 @@ class ResetServiceProtocol(Protocol):
         ...
 
 
+class CompactServiceProtocol(Protocol):
+    """Compaction service protocol."""
+
+    def execute(self) -> int:
+        """Execute compaction."""
+        ...
+
+
+class RebuildIndexServiceProtocol(Protocol):
+    """Index rebuild service protocol."""
+
+    def execute(self, target_collection_name: str) -> int:
+        """Execute index rebuild."""
+        ...
+
+
+class DocumentBatchServiceProtocol(Protocol):
+    """Service acting on a selection of stored documents."""
+
+    def execute_batch(self, document_ids: List[str]) -> int:
+        """Execute for selected documents, return affected count."""
+        ...
+
+
 class ExportServiceProtocol(Protocol):
     """Export service protocol."""
 
@@ -229,17 +336,71 @@ class MatchingServiceProtocol(Protocol):
         self,
         document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional["CancellationToken"] = None,
     ) -> List[MatchResultDto]:
         """Execute matching with progress tracking."""
         ...
 
+    def execute_dto_stream(
+        self,
+        document_dto: DocumentDto,
+        cancellation_token: Optional["CancellationToken"] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """Stream matching updates."""
+        ...
+
+
+class StoredMatchesServiceProtocol(Protocol):
+    """Stored matches service protocol."""
+
+    def execute_dto_for_cv(
+        self, cv_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Get stored job matches for CV."""
+        ...
+
+    def execute_dto_for_job(
+        self, job_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Get stored CV matches for job."""
+        ...
+
+
+class BatchMatchingServiceProtocol(Protocol):
+    """All-pairs matching service protocol."""
+
+    def execute_dto(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummaryDto:
+        """Execute all-pairs matching."""
+        ...
+
+
+class RescoreServiceProtocol(Protocol):
+    """Stored match re-weighting service protocol."""
+
+    def execute_dto(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummaryDto:
+        """Execute re-weighting of stored matches."""
+        ...
+
 
 class ConfigServiceProtocol(Protocol):
     """Config service protocol."""
 
     CHROMA_DB_PATH: str
+    CHROMA_HOST: str
+    CHROMA_PORT: int
     COLLECTION_NAME: str
     EMBEDDING_MODEL: str
+    CHROMA_HNSW_SPACE: str
+    CHROMA_HNSW_EF_CONSTRUCTION: int
+    CHROMA_HNSW_EF_SEARCH: int
+    CHROMA_HNSW_M: int
     MIN_MATCH_SCORE: float
     TOP_CANDIDATES_COUNT: int
     AGENT_WEIGHTS: Dict[str, float]
@@ -257,6 +418,14 @@ class LoggerServiceProtocol(Protocol):
         ...
 
 
+class MetricsServiceProtocol(Protocol):
+    """Runtime counters protocol."""
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get counters."""
+        ...
+
+
 class FileSystemProtocol(Protocol):
     """File system operations protocol."""
 
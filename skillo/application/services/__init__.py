@@ -1,4 +1,5 @@
 from .application_event_handler import ApplicationEventHandler
 from .event_mapper import EventMapper
+from .incremental_match_handler import IncrementalMatchHandler
 
-__all__ = ["EventMapper", "ApplicationEventHandler"]
+__all__ = ["EventMapper", "ApplicationEventHandler", "IncrementalMatchHandler"]
@@ -0,0 +1,38 @@
+from typing import List
+
+from skillo.application.use_cases import MatchNewDocument
+from skillo.domain.events import DocumentUploadedEvent
+
+
+class IncrementalMatchHandler:
+    """Matches uploaded documents against their nearest counterparts.
+
+    Subscribed as a queued handler of the async event publisher, so the
+    matching runs on its dispatcher thread and a backlog of uploads
+    arrives as one batch in which each document is matched once.
+    """
+
+    def __init__(self, match_new_document: MatchNewDocument):
+        """Initialize with matching use case."""
+        self._match_new_document = match_new_document
+        self.processed_count = 0
+        self.failed_count = 0
+
+    def handle(self, event: DocumentUploadedEvent) -> None:
+        """Match one uploaded document."""
+        self.handle_batch([event])
+
+    def handle_batch(self, events: List[DocumentUploadedEvent]) -> None:
+        """Match each uploaded document of the batch once.
+
+        Failures of one document never stop the others.
+        """
+        document_ids = dict.fromkeys(
+            event.document_id for event in events if event.document_id
+        )
+        for document_id in document_ids:
+            try:
+                self._match_new_document.execute(document_id)
+                self.processed_count += 1
+            except Exception:
+                self.failed_count += 1
@@ -1,17 +1,35 @@
+from .compact_database import CompactDatabase
+from .delete_document import DeleteDocument
 from .export_to_csv import ExportToCSV
 from .get_document_list import GetDocumentList
 from .get_document_stats import GetDocumentStats
+from .get_stored_matches import GetStoredMatches
 from .match_cv_to_jobs import MatchCVToJobs
 from .match_job_to_cvs import MatchJobToCVs
+from .match_new_document import MatchNewDocument
+from .migrate_collection_layout import MigrateCollectionLayout
+from .rebuild_index import RebuildIndex
+from .reindex_document import ReindexDocument
+from .rescore_stored_matches import RescoreStoredMatches
 from .reset_database import ResetDatabase
+from .run_batch_matching import RunBatchMatching
 from .upload_document import UploadDocument
 
 __all__ = [
+    "CompactDatabase",
+    "DeleteDocument",
     "ExportToCSV",
     "GetDocumentList",
     "GetDocumentStats",
+    "GetStoredMatches",
     "MatchCVToJobs",
     "MatchJobToCVs",
+    "MatchNewDocument",
+    "MigrateCollectionLayout",
+    "RebuildIndex",
+    "ReindexDocument",
+    "RescoreStoredMatches",
     "ResetDatabase",
+    "RunBatchMatching",
     "UploadDocument",
 ]
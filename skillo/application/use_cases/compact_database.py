@@ -0,0 +1,37 @@
+from skillo.domain.events import DatabaseCompactedEvent, EventPublisher
+from skillo.domain.repositories import ManagementRepository
+
+
+class CompactDatabase:
+    """Collapse duplicate document entries."""
+
+    def __init__(
+        self,
+        management_repository: ManagementRepository,
+        event_publisher: EventPublisher,
+    ):
+        """Initialize with dependencies."""
+        self._management_repository = management_repository
+        self._event_publisher = event_publisher
+
+    def execute(self) -> int:
+        """Execute database compaction workflow."""
+        try:
+            removed_count = self._management_repository.compact_duplicates()
+
+            event = DatabaseCompactedEvent(
+                success=True, removed_count=removed_count
+            )
+            self._event_publisher.publish(event)
+
+            return removed_count
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Database compaction workflow failed: {str(e)}"
+            event = DatabaseCompactedEvent(
+                success=False, error_message=error_msg
+            )
+            self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
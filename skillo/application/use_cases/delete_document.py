@@ -0,0 +1,53 @@
+from typing import List, Optional
+
+from skillo.domain.events import DocumentsDeletedEvent, EventPublisher
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+
+
+class DeleteDocument:
+    """Delete selected documents from storage."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        event_publisher: EventPublisher,
+        match_repository: Optional[MatchRepository] = None,
+    ):
+        """Initialize with dependencies.
+
+        With a match repository, stored matches of deleted documents are
+        deleted too.
+        """
+        self._document_repository = document_repository
+        self._event_publisher = event_publisher
+        self._match_repository = match_repository
+
+    def execute(self, document_id: str) -> bool:
+        """Execute deletion workflow for one document."""
+        return self.execute_batch([document_id]) > 0
+
+    def execute_batch(self, document_ids: List[str]) -> int:
+        """Execute deletion workflow, return deleted document count."""
+        try:
+            deleted_count = self._document_repository.delete_documents(
+                document_ids
+            )
+            if self._match_repository:
+                self._match_repository.delete_matches_for(document_ids)
+
+            event = DocumentsDeletedEvent(
+                success=True, document_count=deleted_count
+            )
+            self._event_publisher.publish(event)
+
+            return deleted_count
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Document deletion workflow failed: {str(e)}"
+            event = DocumentsDeletedEvent(
+                success=False, error_message=error_msg
+            )
+            self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from skillo.application.dto import DocumentDto, MatchResultDto
+from skillo.application.mappers import DTOMapper
+from skillo.domain.entities import Document, MatchRecord, MatchResult
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+
+
+class GetStoredMatches:
+    """Read precomputed matches from the stored match matrix."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        match_repository: MatchRepository,
+        top_candidates_count: int,
+        min_match_score: float,
+        agent_weights: Optional[Dict[str, float]] = None,
+    ):
+        """Initialize with dependencies.
+
+        Stored matches are re-scored under agent_weights when given.
+        """
+        self._document_repository = document_repository
+        self._match_repository = match_repository
+        self._top_candidates_count = top_candidates_count
+        self._min_match_score = min_match_score
+        self._agent_weights = agent_weights
+
+    def execute_for_cv(self, cv_document: Document) -> List[MatchResult]:
+        """Stored job matches for a CV, best first."""
+        records = self._match_repository.get_matches_for_cv(cv_document.id)
+        jobs = self._load_counterparts([r.job_id for r in records])
+
+        return self._select(
+            (record, cv_document, jobs.get(record.job_id))
+            for record in records
+        )
+
+    def execute_for_job(self, job_document: Document) -> List[MatchResult]:
+        """Stored CV matches for a job, best first."""
+        records = self._match_repository.get_matches_for_job(job_document.id)
+        cvs = self._load_counterparts([r.cv_id for r in records])
+
+        return self._select(
+            (record, cvs.get(record.cv_id), job_document) for record in records
+        )
+
+    def execute_dto_for_cv(
+        self, cv_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Stored job matches for a CV as DTOs."""
+        cv_document = DTOMapper.dto_to_document(cv_document_dto)
+        return DTOMapper.match_results_to_dtos(
+            self.execute_for_cv(cv_document)
+        )
+
+    def execute_dto_for_job(
+        self, job_document_dto: DocumentDto
+    ) -> List[MatchResultDto]:
+        """Stored CV matches for a job as DTOs."""
+        job_document = DTOMapper.dto_to_document(job_document_dto)
+        return DTOMapper.match_results_to_dtos(
+            self.execute_for_job(job_document)
+        )
+
+    def _load_counterparts(
+        self, document_ids: List[str]
+    ) -> Dict[str, Document]:
+        """Current documents keyed by id."""
+        documents = self._document_repository.get_documents_by_ids(
+            document_ids
+        )
+        return {document.id: document for document in documents}
+
+    def _select(
+        self,
+        candidates: Iterable[
+            Tuple[MatchRecord, Optional[Document], Optional[Document]]
+        ],
+    ) -> List[MatchResult]:
+        """Fresh records above the score threshold, best first, capped."""
+        results: List[MatchResult] = []
+        for record, cv_document, job_document in candidates:
+            if cv_document is None or job_document is None:
+                continue
+            if not record.is_fresh_for(cv_document, job_document):
+                continue
+            result = record.to_match_result(
+                cv_document, job_document, self._agent_weights
+            )
+            if result.weighted_final_score >= self._min_match_score:
+                results.append(result)
+
+        results.sort(
+            key=lambda result: result.weighted_final_score, reverse=True
+        )
+        return results[: self._top_candidates_count]
@@ -1,6 +1,10 @@
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
-from skillo.application.dto import DocumentDto, MatchResultDto
+from skillo.application.dto import (
+    DocumentDto,
+    MatchResultDto,
+    MatchStreamUpdateDto,
+)
 from skillo.application.mappers import DTOMapper
 from skillo.domain.entities import Document, MatchResult
 from skillo.domain.events import (
@@ -9,12 +13,18 @@ from skillo.domain.events import (
     MatchingFailedEvent,
 )
 from skillo.domain.events.base import BaseEvent
-from skillo.domain.repositories import DocumentRepository
+from skillo.domain.repositories import DocumentRepository, MatchRepository
 from skillo.domain.services import (
+    CancellationToken,
     MatchingService,
+    MatchStreamUpdate,
     SupervisorAgentInterface,
 )
-from skillo.domain.services.interfaces import ParallelExecutionService
+from skillo.domain.services.interfaces import (
+    AnalysisCircuitBreaker,
+    ParallelExecutionService,
+    RateLimiter,
+)
 
 
 class MatchJobToCVs:
@@ -28,6 +38,11 @@ class MatchJobToCVs:
         top_candidates_count: int,
         min_match_score: float,
         event_publisher: EventPublisher,
+        match_repository: Optional[MatchRepository] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        match_batch_size: int = 1,
+        circuit_breaker: Optional[AnalysisCircuitBreaker] = None,
+        agent_weights: Optional[Dict[str, float]] = None,
     ):
         """Initialize with dependencies."""
         self._document_repository = document_repository
@@ -39,6 +54,11 @@ class MatchJobToCVs:
             parallel_executor=parallel_executor,
             top_candidates_count=top_candidates_count,
             min_match_score=min_match_score,
+            match_repository=match_repository,
+            rate_limiter=rate_limiter,
+            match_batch_size=match_batch_size,
+            circuit_breaker=circuit_breaker,
+            agent_weights=agent_weights,
         )
 
     def execute(self, job_document: Document) -> List[MatchResult]:
@@ -84,16 +104,22 @@ class MatchJobToCVs:
         self,
         job_document: Document,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResult]:
         """Execute job to CVs matching with progress tracking."""
         try:
             matches = (
                 self._matching_service.match_job_to_all_cvs_with_progress(
-                    job_document, progress_callback
+                    job_document, progress_callback, cancellation_token
                 )
             )
 
-            if matches:
+            if cancellation_token and cancellation_token.cancelled:
+                event = MatchingCompletedEvent(
+                    message=f"Matching cancelled with {len(matches)} CV matches",
+                    context="Job to CVs Matching",
+                )
+            elif matches:
                 event = MatchingCompletedEvent(
                     message=f"Found {len(matches)} CV matches",
                     context="Job to CVs Matching",
@@ -123,10 +149,64 @@ class MatchJobToCVs:
         self,
         job_document_dto: DocumentDto,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResultDto]:
         """Execute job to CVs matching with DTO and progress tracking."""
         domain_document = DTOMapper.dto_to_document(job_document_dto)
         match_results = self.execute_with_progress(
-            domain_document, progress_callback
+            domain_document, progress_callback, cancellation_token
         )
         return DTOMapper.match_results_to_dtos(match_results)
+
+    def execute_stream(
+        self,
+        job_document: Document,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdate]:
+        """Stream CV matches with the running top-k as analyses complete."""
+        try:
+            top_matches: List[MatchResult] = []
+            for update in self._matching_service.stream_job_to_all_cvs(
+                job_document, cancellation_token
+            ):
+                top_matches = update.top_matches
+                yield update
+
+            if cancellation_token and cancellation_token.cancelled:
+                event = MatchingCompletedEvent(
+                    message=f"Matching cancelled with {len(top_matches)} CV matches",
+                    context="Job to CVs Matching",
+                )
+            elif top_matches:
+                event = MatchingCompletedEvent(
+                    message=f"Found {len(top_matches)} CV matches",
+                    context="Job to CVs Matching",
+                )
+            else:
+                event = MatchingCompletedEvent(
+                    message="No CV matches found",
+                    context="Job to CVs Matching",
+                )
+
+            self._event_publisher.publish(event)
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloMatchingError
+
+            error_msg = f"Job matching workflow failed: {str(e)}"
+            error_event: BaseEvent = MatchingFailedEvent(
+                error_message=error_msg,
+                context="Job to CVs Matching",
+            )
+            self._event_publisher.publish(error_event)
+            raise SkilloMatchingError(error_msg)
+
+    def execute_dto_stream(
+        self,
+        job_document_dto: DocumentDto,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdateDto]:
+        """Stream CV matches with DTOs."""
+        domain_document = DTOMapper.dto_to_document(job_document_dto)
+        for update in self.execute_stream(domain_document, cancellation_token):
+            yield DTOMapper.match_stream_update_to_dto(update)
@@ -0,0 +1,59 @@
+from typing import List, Optional
+
+from skillo.domain.entities import MatchResult
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+from skillo.domain.services import MatchingService, SupervisorAgentInterface
+from skillo.domain.services.interfaces import (
+    AnalysisCircuitBreaker,
+    ParallelExecutionService,
+    RateLimiter,
+)
+
+
+class MatchNewDocument:
+    """Merge matches of a new document with its nearest counterparts."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        match_repository: MatchRepository,
+        supervisor_agent: SupervisorAgentInterface,
+        parallel_executor: ParallelExecutionService,
+        rate_limiter: RateLimiter,
+        neighbour_count: int,
+        match_batch_size: int = 1,
+        circuit_breaker: Optional[AnalysisCircuitBreaker] = None,
+    ):
+        """Initialize with dependencies."""
+        self._document_repository = document_repository
+        self._neighbour_count = neighbour_count
+
+        self._matching_service = MatchingService(
+            document_repository=document_repository,
+            supervisor_agent=supervisor_agent,
+            parallel_executor=parallel_executor,
+            match_repository=match_repository,
+            rate_limiter=rate_limiter,
+            match_batch_size=match_batch_size,
+            circuit_breaker=circuit_breaker,
+        )
+
+    def execute(self, document_id: str) -> List[MatchResult]:
+        """Execute neighbour matching; results land in the match store."""
+        try:
+            documents = self._document_repository.get_documents_by_ids(
+                [document_id]
+            )
+            if not documents:
+                return []
+
+            return self._matching_service.refresh_neighbour_matches(
+                documents[0], self._neighbour_count
+            )
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloMatchingError
+
+            raise SkilloMatchingError(
+                f"Incremental matching failed for '{document_id}': {str(e)}"
+            )
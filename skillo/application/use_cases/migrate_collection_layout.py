@@ -0,0 +1,47 @@
+from typing import Optional
+
+from skillo.domain.events import CollectionLayoutMigratedEvent, EventPublisher
+from skillo.domain.repositories import ManagementRepository
+
+
+class MigrateCollectionLayout:
+    """Move stored vectors into another collection layout."""
+
+    def __init__(
+        self,
+        management_repository: ManagementRepository,
+        event_publisher: EventPublisher,
+    ):
+        """Initialize with dependencies."""
+        self._management_repository = management_repository
+        self._event_publisher = event_publisher
+
+    def execute(
+        self, target_layout: str, target_collection_name: Optional[str] = None
+    ) -> int:
+        """Execute collection layout migration workflow."""
+        try:
+            document_count = self._management_repository.migrate_layout(
+                target_layout, target_collection_name
+            )
+
+            event = CollectionLayoutMigratedEvent(
+                success=True,
+                layout=target_layout,
+                document_count=document_count,
+            )
+            self._event_publisher.publish(event)
+
+            return document_count
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Layout migration workflow failed: {str(e)}"
+            event = CollectionLayoutMigratedEvent(
+                success=False,
+                layout=target_layout,
+                error_message=error_msg,
+            )
+            self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
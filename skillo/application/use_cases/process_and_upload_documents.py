@@ -1,20 +1,46 @@
-from typing import Any, Callable, Dict, List, Optional
+from collections import Counter, deque
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+)
 
 from skillo.application.protocols import (
     DocumentProcessorProtocol,
     UploadServiceProtocol,
 )
+from skillo.domain.entities import Document
 from skillo.domain.events import EventPublisher
+from skillo.domain.services import CancellationToken
 from skillo.domain.services.interfaces import ParallelExecutionService
 
 
 class BatchProcessResult:
-    """Result of batch document processing and upload operation."""
+    """Result of batch document processing and upload operation.
+
+    Counts cover every file; per-file results keep only the most recent
+    MAX_RESULTS entries.
+    """
+
+    MAX_RESULTS = 500
 
     def __init__(self) -> None:
         self.successful_uploads = 0
         self.failed_uploads = 0
-        self.results: List[Dict[str, Any]] = []
+        self.results: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_RESULTS)
+
+    @property
+    def omitted_results(self) -> int:
+        """Per-file results dropped to keep the list bounded."""
+        total = self.successful_uploads + self.failed_uploads
+        return total - len(self.results)
 
     def add_success(self, filename: str) -> None:
         """Add successful processing result."""
@@ -40,53 +66,125 @@ class ProcessUploadedDocuments:
         upload_service: UploadServiceProtocol,
         parallel_executor: ParallelExecutionService,
         event_publisher: EventPublisher,
+        max_in_flight: int = 0,
+        upload_batch_size: int = 1,
     ):
-        """Initialize with Clean Architecture dependencies."""
+        """Initialize with Clean Architecture dependencies.
+
+        A positive max_in_flight bounds how many files are being processed
+        at once; 0 submits the whole batch up front. Extracted documents
+        are upserted upload_batch_size at a time.
+        """
         self._document_processor = document_processor
         self._upload_service = upload_service
         self._parallel_executor = parallel_executor
         self._event_publisher = event_publisher
+        self._max_in_flight = max_in_flight
+        self._upload_batch_size = max(1, upload_batch_size)
 
     def execute_with_progress(
         self,
-        files: List[Any],
+        files: Iterable[Any],
         file_type: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> BatchProcessResult:
-        """Execute complete parallel processing and upload workflow."""
-        if not files:
-            return BatchProcessResult()
+        """Execute complete parallel processing and upload workflow.
+
+        Files are taken from the iterable and extracted in parallel as
+        earlier ones finish, and each file is closed and dropped once
+        extracted, so only the in-flight window of files is held here;
+        pass an iterator to keep the caller from holding the rest.
+        Extracted documents are uploaded in batches, one embedding
+        request per batch. Files not yet finished when the token is
+        cancelled are reported as cancelled failures. Progress totals
+        are the length of sized inputs, else the files completed so far.
+        """
+        batch_result = BatchProcessResult()
+        total = len(files) if isinstance(files, Sized) else 0
+        remaining = iter(files)
+        submitted: Counter[str] = Counter()
+        finished: Counter[str] = Counter()
+        extracted: List[Tuple[str, Document]] = []
+        tasks = map(
+            partial(self._extraction_task, file_type, submitted), remaining
+        )
+        results = self._parallel_executor.iter_task_results(
+            tasks, cancellation_token, max_in_flight=self._max_in_flight
+        )
 
-        tasks = [
-            lambda f=file: self._process_uploaded_single_file(f, file_type)
-            for file in files
-        ]
+        for completed_count, result in enumerate(results, 1):
+            if progress_callback:
+                progress_callback(completed_count, max(total, completed_count))
+            if result is None:
+                continue
+            if result.get("document"):
+                extracted.append((result["filename"], result["document"]))
+                if len(extracted) >= self._upload_batch_size:
+                    self._upload_extracted(extracted, batch_result, finished)
+                    extracted = []
+                continue
+            finished[result.get("filename")] += 1
+            batch_result.add_failure(
+                result.get("filename", "Unknown"),
+                result.get("error", "Unknown error"),
+            )
 
-        results = self._parallel_executor.execute_tasks_with_progress(
-            tasks, progress_callback
-        )
+        if extracted:
+            self._upload_extracted(extracted, batch_result, finished)
 
-        batch_result = BatchProcessResult()
-        for result in results:
-            if result and result.get("success"):
-                batch_result.add_success(result["filename"])
-            else:
-                error_msg = (
-                    result.get("error", "Unknown error")
-                    if result
-                    else "Task failed"
-                )
-                filename = (
-                    result.get("filename", "Unknown") if result else "Unknown"
-                )
-                batch_result.add_failure(filename, error_msg)
+        if cancellation_token and cancellation_token.cancelled:
+            unfinished = (submitted - finished) + Counter(
+                getattr(file, "name", "Unknown") for file in remaining
+            )
+            for filename in unfinished.elements():
+                batch_result.add_failure(filename, "Cancelled")
 
         return batch_result
 
+    def _extraction_task(
+        self, file_type: str, submitted: Counter[str], file: Any
+    ) -> Callable[[], Dict[str, Any]]:
+        """Task extracting one file, recording its name as submitted.
+
+        The file is handed over in a one-item list the task empties, so
+        it is not referenced once extracted.
+        """
+        submitted[getattr(file, "name", "Unknown")] += 1
+        return partial(self._process_uploaded_single_file, [file], file_type)
+
+    def _upload_extracted(
+        self,
+        extracted: List[Tuple[str, Document]],
+        batch_result: BatchProcessResult,
+        finished: Counter[str],
+    ) -> None:
+        """Upsert extracted documents in one batch and record outcomes."""
+        error = "Database upload failed"
+        try:
+            success = self._upload_service.execute_batch(
+                [document for _, document in extracted]
+            )
+        except Exception as e:
+            success = False
+            error = f"Upload error: {str(e)}"
+
+        for filename, _ in extracted:
+            finished[filename] += 1
+            if success:
+                batch_result.add_success(filename)
+            else:
+                batch_result.add_failure(filename, error)
+
     def _process_uploaded_single_file(
-        self, file: Any, file_type: str
+        self, holder: List[Any], file_type: str
     ) -> Dict[str, Any]:
-        """Process and upload single file - designed for parallel execution."""
+        """Extract single file - designed for parallel execution.
+
+        The file is taken out of the holder and closed afterwards, which
+        releases an in-memory upload's buffer.
+        """
+        file = holder.pop()
         filename = getattr(file, "name", "Unknown")
 
         try:
@@ -101,16 +199,7 @@ class ProcessUploadedDocuments:
                     "error": "Document processing failed",
                 }
 
-            success = self._upload_service.execute(domain_document)
-
-            if success:
-                return {"filename": filename, "success": True, "error": None}
-            else:
-                return {
-                    "filename": filename,
-                    "success": False,
-                    "error": "Database upload failed",
-                }
+            return {"filename": filename, "document": domain_document}
 
         except Exception as e:
             return {
@@ -118,3 +207,7 @@ class ProcessUploadedDocuments:
                 "success": False,
                 "error": f"Processing error: {str(e)}",
             }
+        finally:
+            close = getattr(file, "close", None)
+            if callable(close):
+                close()
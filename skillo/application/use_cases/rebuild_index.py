@@ -0,0 +1,43 @@
+from skillo.domain.events import EventPublisher, IndexRebuiltEvent
+from skillo.domain.repositories import ManagementRepository
+
+
+class RebuildIndex:
+    """Rebuild vector index into a new collection."""
+
+    def __init__(
+        self,
+        management_repository: ManagementRepository,
+        event_publisher: EventPublisher,
+    ):
+        """Initialize with dependencies."""
+        self._management_repository = management_repository
+        self._event_publisher = event_publisher
+
+    def execute(self, target_collection_name: str) -> int:
+        """Execute index rebuild workflow."""
+        try:
+            document_count = self._management_repository.rebuild_index(
+                target_collection_name
+            )
+
+            event = IndexRebuiltEvent(
+                success=True,
+                collection_name=target_collection_name,
+                document_count=document_count,
+            )
+            self._event_publisher.publish(event)
+
+            return document_count
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Index rebuild workflow failed: {str(e)}"
+            event = IndexRebuiltEvent(
+                success=False,
+                collection_name=target_collection_name,
+                error_message=error_msg,
+            )
+            self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
@@ -0,0 +1,47 @@
+from typing import List
+
+from skillo.domain.events import DocumentsReindexedEvent, EventPublisher
+from skillo.domain.repositories import DocumentRepository
+
+
+class ReindexDocument:
+    """Re-embed stored documents without parsing them again."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        event_publisher: EventPublisher,
+    ):
+        """Initialize with dependencies."""
+        self._document_repository = document_repository
+        self._event_publisher = event_publisher
+
+    def execute(self, document_id: str) -> bool:
+        """Execute reindex workflow for one document."""
+        return self.execute_batch([document_id]) > 0
+
+    def execute_batch(self, document_ids: List[str]) -> int:
+        """Execute reindex workflow, return re-embedded document count."""
+        try:
+            documents = self._document_repository.get_documents_by_ids(
+                document_ids
+            )
+            if documents:
+                self._document_repository.add_documents(documents)
+
+            event = DocumentsReindexedEvent(
+                success=True, document_count=len(documents)
+            )
+            self._event_publisher.publish(event)
+
+            return len(documents)
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Document reindex workflow failed: {str(e)}"
+            event = DocumentsReindexedEvent(
+                success=False, error_message=error_msg
+            )
+            self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
@@ -0,0 +1,66 @@
+from typing import Dict
+
+from skillo.application.dto import RescoredPairDto, RescoreSummaryDto
+from skillo.domain.repositories import DocumentRepository
+from skillo.domain.services import MatchRescoringService, RescoreSummary
+
+
+class RescoreStoredMatches:
+    """Re-weight stored agent sub-scores without re-running the agents."""
+
+    def __init__(
+        self,
+        match_rescorer: MatchRescoringService,
+        document_repository: DocumentRepository,
+    ):
+        """Initialize with dependencies."""
+        self._match_rescorer = match_rescorer
+        self._document_repository = document_repository
+
+    def execute(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummary:
+        """Execute re-weighting of the stored match matrix."""
+        try:
+            return self._match_rescorer.rescore(agent_weights, top_count)
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloMatchingError
+
+            raise SkilloMatchingError(f"Match re-weighting failed: {str(e)}")
+
+    def execute_dto(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummaryDto:
+        """Execute re-weighting and return summary DTO with names."""
+        summary = self.execute(agent_weights, top_count)
+
+        documents = {
+            document.id: document
+            for document in self._document_repository.get_documents_by_ids(
+                [pair.cv_id for pair in summary.top_pairs]
+                + [pair.job_id for pair in summary.top_pairs]
+            )
+        }
+
+        def metadata(document_id: str) -> Dict[str, str]:
+            document = documents.get(document_id)
+            return document.metadata if document else {}
+
+        return RescoreSummaryDto(
+            total_pairs=summary.total_pairs,
+            changed_recommendations=summary.changed_recommendations,
+            recommendation_counts=summary.recommendation_counts,
+            top_pairs=[
+                RescoredPairDto(
+                    cv_name=metadata(pair.cv_id).get("name", pair.cv_id),
+                    job_title=metadata(pair.job_id).get(
+                        "job_title", pair.job_id
+                    ),
+                    weighted_final_score=pair.weighted_final_score,
+                    stored_score=pair.stored_score,
+                    recommendation=pair.recommendation,
+                )
+                for pair in summary.top_pairs
+            ],
+        )
@@ -1,5 +1,7 @@
+from typing import Optional
+
 from skillo.domain.events import DatabaseResetEvent, EventPublisher
-from skillo.domain.repositories import ManagementRepository
+from skillo.domain.repositories import ManagementRepository, MatchRepository
 
 
 class ResetDatabase:
@@ -9,15 +11,22 @@ class ResetDatabase:
         self,
         management_repository: ManagementRepository,
         event_publisher: EventPublisher,
+        match_repository: Optional[MatchRepository] = None,
     ):
-        """Initialize with dependencies."""
+        """Initialize with dependencies.
+
+        With a match repository, stored matches are cleared as well.
+        """
         self._management_repository = management_repository
         self._event_publisher = event_publisher
+        self._match_repository = match_repository
 
     def execute(self) -> bool:
         """Execute database reset workflow."""
         try:
             success = self._management_repository.reset_database()
+            if success and self._match_repository:
+                self._match_repository.delete_all_matches()
 
             event = DatabaseResetEvent(
                 success=success,
@@ -0,0 +1,105 @@
+from typing import Callable, List, Optional
+
+from skillo.application.dto import BatchMatchSummaryDto
+from skillo.domain.events import (
+    EventPublisher,
+    MatchingCompletedEvent,
+    MatchingFailedEvent,
+)
+from skillo.domain.events.base import BaseEvent
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+from skillo.domain.services import (
+    BatchMatchingService,
+    BatchMatchSummary,
+    MatchingService,
+    SupervisorAgentInterface,
+)
+from skillo.domain.services.interfaces import (
+    AnalysisCircuitBreaker,
+    ParallelExecutionService,
+    RateLimiter,
+)
+
+
+class RunBatchMatching:
+    """Compute the stored match matrix for all or selected pairs."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        match_repository: MatchRepository,
+        supervisor_agent: SupervisorAgentInterface,
+        parallel_executor: ParallelExecutionService,
+        rate_limiter: RateLimiter,
+        chunk_size: int,
+        event_publisher: EventPublisher,
+        match_batch_size: int = 1,
+        circuit_breaker: Optional[AnalysisCircuitBreaker] = None,
+    ):
+        """Initialize with dependencies."""
+        self._event_publisher = event_publisher
+
+        self._batch_service = BatchMatchingService(
+            matching_service=MatchingService(
+                document_repository=document_repository,
+                supervisor_agent=supervisor_agent,
+                parallel_executor=parallel_executor,
+                match_repository=match_repository,
+                rate_limiter=rate_limiter,
+                match_batch_size=match_batch_size,
+                circuit_breaker=circuit_breaker,
+            ),
+            document_repository=document_repository,
+            match_repository=match_repository,
+            parallel_executor=parallel_executor,
+            chunk_size=chunk_size,
+        )
+
+    def execute(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummary:
+        """Execute all-pairs matching workflow."""
+        try:
+            summary = self._batch_service.run(
+                cv_ids, job_ids, progress_callback
+            )
+
+            event: BaseEvent = MatchingCompletedEvent(
+                message=(
+                    f"Matched {summary.computed} pairs, reused "
+                    f"{summary.reused}, failed {summary.failed}"
+                ),
+                context="Batch Matching",
+            )
+            self._event_publisher.publish(event)
+
+            return summary
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloMatchingError
+
+            error_msg = f"Batch matching workflow failed: {str(e)}"
+            error_event: BaseEvent = MatchingFailedEvent(
+                error_message=error_msg,
+                context="Batch Matching",
+            )
+            self._event_publisher.publish(error_event)
+            raise SkilloMatchingError(error_msg)
+
+    def execute_dto(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummaryDto:
+        """Execute all-pairs matching and return summary DTO."""
+        summary = self.execute(cv_ids, job_ids, progress_callback)
+        return BatchMatchSummaryDto(
+            total_pairs=summary.total_pairs,
+            computed=summary.computed,
+            reused=summary.reused,
+            failed=summary.failed,
+        )
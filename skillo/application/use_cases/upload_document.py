@@ -1,3 +1,5 @@
+from typing import List
+
 from skillo.application.dto import DocumentDto
 from skillo.application.mappers import DTOMapper
 from skillo.domain.entities import Document
@@ -33,6 +35,7 @@ class UploadDocument:
                 event = DocumentUploadedEvent(
                     filename=document.metadata.get("filename", "Unknown"),
                     document_type=document_type,
+                    document_id=document.id,
                 )
             else:
                 event = DocumentUploadFailedEvent(
@@ -57,6 +60,43 @@ class UploadDocument:
             self._event_publisher.publish(event)
             raise SkilloRepositoryError(error_msg)
 
+    def execute_batch(self, documents: List[Document]) -> bool:
+        """Execute upload workflow for a batch of documents."""
+        try:
+            success = self._document_repository.add_documents(documents)
+
+            for document in documents:
+                document_type = document.document_type.value.upper()
+                event: BaseEvent
+                if success:
+                    event = DocumentUploadedEvent(
+                        filename=document.metadata.get("filename", "Unknown"),
+                        document_type=document_type,
+                        document_id=document.id,
+                    )
+                else:
+                    event = DocumentUploadFailedEvent(
+                        filename=document.metadata.get("filename", "Unknown"),
+                        document_type=document_type,
+                        error_message="Failed to add document to repository",
+                    )
+                self._event_publisher.publish(event)
+
+            return success
+
+        except Exception as e:
+            from skillo.domain.exceptions import SkilloRepositoryError
+
+            error_msg = f"Batch upload workflow failed: {str(e)}"
+            for document in documents:
+                event = DocumentUploadFailedEvent(
+                    filename=document.metadata.get("filename", "Unknown"),
+                    document_type=document.document_type.value.upper(),
+                    error_message=error_msg,
+                )
+                self._event_publisher.publish(event)
+            raise SkilloRepositoryError(error_msg)
+
     def execute_with_dto(self, document_dto: DocumentDto) -> bool:
         """Execute document upload with DTO input."""
         domain_document = DTOMapper.dto_to_document(document_dto)
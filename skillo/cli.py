@@ -0,0 +1,122 @@
+import argparse
+from typing import Any, List, Optional
+
+from skillo.domain.events import DomainEventPublisher
+from skillo.domain.services import DocumentBuilder
+from skillo.infrastructure.tools.geocoding import Gazetteer
+from skillo.main import create_container
+
+
+def _build_container() -> Any:
+    """Container for maintenance commands outside Streamlit."""
+    return create_container(
+        domain_event_publisher=DomainEventPublisher(),
+        document_builder=DocumentBuilder(),
+    )
+
+
+def _compact(container: Any, args: argparse.Namespace) -> None:
+    """Collapse duplicate vectors."""
+    removed_count = container.compact_database().execute()
+    print(f"Removed {removed_count} duplicate entries")
+
+
+def _rebuild_index(container: Any, args: argparse.Namespace) -> None:
+    """Rebuild the vector index into a new collection."""
+    document_count = container.rebuild_index().execute(args.target)
+    print(f"Rebuilt {document_count} entries into collection '{args.target}'")
+
+
+def _migrate_layout(container: Any, args: argparse.Namespace) -> None:
+    """Copy stored vectors into another collection layout."""
+    document_count = container.migrate_collection_layout().execute(
+        args.layout, args.target
+    )
+    print(f"Migrated {document_count} entries to '{args.layout}' layout")
+
+
+def _match_all(container: Any, args: argparse.Namespace) -> None:
+    """Compute the stored match matrix."""
+
+    def progress(completed: int, total: int) -> None:
+        print(f"Matched {completed}/{total} pairs", flush=True)
+
+    summary = container.run_batch_matching().execute(
+        args.cv_ids, args.job_ids, progress
+    )
+    print(
+        f"Computed {summary.computed}, reused {summary.reused}, "
+        f"failed {summary.failed} of {summary.total_pairs} pairs"
+    )
+
+
+def _build_gazetteer(container: Any, args: argparse.Namespace) -> None:
+    """Convert a city CSV into the memory-mapped gazetteer."""
+    output = args.output or container.config().GAZETTEER_PATH
+    entry_count = Gazetteer.build_from_csv(args.source, output)
+    print(f"Wrote {entry_count} gazetteer entries to '{output}'")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Maintenance command entry point."""
+    parser = argparse.ArgumentParser(
+        prog="skillo-admin", description="Skillo maintenance commands"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact_parser = subparsers.add_parser(
+        "compact", help="Collapse duplicate document entries"
+    )
+    compact_parser.set_defaults(handler=_compact)
+
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-index",
+        help="Rebuild the vector index with the current HNSW settings",
+    )
+    rebuild_parser.add_argument(
+        "--target", required=True, help="Name of the new collection"
+    )
+    rebuild_parser.set_defaults(handler=_rebuild_index)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate-layout",
+        help="Copy vectors into a shared or per-type collection layout",
+    )
+    migrate_parser.add_argument(
+        "--layout", required=True, choices=["shared", "partitioned"]
+    )
+    migrate_parser.add_argument(
+        "--target", help="Base collection name (defaults to the current one)"
+    )
+    migrate_parser.set_defaults(handler=_migrate_layout)
+
+    match_parser = subparsers.add_parser(
+        "match-all", help="Match every CV against every job and store results"
+    )
+    match_parser.add_argument(
+        "--cv-ids", nargs="+", help="Limit the run to these CV ids"
+    )
+    match_parser.add_argument(
+        "--job-ids", nargs="+", help="Limit the run to these job ids"
+    )
+    match_parser.set_defaults(handler=_match_all)
+
+    gazetteer_parser = subparsers.add_parser(
+        "build-gazetteer",
+        help="Build the offline city gazetteer used for distance lookups",
+    )
+    gazetteer_parser.add_argument(
+        "source",
+        help="CSV with name, country, latitude, longitude[, population]",
+    )
+    gazetteer_parser.add_argument(
+        "--output", help="Gazetteer file (defaults to GAZETTEER_PATH)"
+    )
+    gazetteer_parser.set_defaults(handler=_build_gazetteer)
+
+    args = parser.parse_args(argv)
+    args.handler(_build_container(), args)
+
+
+if __name__ == "__main__":
+    main()
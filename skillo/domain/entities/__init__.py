@@ -1,9 +1,13 @@
 from .agent_scores import AgentScores
+from .analysis_profile import AnalysisProfile
 from .document import Document
+from .match_record import MatchRecord
 from .match_result import MatchResult
 
 __all__ = [
     "Document",
     "AgentScores",
+    "AnalysisProfile",
     "MatchResult",
+    "MatchRecord",
 ]
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Dict
 
 
 @dataclass
@@ -11,3 +12,13 @@ class AgentScores:
     preferences_score: float
     education_score: float
     explanation: str = ""
+
+    def weighted_score(self, agent_weights: Dict[str, float]) -> float:
+        """Final score under ``<agent>_weight`` agent weights."""
+        return (
+            self.skills_score * agent_weights["skills_weight"]
+            + self.location_score * agent_weights["location_weight"]
+            + self.experience_score * agent_weights["experience_weight"]
+            + self.preferences_score * agent_weights["preferences_weight"]
+            + self.education_score * agent_weights["education_weight"]
+        )
@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+NOT_SPECIFIED = "Not specified"
+
+
+@dataclass
+class AnalysisProfile:
+    """Compact per-document facts compared by the matching agents."""
+
+    skills: List[str] = field(default_factory=list)
+    total_years: str = NOT_SPECIFIED
+    employment_spans: List[str] = field(default_factory=list)
+    level: str = NOT_SPECIFIED
+    degree: str = NOT_SPECIFIED
+    field_of_study: str = NOT_SPECIFIED
+    certifications: List[str] = field(default_factory=list)
+    location: str = NOT_SPECIFIED
+    remote_preference: str = NOT_SPECIFIED
+    preferences: List[str] = field(default_factory=list)
+
+    METADATA_PREFIX = "analysis_"
+
+    LABELS = {
+        "skills": "Skills",
+        "total_years": "Years of Experience",
+        "employment_spans": "Employment Periods",
+        "level": "Level",
+        "degree": "Degree",
+        "field_of_study": "Field of Study",
+        "certifications": "Certifications",
+        "location": "Location",
+        "remote_preference": "Remote Work",
+        "preferences": "Preferences",
+    }
+
+    def to_metadata(self) -> Dict[str, str]:
+        """Flatten into scalar metadata entries stored next to the document."""
+        return {
+            f"{self.METADATA_PREFIX}{name}": (
+                "; ".join(value) if isinstance(value, list) else value
+            )
+            for name, value in self._values().items()
+        }
+
+    @classmethod
+    def from_metadata(
+        cls, metadata: Dict[str, Any]
+    ) -> Optional["AnalysisProfile"]:
+        """Rebuild profile from metadata, None for documents without one.
+
+        Fields added after a document was stored keep their defaults.
+        """
+        if not any(key.startswith(cls.METADATA_PREFIX) for key in metadata):
+            return None
+
+        values: Dict[str, Any] = {}
+        for profile_field in fields(cls):
+            key = f"{cls.METADATA_PREFIX}{profile_field.name}"
+            if key not in metadata:
+                continue
+
+            raw = str(metadata[key])
+            if profile_field.type == List[str]:
+                values[profile_field.name] = [
+                    item.strip() for item in raw.split(";") if item.strip()
+                ]
+            else:
+                values[profile_field.name] = raw
+
+        return cls(**values)
+
+    def to_prompt_text(self, *field_names: str) -> str:
+        """Render selected fields (all by default) as labelled lines."""
+        values = self._values()
+        selected = field_names or tuple(values)
+        lines = []
+        for name in selected:
+            value = values[name]
+            if isinstance(value, list):
+                value = ", ".join(value) if value else NOT_SPECIFIED
+            lines.append(f"{self.LABELS[name]}: {value}")
+        return "\n".join(lines)
+
+    def _values(self) -> Dict[str, Any]:
+        """Field values keyed by name."""
+        return {
+            profile_field.name: getattr(self, profile_field.name)
+            for profile_field in fields(self)
+        }
@@ -0,0 +1,108 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from skillo.domain.entities.agent_scores import AgentScores
+from skillo.domain.entities.analysis_profile import AnalysisProfile
+from skillo.domain.entities.document import Document
+from skillo.domain.entities.match_result import MatchResult
+from skillo.domain.enums import MatchRecommendation
+
+
+@dataclass
+class MatchRecord:
+    """Stored CV-Job match keyed by document ids."""
+
+    cv_id: str
+    job_id: str
+    fingerprint: str
+    weighted_final_score: float
+    recommendation: MatchRecommendation
+    explanation: str
+    agent_scores: AgentScores
+    detailed_results: Dict[str, Any] = field(default_factory=dict)
+
+    @staticmethod
+    def fingerprint_for(cv_document: Document, job_document: Document) -> str:
+        """Fingerprint of the pair contents a stored match was computed on.
+
+        Covers ids, contents and the analysis profile metadata the agents
+        compare; documents without a profile hash ids and contents only.
+        """
+        digest = hashlib.sha256()
+        for document in (cv_document, job_document):
+            for part in (document.id, document.content):
+                digest.update(part.encode("utf-8"))
+                digest.update(b"\0")
+            for key, value in sorted(document.metadata.items()):
+                if key.startswith(AnalysisProfile.METADATA_PREFIX):
+                    digest.update(f"{key}={value}".encode("utf-8"))
+                    digest.update(b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def from_match_result(cls, match_result: MatchResult) -> "MatchRecord":
+        """Create record from a computed match."""
+        cv_document = match_result.cv_document
+        job_document = match_result.job_document
+        if cv_document is None or job_document is None:
+            raise ValueError("Match result must reference both documents")
+
+        return cls(
+            cv_id=cv_document.id,
+            job_id=job_document.id,
+            fingerprint=cls.fingerprint_for(cv_document, job_document),
+            weighted_final_score=match_result.weighted_final_score,
+            recommendation=match_result.recommendation,
+            explanation=match_result.explanation,
+            agent_scores=match_result.agent_scores,
+            detailed_results=match_result.detailed_results or {},
+        )
+
+    @property
+    def degraded(self) -> bool:
+        """Whether an agent call failed, leaving a placeholder score."""
+        return any(
+            isinstance(result, dict) and result.get("failed")
+            for result in self.detailed_results.values()
+        )
+
+    def is_fresh_for(
+        self, cv_document: Document, job_document: Document
+    ) -> bool:
+        """Whether the record is a sound analysis of the current pair."""
+        return not self.degraded and self.fingerprint == self.fingerprint_for(
+            cv_document, job_document
+        )
+
+    def to_match_result(
+        self,
+        cv_document: Document,
+        job_document: Document,
+        agent_weights: Optional[Dict[str, float]] = None,
+    ) -> MatchResult:
+        """Restore match result for the given documents.
+
+        With agent weights, the final score and recommendation are
+        recomputed from the stored agent scores, so stored matches follow
+        weight changes without re-running the agents.
+        """
+        weighted_final_score = self.weighted_final_score
+        recommendation = self.recommendation
+        if agent_weights:
+            weighted_final_score = self.agent_scores.weighted_score(
+                agent_weights
+            )
+            recommendation = MatchRecommendation.from_score(
+                weighted_final_score
+            )
+
+        return MatchResult(
+            cv_document=cv_document,
+            job_document=job_document,
+            weighted_final_score=weighted_final_score,
+            recommendation=recommendation,
+            explanation=self.explanation,
+            agent_scores=self.agent_scores,
+            detailed_results=self.detailed_results,
+        )
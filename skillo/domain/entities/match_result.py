@@ -17,3 +17,4 @@ class MatchResult:
     explanation: str
     agent_scores: AgentScores
     detailed_results: Optional[Dict[str, Any]] = None
+    degraded: bool = False
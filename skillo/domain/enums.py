@@ -16,3 +16,20 @@ class MatchRecommendation(str, Enum):
     FAIR_MATCH = "Fair Match"
     POOR_MATCH = "Poor Match"
     NO_MATCH = "No Match"
+    NOT_ANALYSED = "Not Analysed"
+
+    @classmethod
+    def from_score(cls, score: float) -> "MatchRecommendation":
+        """Recommendation band of a weighted final score."""
+        for threshold, recommendation in RECOMMENDATION_THRESHOLDS:
+            if score >= threshold:
+                return recommendation
+        return cls.NO_MATCH
+
+
+RECOMMENDATION_THRESHOLDS = (
+    (0.8, MatchRecommendation.STRONG_MATCH),
+    (0.6, MatchRecommendation.GOOD_MATCH),
+    (0.4, MatchRecommendation.FAIR_MATCH),
+    (0.2, MatchRecommendation.POOR_MATCH),
+)
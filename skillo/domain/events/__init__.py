@@ -1,12 +1,17 @@
 from .base import BaseEvent, EventHandler, EventPublisher
 from .document_events import (
+    DocumentsDeletedEvent,
+    DocumentsReindexedEvent,
     DocumentUploadedEvent,
     DocumentUploadFailedEvent,
 )
 from .management_events import (
+    CollectionLayoutMigratedEvent,
+    DatabaseCompactedEvent,
     DatabaseResetEvent,
     DocumentExportCompletedEvent,
     DocumentExportFailedEvent,
+    IndexRebuiltEvent,
 )
 from .matching_events import (
     MatchingCompletedEvent,
@@ -23,7 +28,12 @@ __all__ = [
     "MatchingFailedEvent",
     "DocumentUploadedEvent",
     "DocumentUploadFailedEvent",
+    "DocumentsDeletedEvent",
+    "DocumentsReindexedEvent",
     "DatabaseResetEvent",
+    "DatabaseCompactedEvent",
     "DocumentExportCompletedEvent",
     "DocumentExportFailedEvent",
+    "IndexRebuiltEvent",
+    "CollectionLayoutMigratedEvent",
 ]
@@ -7,6 +7,7 @@ class DocumentUploadedEvent:
 
     filename: str
     document_type: str
+    document_id: str = ""
 
     @property
     def event_type(self) -> str:
@@ -40,3 +41,49 @@ class DocumentUploadFailedEvent:
     @property
     def level(self) -> str:
         return "error"
+
+
+@dataclass
+class DocumentsDeletedEvent:
+    """Documents deleted event."""
+
+    success: bool
+    document_count: int = 0
+    error_message: str = ""
+
+    @property
+    def event_type(self) -> str:
+        return "DOCUMENTS_DELETED"
+
+    @property
+    def message(self) -> str:
+        if self.success:
+            return f"Deleted {self.document_count} documents"
+        return f"Document deletion failed: {self.error_message}"
+
+    @property
+    def level(self) -> str:
+        return "success" if self.success else "error"
+
+
+@dataclass
+class DocumentsReindexedEvent:
+    """Documents reindexed event."""
+
+    success: bool
+    document_count: int = 0
+    error_message: str = ""
+
+    @property
+    def event_type(self) -> str:
+        return "DOCUMENTS_REINDEXED"
+
+    @property
+    def message(self) -> str:
+        if self.success:
+            return f"Re-embedded {self.document_count} documents"
+        return f"Document reindex failed: {self.error_message}"
+
+    @property
+    def level(self) -> str:
+        return "success" if self.success else "error"
@@ -23,6 +23,77 @@ class DatabaseResetEvent:
         return "success" if self.success else "error"
 
 
+@dataclass
+class DatabaseCompactedEvent:
+    """Database compaction event."""
+
+    success: bool
+    removed_count: int = 0
+    error_message: str = ""
+
+    @property
+    def event_type(self) -> str:
+        return "DATABASE_COMPACTED"
+
+    @property
+    def message(self) -> str:
+        if self.success:
+            return f"Database compacted, removed {self.removed_count} duplicate entries"
+        return f"Database compaction failed: {self.error_message}"
+
+    @property
+    def level(self) -> str:
+        return "success" if self.success else "error"
+
+
+@dataclass
+class IndexRebuiltEvent:
+    """Index rebuild event."""
+
+    success: bool
+    collection_name: str
+    document_count: int = 0
+    error_message: str = ""
+
+    @property
+    def event_type(self) -> str:
+        return "INDEX_REBUILT"
+
+    @property
+    def message(self) -> str:
+        if self.success:
+            return f"Rebuilt {self.document_count} entries into collection '{self.collection_name}'"
+        return f"Index rebuild into '{self.collection_name}' failed: {self.error_message}"
+
+    @property
+    def level(self) -> str:
+        return "success" if self.success else "error"
+
+
+@dataclass
+class CollectionLayoutMigratedEvent:
+    """Collection layout migration event."""
+
+    success: bool
+    layout: str
+    document_count: int = 0
+    error_message: str = ""
+
+    @property
+    def event_type(self) -> str:
+        return "COLLECTION_LAYOUT_MIGRATED"
+
+    @property
+    def message(self) -> str:
+        if self.success:
+            return f"Migrated {self.document_count} entries to '{self.layout}' layout"
+        return f"Layout migration failed: {self.error_message}"
+
+    @property
+    def level(self) -> str:
+        return "success" if self.success else "error"
+
+
 @dataclass
 class DocumentExportCompletedEvent:
     """Document export completed event."""
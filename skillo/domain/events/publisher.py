@@ -11,12 +11,13 @@ class DomainEventPublisher(EventPublisher):
 
     def publish(self, event: BaseEvent) -> None:
         """Publish event to all registered handlers."""
-        event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
-
-        for handler in handlers:
+        for handler in self.handlers_for(type(event)):
             handler.handle(event)
 
+    def handlers_for(self, event_type: Type[BaseEvent]) -> List[EventHandler]:
+        """Handlers subscribed to an event type."""
+        return list(self._handlers.get(event_type, []))
+
     def subscribe(
         self, event_type: Type[BaseEvent], handler: EventHandler
     ) -> None:
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 
 from skillo.domain.entities.agent_scores import AgentScores
+from skillo.domain.entities.document import Document
 from skillo.domain.entities.match_result import MatchResult
 from skillo.domain.enums import MatchRecommendation
 
@@ -29,4 +30,34 @@ class MatchResultFactory:
             explanation=analysis_data["explanation"],
             agent_scores=agent_scores,
             detailed_results=analysis_data.get("detailed_results"),
+            degraded=bool(analysis_data.get("degraded", False)),
+        )
+
+    @staticmethod
+    def from_similarity(
+        cv_document: Document, job_document: Document, similarity: float
+    ) -> MatchResult:
+        """Create a degraded MatchResult for a pair never analysed.
+
+        It has no match score or recommendation; the vector similarity it
+        was found by is kept in its detailed results.
+        """
+        return MatchResult(
+            cv_document=cv_document,
+            job_document=job_document,
+            weighted_final_score=0.0,
+            recommendation=MatchRecommendation.NOT_ANALYSED,
+            explanation=(
+                "Agent analysis unavailable; ranked by document similarity "
+                "only"
+            ),
+            agent_scores=AgentScores(
+                skills_score=0.0,
+                location_score=0.0,
+                experience_score=0.0,
+                preferences_score=0.0,
+                education_score=0.0,
+            ),
+            detailed_results={"similarity": similarity},
+            degraded=True,
         )
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from skillo.domain.entities import Document
+from skillo.domain.entities import Document, MatchRecord
 from skillo.domain.enums import DocumentType
 
 
@@ -15,7 +15,22 @@ class DocumentRepository(ABC):
 
     @abstractmethod
     def add_document(self, document: Document) -> bool:
-        """Add document to storage."""
+        """Add or replace document in storage."""
+        pass
+
+    @abstractmethod
+    def add_documents(self, documents: List[Document]) -> bool:
+        """Add or replace a batch of documents in storage."""
+        pass
+
+    @abstractmethod
+    def get_documents_by_ids(self, document_ids: List[str]) -> List[Document]:
+        """Get stored documents by id, skipping unknown ids."""
+        pass
+
+    @abstractmethod
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """Delete documents by id, return deleted document count."""
         pass
 
     @abstractmethod
@@ -25,6 +40,13 @@ class DocumentRepository(ABC):
         """Find similar documents."""
         pass
 
+    @abstractmethod
+    def find_similar_documents_with_scores(
+        self, query: str, doc_type: DocumentType, limit: int = 10
+    ) -> List[Tuple[Document, float]]:
+        """Find similar documents with their similarity in [0, 1]."""
+        pass
+
 
 class ManagementRepository(ABC):
     """Management repository interface."""
@@ -38,3 +60,73 @@ class ManagementRepository(ABC):
     def get_all_documents(self) -> List[Document]:
         """Get all documents from database."""
         pass
+
+    @abstractmethod
+    def compact_duplicates(self) -> int:
+        """Collapse duplicate entries per document, return removed count."""
+        pass
+
+    @abstractmethod
+    def rebuild_index(self, target_collection_name: str) -> int:
+        """Rebuild storage into a new index, return copied count."""
+        pass
+
+    @abstractmethod
+    def migrate_layout(
+        self,
+        target_layout: str,
+        target_collection_name: Optional[str] = None,
+    ) -> int:
+        """Copy storage into another collection layout, return copied count."""
+        pass
+
+
+class MatchRepository(ABC):
+    """Stored match matrix interface."""
+
+    @abstractmethod
+    def save_matches(self, records: List[MatchRecord]) -> None:
+        """Insert or replace match records."""
+        pass
+
+    @abstractmethod
+    def get_match(self, cv_id: str, job_id: str) -> Optional[MatchRecord]:
+        """Get stored match for a pair."""
+        pass
+
+    @abstractmethod
+    def get_matches_for_cv(self, cv_id: str) -> List[MatchRecord]:
+        """Get stored matches of a CV, best first."""
+        pass
+
+    @abstractmethod
+    def get_matches_for_job(self, job_id: str) -> List[MatchRecord]:
+        """Get stored matches of a job, best first."""
+        pass
+
+    @abstractmethod
+    def get_fingerprints(self) -> Dict[Tuple[str, str], str]:
+        """Get stored fingerprints keyed by (cv_id, job_id)."""
+        pass
+
+    @abstractmethod
+    def get_score_rows(self) -> List[Tuple[Any, ...]]:
+        """Get score rows of every stored pair.
+
+        Columns: cv_id, job_id, weighted_final_score, then the skills,
+        location, experience, preferences and education sub-scores.
+        """
+        pass
+
+    @abstractmethod
+    def delete_matches_for(self, document_ids: List[str]) -> int:
+        """Delete stored matches involving any of the documents.
+
+        Returns the number of deleted matches.
+        """
+        pass
+
+    @abstractmethod
+    def delete_all_matches(self) -> None:
+        """Delete every stored match."""
+        pass
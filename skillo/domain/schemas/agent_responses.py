@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 from skillo.domain.enums import MatchRecommendation
@@ -117,3 +117,7 @@ class NormalizationResponse:
     experience_level: str
     industry_sector: str
     explanation: str
+    total_experience_years: str = "Not specified"
+    degree: str = "Not specified"
+    field_of_study: str = "Not specified"
+    certifications: List[str] = field(default_factory=list)
@@ -1,25 +1,47 @@
+from .batch_matching_service import BatchMatchingService, BatchMatchSummary
+from .cancellation import CancellationToken
 from .document_builder import DocumentBuilder
 from .document_content_builder import DocumentContentBuilder
 from .document_metadata_builder import DocumentMetadataBuilder
 from .interfaces import (
+    AnalysisCircuitBreaker,
     DocumentAgentService,
     DocumentProcessingPipeline,
     NormalizationService,
     ProcessingInput,
     ProfileClassificationService,
+    RateLimiter,
     SupervisorAgentInterface,
 )
-from .matching_service import MatchingService
+from .match_rescoring import (
+    AGENT_SCORE_NAMES,
+    MatchRescoringService,
+    RescoredPair,
+    RescoreSummary,
+)
+from .matching_service import MatchingService, MatchStreamUpdate
+from .top_k_matches import TopKMatches
 
 __all__ = [
     "DocumentBuilder",
     "DocumentContentBuilder",
     "DocumentMetadataBuilder",
     "MatchingService",
+    "MatchStreamUpdate",
+    "TopKMatches",
     "SupervisorAgentInterface",
     "DocumentProcessingPipeline",
     "ProfileClassificationService",
     "DocumentAgentService",
     "NormalizationService",
     "ProcessingInput",
+    "RateLimiter",
+    "AnalysisCircuitBreaker",
+    "BatchMatchingService",
+    "BatchMatchSummary",
+    "CancellationToken",
+    "AGENT_SCORE_NAMES",
+    "MatchRescoringService",
+    "RescoredPair",
+    "RescoreSummary",
 ]
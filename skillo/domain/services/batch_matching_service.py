@@ -0,0 +1,108 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional, Tuple
+
+from skillo.domain.entities import Document, MatchRecord
+from skillo.domain.enums import DocumentType
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+
+from .interfaces import ParallelExecutionService
+from .matching_service import MatchingService
+
+
+@dataclass
+class BatchMatchSummary:
+    """Outcome of an all-pairs matching run."""
+
+    total_pairs: int = 0
+    computed: int = 0
+    reused: int = 0
+    failed: int = 0
+
+
+class BatchMatchingService:
+    """All-pairs CV-Job matching into the stored match matrix."""
+
+    def __init__(
+        self,
+        matching_service: MatchingService,
+        document_repository: DocumentRepository,
+        match_repository: MatchRepository,
+        parallel_executor: ParallelExecutionService,
+        chunk_size: int = 20,
+    ):
+        """Initialize with dependencies."""
+        self._matching_service = matching_service
+        self._document_repository = document_repository
+        self._match_repository = match_repository
+        self._parallel_executor = parallel_executor
+        self._chunk_size = chunk_size
+
+    def run(
+        self,
+        cv_ids: Optional[List[str]] = None,
+        job_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BatchMatchSummary:
+        """Match every selected CV against every selected job.
+
+        Pairs whose stored fingerprint still matches are skipped. Results
+        are saved as each pair finishes, so an interrupted run resumes
+        where it stopped.
+        """
+        cv_documents = self._load_documents(DocumentType.CV, cv_ids)
+        job_documents = self._load_documents(DocumentType.JOB, job_ids)
+        fingerprints = self._match_repository.get_fingerprints()
+
+        summary = BatchMatchSummary(
+            total_pairs=len(cv_documents) * len(job_documents)
+        )
+        queue: Deque[Tuple[Document, Document]] = deque()
+        for job_document in job_documents:
+            for cv_document in cv_documents:
+                stored = fingerprints.get((cv_document.id, job_document.id))
+                if stored == MatchRecord.fingerprint_for(
+                    cv_document, job_document
+                ):
+                    summary.reused += 1
+                else:
+                    queue.append((cv_document, job_document))
+
+        pending_count = len(queue)
+        processed_count = 0
+        while queue:
+            chunk = [
+                queue.popleft()
+                for _ in range(min(self._chunk_size, len(queue)))
+            ]
+            tasks = self._matching_service.analysis_tasks(chunk)
+            matches = [
+                match
+                for task_matches in (
+                    self._parallel_executor.execute_tasks_with_progress(tasks)
+                )
+                for match in task_matches
+            ]
+
+            summary.computed += len(matches)
+            summary.failed += len(chunk) - len(matches)
+            processed_count += len(chunk)
+            if progress_callback:
+                progress_callback(processed_count, pending_count)
+
+        return summary
+
+    def _load_documents(
+        self, doc_type: DocumentType, document_ids: Optional[List[str]]
+    ) -> List[Document]:
+        """All documents of a type, or the selected subset."""
+        if document_ids is None:
+            return self._document_repository.get_documents_by_type(doc_type)
+
+        return [
+            document
+            for document in self._document_repository.get_documents_by_ids(
+                document_ids
+            )
+            if document.document_type == doc_type
+        ]
@@ -0,0 +1,18 @@
+import threading
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared by a job and its tasks."""
+
+    def __init__(self) -> None:
+        """Initialize in the not-cancelled state."""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; idempotent."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._event.is_set()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from skillo.domain.entities import Document
 from skillo.domain.enums import DocumentType
@@ -24,6 +24,8 @@ class DocumentBuilder:
         processing_response: DocumentProcessingResponse,
         normalization_response: NormalizationResponse,
         profile: str,
+        employment_spans: Optional[List[str]] = None,
+        total_years: Optional[float] = None,
     ) -> Document:
         """Assemble CV document from processed components."""
         content = DocumentContentBuilder.build_cv_content(
@@ -31,7 +33,12 @@ class DocumentBuilder:
         )
 
         metadata = DocumentMetadataBuilder.build_base_metadata(
-            filename, processing_response, normalization_response, profile
+            filename,
+            processing_response,
+            normalization_response,
+            profile,
+            employment_spans,
+            total_years,
         )
 
         return Document(
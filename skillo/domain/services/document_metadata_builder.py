@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 
+from skillo.domain.entities import AnalysisProfile
 from skillo.domain.schemas import (
     DocumentProcessingResponse,
     NormalizationResponse,
@@ -15,6 +16,8 @@ class DocumentMetadataBuilder:
         processing_response: DocumentProcessingResponse,
         normalization_response: NormalizationResponse,
         profile: Optional[str] = None,
+        employment_spans: Optional[List[str]] = None,
+        total_years: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Build common metadata fields for documents."""
         metadata = {
@@ -43,8 +46,46 @@ class DocumentMetadataBuilder:
         if profile:
             metadata["profile"] = profile
 
+        metadata.update(
+            DocumentMetadataBuilder.build_analysis_profile(
+                processing_response,
+                normalization_response,
+                employment_spans,
+                total_years,
+            ).to_metadata()
+        )
+
         return metadata
 
+    @staticmethod
+    def build_analysis_profile(
+        processing_response: DocumentProcessingResponse,
+        normalization_response: NormalizationResponse,
+        employment_spans: Optional[List[str]] = None,
+        total_years: Optional[float] = None,
+    ) -> AnalysisProfile:
+        """Build the facts the matching agents compare for every pair.
+
+        Locally computed employment spans and total years take precedence
+        over the normalizer's estimate.
+        """
+        return AnalysisProfile(
+            skills=normalization_response.normalized_skills,
+            total_years=(
+                f"{total_years:.1f}"
+                if total_years is not None
+                else normalization_response.total_experience_years
+            ),
+            employment_spans=employment_spans or [],
+            level=normalization_response.experience_level,
+            degree=normalization_response.degree,
+            field_of_study=normalization_response.field_of_study,
+            certifications=normalization_response.certifications,
+            location=normalization_response.normalized_location,
+            remote_preference=normalization_response.remote_work_status,
+            preferences=processing_response.preferences,
+        )
+
     @staticmethod
     def _join_skills(skills: List[str]) -> str:
         """Join skills list to comma-separated string."""
@@ -1,5 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+)
 
 from skillo.domain.entities import Document
 from skillo.domain.schemas import (
@@ -7,6 +16,8 @@ from skillo.domain.schemas import (
     NormalizationResponse,
 )
 
+from .cancellation import CancellationToken
+
 
 class SupervisorAgentInterface(ABC):
     """Supervisor agent interface."""
@@ -18,6 +29,15 @@ class SupervisorAgentInterface(ABC):
         """Analyze CV-job match."""
         pass
 
+    def analyze_match_batch(
+        self, cv_documents: List[Document], job_document: Document
+    ) -> List[Dict[str, Any]]:
+        """Analyze several CVs against one job, one result per CV."""
+        return [
+            self.analyze_match(cv_document, job_document)
+            for cv_document in cv_documents
+        ]
+
 
 class ProcessingInput:
     """Input for document processing pipeline."""
@@ -77,6 +97,42 @@ class ParallelExecutionService(Protocol):
         self,
         tasks: List[Any],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[Any]:
-        """Execute tasks in parallel with progress tracking."""
+        """Execute tasks in parallel with progress tracking.
+
+        Once the token is cancelled, tasks that have not started are
+        dropped and in-flight ones are no longer waited for.
+        """
+        ...
+
+    def iter_task_results(
+        self,
+        tasks: Iterable[Any],
+        cancellation_token: Optional[CancellationToken] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield each task's result as soon as it completes.
+
+        Failed tasks yield None so callers can count completions; the
+        iterator stops early when the token is cancelled. With
+        max_in_flight, at most that many tasks are taken from the
+        iterable and submitted at a time.
+        """
+        ...
+
+
+class RateLimiter(Protocol):
+    """Domain interface for pacing outbound analysis calls."""
+
+    def acquire(self) -> None:
+        """Block until the next call may proceed."""
+        ...
+
+
+class AnalysisCircuitBreaker(Protocol):
+    """Domain interface for the health of the analysis provider."""
+
+    def is_open(self) -> bool:
+        """Whether analyses are currently refused without being tried."""
         ...
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Protocol
+
+AGENT_SCORE_NAMES = (
+    "skills",
+    "location",
+    "experience",
+    "preferences",
+    "education",
+)
+
+
+@dataclass
+class RescoredPair:
+    """Stored pair with its score under trial weights."""
+
+    cv_id: str
+    job_id: str
+    weighted_final_score: float
+    recommendation: str
+    stored_score: float
+
+
+@dataclass
+class RescoreSummary:
+    """Stored match matrix re-weighted without re-running agents."""
+
+    total_pairs: int = 0
+    changed_recommendations: int = 0
+    recommendation_counts: Dict[str, int] = field(default_factory=dict)
+    top_pairs: List[RescoredPair] = field(default_factory=list)
+
+
+class MatchRescoringService(Protocol):
+    """Domain interface for re-weighting stored agent sub-scores."""
+
+    def rescore(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummary:
+        """Recompute final scores and recommendations of stored pairs.
+
+        Weights use the ``<agent>_weight`` keys of the agent weight
+        settings and are normalized to sum to one.
+        """
+        ...
@@ -1,12 +1,31 @@
-from typing import Callable, List, Optional
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from skillo.domain.entities import Document, MatchResult
+from skillo.domain.entities import Document, MatchRecord, MatchResult
 from skillo.domain.enums import DocumentType
 from skillo.domain.exceptions import SkilloAnalysisError
 from skillo.domain.factories import MatchResultFactory
-from skillo.domain.repositories import DocumentRepository
+from skillo.domain.repositories import DocumentRepository, MatchRepository
 
-from .interfaces import ParallelExecutionService, SupervisorAgentInterface
+from .cancellation import CancellationToken
+from .interfaces import (
+    AnalysisCircuitBreaker,
+    ParallelExecutionService,
+    RateLimiter,
+    SupervisorAgentInterface,
+)
+from .top_k_matches import TopKMatches
+
+
+@dataclass
+class MatchStreamUpdate:
+    """Progress of a streamed match run after one analysis task finished."""
+
+    completed: int
+    total: int
+    new_matches: List[MatchResult] = field(default_factory=list)
+    top_matches: List[MatchResult] = field(default_factory=list)
 
 
 class MatchingService:
@@ -19,13 +38,26 @@ class MatchingService:
         parallel_executor: ParallelExecutionService,
         top_candidates_count: int = 5,
         min_match_score: float = 0.3,
+        match_repository: Optional[MatchRepository] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        match_batch_size: int = 1,
+        circuit_breaker: Optional[AnalysisCircuitBreaker] = None,
+        agent_weights: Optional[Dict[str, float]] = None,
     ):
-        """Initialize with dependencies."""
+        """Initialize with dependencies.
+
+        Stored matches are re-scored under agent_weights when given.
+        """
         self._document_repository = document_repository
         self._supervisor_agent = supervisor_agent
         self._parallel_executor = parallel_executor
         self._top_candidates_count = top_candidates_count
         self._min_match_score = min_match_score
+        self._match_repository = match_repository
+        self._rate_limiter = rate_limiter
+        self._match_batch_size = max(1, match_batch_size)
+        self._circuit_breaker = circuit_breaker
+        self._agent_weights = agent_weights
 
     def match_cv_to_all_jobs(self, cv_document: Document) -> List[MatchResult]:
         """Match CV against all job postings."""
@@ -38,12 +70,14 @@ class MatchingService:
         self,
         cv_document: Document,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResult]:
         """Match CV against all job postings with progress tracking."""
         return self._generic_match_with_progress(
             source_document=cv_document,
             target_doc_type=DocumentType.JOB,
             progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
         )
 
     def match_job_to_all_cvs(
@@ -59,12 +93,59 @@ class MatchingService:
         self,
         job_document: Document,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResult]:
         """Match job against all CVs with progress tracking."""
         return self._generic_match_with_progress(
             source_document=job_document,
             target_doc_type=DocumentType.CV,
             progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+    def stream_cv_to_all_jobs(
+        self,
+        cv_document: Document,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdate]:
+        """Stream job matches for a CV as each analysis completes."""
+        return self._generic_match_stream(
+            cv_document, DocumentType.JOB, cancellation_token
+        )
+
+    def stream_job_to_all_cvs(
+        self,
+        job_document: Document,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdate]:
+        """Stream CV matches for a job as each analysis completes."""
+        return self._generic_match_stream(
+            job_document, DocumentType.CV, cancellation_token
+        )
+
+    def refresh_neighbour_matches(
+        self, document: Document, neighbour_count: int
+    ) -> List[MatchResult]:
+        """Match a document against its nearest counterparts only."""
+        target_doc_type = (
+            DocumentType.JOB
+            if document.document_type == DocumentType.CV
+            else DocumentType.CV
+        )
+        neighbours = self._document_repository.find_similar_documents(
+            query=document.content,
+            doc_type=target_doc_type,
+            limit=neighbour_count,
+        )
+
+        tasks = self.analysis_tasks(
+            [
+                self._as_pair(document, neighbour, target_doc_type)
+                for neighbour in neighbours
+            ]
+        )
+        return self._flatten(
+            self._parallel_executor.execute_tasks_with_progress(tasks)
         )
 
     def _generic_match(
@@ -73,41 +154,52 @@ class MatchingService:
         target_doc_type: DocumentType,
     ) -> List[MatchResult]:
         """Generic matching method."""
-        target_documents = self._document_repository.find_similar_documents(
-            query=source_document.content,
-            doc_type=target_doc_type,
-            limit=self._top_candidates_count * 2,
+        return self._generic_match_with_progress(
+            source_document, target_doc_type
         )
 
-        if not target_documents:
-            return []
-
-        tasks = [
-            lambda td=target_doc: self._analyze_single_match(
-                source_document, td, target_doc_type
-            )
-            for target_doc in target_documents
-        ]
-
-        matches = self._parallel_executor.execute_tasks_with_progress(tasks)
-
-        matches.sort(key=lambda x: x.weighted_final_score, reverse=True)
-
-        filtered_matches = [
-            match
-            for match in matches
-            if match.weighted_final_score >= self._min_match_score
-        ]
-
-        return filtered_matches[: self._top_candidates_count]
-
     def _generic_match_with_progress(
         self,
         source_document: Document,
         target_doc_type: DocumentType,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[MatchResult]:
         """Generic matching method with progress tracking."""
+        top_matches: List[MatchResult] = []
+        for update in self._generic_match_stream(
+            source_document, target_doc_type, cancellation_token
+        ):
+            top_matches = update.top_matches
+            if progress_callback:
+                progress_callback(update.completed, update.total)
+
+        return top_matches
+
+    def _generic_match_stream(
+        self,
+        source_document: Document,
+        target_doc_type: DocumentType,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[MatchStreamUpdate]:
+        """Analyse the nearest candidates, yielding the running top-k.
+
+        Stops early, keeping the partial ranking, when cancelled. While
+        the analysis circuit is open, the nearest candidates are returned
+        unanalysed and marked degraded; with a circuit breaker, pairs of
+        this run left without a sound analysis are added the same way at
+        the end. Degraded matches are never ranked against analysed ones:
+        they follow the analysed ranking, nearest first.
+        """
+        if self._analysis_refused():
+            matches = self._similarity_matches(
+                source_document, target_doc_type
+            )[: self._top_candidates_count]
+            yield MatchStreamUpdate(
+                completed=1, total=1, new_matches=matches, top_matches=matches
+            )
+            return
+
         target_documents = self._document_repository.find_similar_documents(
             query=source_document.content,
             doc_type=target_doc_type,
@@ -115,53 +207,273 @@ class MatchingService:
         )
 
         if not target_documents:
-            return []
+            return
 
-        tasks = [
-            lambda td=target_doc: self._analyze_single_match(
-                source_document, td, target_doc_type
-            )
-            for target_doc in target_documents
-        ]
+        tasks = self.analysis_tasks(
+            [
+                self._as_pair(source_document, target_doc, target_doc_type)
+                for target_doc in target_documents
+            ],
+            cancellation_token,
+        )
 
-        matches = self._parallel_executor.execute_tasks_with_progress(
-            tasks, progress_callback
+        top_k = TopKMatches(self._top_candidates_count, self._min_match_score)
+        task_results = self._parallel_executor.iter_task_results(
+            tasks, cancellation_token
         )
+        analysed_ids = set()
+        for completed, task_result in enumerate(task_results, 1):
+            new_matches = self._flatten([task_result])
+            for match in new_matches:
+                top_k.add(match)
+                analysed_ids.add(self._target_id(match, target_doc_type))
 
-        matches.sort(key=lambda x: x.weighted_final_score, reverse=True)
+            yield MatchStreamUpdate(
+                completed=completed,
+                total=len(tasks),
+                new_matches=new_matches,
+                top_matches=top_k.ranked(),
+            )
 
-        filtered_matches = [
+        cancelled = cancellation_token and cancellation_token.cancelled
+        missing = len(analysed_ids) < len(target_documents)
+        if cancelled or not missing or not self._circuit_breaker:
+            return
+
+        fallback = [
             match
-            for match in matches
-            if match.weighted_final_score >= self._min_match_score
+            for match in self._similarity_matches(
+                source_document, target_doc_type
+            )
+            if self._target_id(match, target_doc_type) not in analysed_ids
+        ][: self._top_candidates_count]
+        yield MatchStreamUpdate(
+            completed=len(tasks),
+            total=len(tasks),
+            new_matches=fallback,
+            top_matches=top_k.ranked() + fallback,
+        )
+
+    def analysis_tasks(
+        self,
+        pairs: List[Tuple[Document, Document]],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[Callable[[], List[MatchResult]]]:
+        """Tasks for (cv, job) pairs, CVs of one job batched together."""
+        if self._match_batch_size == 1:
+            return [
+                partial(self._analyze_pair_task, *pair, cancellation_token)
+                for pair in pairs
+            ]
+
+        jobs: Dict[str, Document] = {}
+        cvs_by_job: Dict[str, List[Document]] = {}
+        for cv_document, job_document in pairs:
+            jobs[job_document.id] = job_document
+            cvs_by_job.setdefault(job_document.id, []).append(cv_document)
+
+        size = self._match_batch_size
+        batches: List[Tuple[Document, List[Document]]] = []
+        for job_id, cv_documents in cvs_by_job.items():
+            for start in range(0, len(cv_documents), size):
+                end = start + size
+                batches.append((jobs[job_id], cv_documents[start:end]))
+        return [
+            partial(self.analyze_job_batch, *batch, cancellation_token)
+            for batch in batches
         ]
 
-        return filtered_matches[: self._top_candidates_count]
+    def _analyze_pair_task(
+        self,
+        cv_document: Document,
+        job_document: Document,
+        cancellation_token: Optional[CancellationToken],
+    ) -> List[MatchResult]:
+        """Analysis task of one pair, empty when it yields no match."""
+        return self._flatten(
+            [self.analyze_pair(cv_document, job_document, cancellation_token)]
+        )
 
-    def _analyze_single_match(
+    def analyze_pair(
         self,
-        source_document: Document,
-        target_doc: Document,
-        target_doc_type: DocumentType,
+        cv_document: Document,
+        job_document: Document,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> MatchResult | None:
-        """Analyze single document match - thread-safe."""
+        """Stored match for an unchanged pair, otherwise a fresh analysis."""
         try:
-            if target_doc_type == DocumentType.JOB:
-                match_result = self._supervisor_agent.analyze_match(
-                    cv_document=source_document, job_document=target_doc
-                )
-                match_result["cv_document"] = source_document
-                match_result["job_document"] = target_doc
-            else:
-                match_result = self._supervisor_agent.analyze_match(
-                    cv_document=target_doc, job_document=source_document
-                )
-                match_result["cv_document"] = target_doc
-                match_result["job_document"] = source_document
+            stored = self._stored_match(cv_document, job_document)
+            if stored:
+                return stored
 
-            return MatchResultFactory.from_analysis_result(match_result)
+            if self._analysis_refused() or not self._acquire(
+                cancellation_token
+            ):
+                return None
+
+            match_result = self._supervisor_agent.analyze_match(
+                cv_document=cv_document, job_document=job_document
+            )
+            results = self._save_analyses(
+                [match_result], [cv_document], job_document
+            )
+            return results[0] if results else None
 
         except (SkilloAnalysisError, ValueError):
             return None
         except Exception:
             return None
+
+    def analyze_job_batch(
+        self,
+        job_document: Document,
+        cv_documents: List[Document],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[MatchResult]:
+        """Score several CVs against one job in a single batched analysis."""
+        stale_documents: List[Document] = []
+        results: List[MatchResult] = []
+        for cv_document in cv_documents:
+            stored = self._stored_match(cv_document, job_document)
+            if stored:
+                results.append(stored)
+            else:
+                stale_documents.append(cv_document)
+
+        if len(stale_documents) == 1:
+            return self._flatten(
+                [
+                    *results,
+                    self.analyze_pair(
+                        stale_documents[0], job_document, cancellation_token
+                    ),
+                ]
+            )
+        if not stale_documents:
+            return results
+
+        try:
+            if self._analysis_refused() or not self._acquire(
+                cancellation_token
+            ):
+                return results
+
+            analyses = self._supervisor_agent.analyze_match_batch(
+                cv_documents=stale_documents, job_document=job_document
+            )
+            return results + self._save_analyses(
+                analyses, stale_documents, job_document
+            )
+
+        except Exception:
+            return results
+
+    def _acquire(
+        self, cancellation_token: Optional[CancellationToken]
+    ) -> bool:
+        """Wait for the rate limiter; False if cancelled before the call."""
+        if cancellation_token and cancellation_token.cancelled:
+            return False
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
+        return not (cancellation_token and cancellation_token.cancelled)
+
+    def _analysis_refused(self) -> bool:
+        """Whether the analysis circuit is open, so no analysis is tried.
+
+        Whether a finished analysis is sound is decided by its own failed
+        agent calls, not by the circuit state afterwards.
+        """
+        return bool(self._circuit_breaker and self._circuit_breaker.is_open())
+
+    def _similarity_matches(
+        self, source_document: Document, target_doc_type: DocumentType
+    ) -> List[MatchResult]:
+        """Degraded matches of the nearest candidates, nearest first."""
+        scored = self._document_repository.find_similar_documents_with_scores(
+            query=source_document.content,
+            doc_type=target_doc_type,
+            limit=self._top_candidates_count * 2,
+        )
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return [
+            MatchResultFactory.from_similarity(
+                *self._as_pair(source_document, target_doc, target_doc_type),
+                similarity,
+            )
+            for target_doc, similarity in scored
+        ]
+
+    def _stored_match(
+        self, cv_document: Document, job_document: Document
+    ) -> MatchResult | None:
+        """Stored match if it was computed on the current pair contents."""
+        if not self._match_repository:
+            return None
+
+        record = self._match_repository.get_match(
+            cv_document.id, job_document.id
+        )
+        if record and record.is_fresh_for(cv_document, job_document):
+            return record.to_match_result(
+                cv_document, job_document, self._agent_weights
+            )
+        return None
+
+    def _save_analyses(
+        self,
+        analyses: List[Dict[str, Any]],
+        cv_documents: List[Document],
+        job_document: Document,
+    ) -> List[MatchResult]:
+        """Build match results from analyses and persist them.
+
+        Analyses with failed agent calls are dropped: the placeholder
+        scores of those calls would rank and store the pair wrongly.
+        """
+        results = []
+        for analysis, cv_document in zip(analyses, cv_documents):
+            analysis["cv_document"] = cv_document
+            analysis["job_document"] = job_document
+            result = MatchResultFactory.from_analysis_result(analysis)
+            if not result.degraded:
+                results.append(result)
+
+        if self._match_repository:
+            self._match_repository.save_matches(
+                [MatchRecord.from_match_result(result) for result in results]
+            )
+
+        return results
+
+    @staticmethod
+    def _as_pair(
+        source_document: Document,
+        target_doc: Document,
+        target_doc_type: DocumentType,
+    ) -> Tuple[Document, Document]:
+        """Order source and target as a (cv, job) pair."""
+        if target_doc_type == DocumentType.JOB:
+            return source_document, target_doc
+        return target_doc, source_document
+
+    @staticmethod
+    def _target_id(match: MatchResult, target_doc_type: DocumentType) -> str:
+        """Id of the matched target document."""
+        target = (
+            match.job_document
+            if target_doc_type == DocumentType.JOB
+            else match.cv_document
+        )
+        return target.id if target else ""
+
+    @staticmethod
+    def _flatten(results: List[Any]) -> List[MatchResult]:
+        """Flatten task results, dropping failed analyses."""
+        flat: List[MatchResult] = []
+        for result in results:
+            if isinstance(result, list):
+                flat.extend(result)
+            elif result is not None:
+                flat.append(result)
+        return flat
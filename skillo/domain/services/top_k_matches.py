@@ -0,0 +1,40 @@
+import heapq
+from itertools import count
+from typing import List, Tuple
+
+from skillo.domain.entities import MatchResult
+
+
+class TopKMatches:
+    """Bounded min-heap keeping the best matches seen so far."""
+
+    def __init__(self, capacity: int, min_score: float = 0.0) -> None:
+        """Initialize with the number of matches kept and a score floor."""
+        self._capacity = max(1, capacity)
+        self._min_score = min_score
+        self._heap: List[Tuple[float, int, MatchResult]] = []
+        self._order = count()
+
+    def add(self, match: MatchResult) -> bool:
+        """Offer a match; True when it entered the top-k."""
+        score = match.weighted_final_score
+        if score < self._min_score:
+            return False
+
+        entry = (score, -next(self._order), match)
+        if len(self._heap) < self._capacity:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def ranked(self) -> List[MatchResult]:
+        """Kept matches, best first; earlier arrivals win ties."""
+        return [
+            match
+            for _, _, match in sorted(
+                self._heap, key=lambda entry: entry[:2], reverse=True
+            )
+        ]
@@ -231,6 +231,19 @@ class NormalizationResponseAdapter(BaseModel):
     explanation: str = Field(
         description="Summary of normalization changes made"
     )
+    total_experience_years: str = Field(
+        default="Not specified",
+        description="Total (or required) years of experience as a number",
+    )
+    degree: str = Field(
+        default="Not specified", description="Highest (or required) degree"
+    )
+    field_of_study: str = Field(
+        default="Not specified", description="Field of study of the degree"
+    )
+    certifications: List[str] = Field(
+        default_factory=list, description="Held (or required) certifications"
+    )
 
     def to_domain(self) -> NormalizationResponse:
         """Convert to domain dataclass."""
@@ -242,6 +255,10 @@ class NormalizationResponseAdapter(BaseModel):
             experience_level=self.experience_level,
             industry_sector=self.industry_sector,
             explanation=self.explanation,
+            total_experience_years=self.total_experience_years,
+            degree=self.degree,
+            field_of_study=self.field_of_study,
+            certifications=self.certifications,
         )
 
 
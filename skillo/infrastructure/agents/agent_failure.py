@@ -0,0 +1,15 @@
+import copy
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def failed_result(default: T) -> T:
+    """Copy of an agent's default result marked as a failed analysis.
+
+    The default score is only a placeholder, so the supervisor reports
+    analyses holding such results as degraded instead of as real scores.
+    """
+    result = copy.deepcopy(default)
+    result["failed"] = True  # type: ignore
+    return result
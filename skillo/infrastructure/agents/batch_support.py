@@ -0,0 +1,105 @@
+from dataclasses import asdict
+from typing import Any, Dict, List, Type
+
+import yaml  # type: ignore
+from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field, create_model
+
+from skillo.infrastructure.agents.agent_failure import failed_result
+from skillo.infrastructure.concurrency.resilience import resilient
+from skillo.infrastructure.config.settings import Config
+
+
+class BatchAnalysisSupport:
+    """Scores several candidates against one job in one structured call."""
+
+    def __init__(
+        self,
+        config: Config,
+        prompt_config: Dict[str, Any],
+        adapter: Type[BaseModel],
+    ) -> None:
+        self.prompt_template = f"{config.PROMPTS_DIR}/batch_prompts.yaml"
+        self.config = config
+        self.prompt_config = prompt_config
+        self.response_model = self._batch_model(adapter)
+        self._batch_config: Dict[str, Any] | None = None
+        self._llms: Dict[int, Any] = {}
+
+    @property
+    def batch_config(self) -> Dict[str, Any]:
+        """Batch prompt settings, loaded on first batched call."""
+        if self._batch_config is None:
+            with open(self.prompt_template, "r", encoding="utf-8") as f:
+                self._batch_config = yaml.safe_load(f)["batch_analysis"]
+        return self._batch_config
+
+    def llm(self, candidate_count: int) -> Any:
+        """Structured LLM with an output budget for the candidate count."""
+        if candidate_count not in self._llms:
+            max_tokens = self.prompt_config["max_tokens"] * candidate_count
+            self._llms[candidate_count] = resilient(
+                ChatOpenAI(  # type: ignore[call-arg]
+                    model=self.prompt_config["model"],
+                    temperature=self.prompt_config["temperature"],
+                    max_tokens=max_tokens,
+                    max_retries=0,
+                ).with_structured_output(self.response_model),
+                "batch_agent",
+                self.config,
+            )
+        return self._llms[candidate_count]
+
+    def user_message(self, cv_contents: List[str], job_content: str) -> str:
+        """Agent user prompt with numbered candidates and batch rules."""
+        candidates = "\n\n".join(
+            f"{self.batch_config['candidate_header'].format(number=number)}\n"
+            f"{content}"
+            for number, content in enumerate(cv_contents, start=1)
+        )
+        prompt = self.prompt_config["user_message"].format(
+            cv_content=candidates, job_content=job_content
+        )
+        instruction = self.batch_config["instruction"].format(
+            candidate_count=len(cv_contents)
+        )
+        return f"{prompt}\n\n{instruction}"
+
+    def results(
+        self,
+        raw_response: Any,
+        candidate_count: int,
+        default: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Per-candidate result dicts in input order.
+
+        Candidates the response left out get the default marked as
+        failed, so they are re-analysed rather than scored with it.
+        """
+        by_number = {
+            item.candidate_number: asdict(item.to_domain())
+            for item in raw_response.results
+        }
+        return [
+            by_number.get(number) or failed_result(default)
+            for number in range(1, candidate_count + 1)
+        ]
+
+    @staticmethod
+    def _batch_model(adapter: Type[BaseModel]) -> Type[BaseModel]:
+        """Response model holding one adapter result per candidate."""
+        candidate_model: Any = create_model(
+            f"Candidate{adapter.__name__}",
+            __base__=adapter,
+            candidate_number=(
+                int,
+                Field(description="1-based number of the candidate"),
+            ),
+        )
+        return create_model(
+            f"Batch{adapter.__name__}",
+            results=(
+                List[candidate_model],
+                Field(description="One result per numbered candidate"),
+            ),
+        )
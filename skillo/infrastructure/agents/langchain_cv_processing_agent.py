@@ -4,6 +4,7 @@ from pydantic import ValidationError
 
 from skillo.domain.schemas import DocumentProcessingResponse
 from skillo.infrastructure.adapters import DocumentProcessingResponseAdapter
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
 
@@ -18,11 +19,16 @@ class LangChainCVProcessingAgent:
         with open(prompt_template, "r", encoding="utf-8") as f:
             self.prompt_config = yaml.safe_load(f)["cv_processing"]
 
-        self.llm = ChatOpenAI(
-            model=self.prompt_config["model"],
-            temperature=self.prompt_config["temperature"],
-            max_tokens=self.prompt_config["max_tokens"],
-        ).with_structured_output(DocumentProcessingResponseAdapter)
+        self.llm = resilient(
+            ChatOpenAI(
+                model=self.prompt_config["model"],
+                temperature=self.prompt_config["temperature"],
+                max_tokens=self.prompt_config["max_tokens"],
+                max_retries=0,
+            ).with_structured_output(DocumentProcessingResponseAdapter),
+            "cv_processing_agent",
+            config,
+        )
 
     def process_document(self, content: str) -> DocumentProcessingResponse:
         logger.info(self.AGENT_NAME, "Starting CV processing")
@@ -38,7 +44,7 @@ class LangChainCVProcessingAgent:
             ]
 
             raw_response = self.llm.invoke(messages)
-            adapter: DocumentProcessingResponseAdapter = raw_response  # type: ignore
+            adapter: DocumentProcessingResponseAdapter = raw_response
             response = adapter.to_domain()
 
             logger.success(
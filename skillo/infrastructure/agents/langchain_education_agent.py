@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import List, NotRequired, TypedDict
 
 import yaml  # type: ignore
 from langchain.schema import HumanMessage, SystemMessage
@@ -6,6 +6,9 @@ from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
 from skillo.infrastructure.adapters import EducationAnalysisResponseAdapter
+from skillo.infrastructure.agents.agent_failure import failed_result
+from skillo.infrastructure.agents.batch_support import BatchAnalysisSupport
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
 
@@ -22,6 +25,7 @@ class EducationAnalysisResult(TypedDict):
     degree_match: str
     score: float
     explanation: str
+    failed: NotRequired[bool]
 
 
 class LangChainEducationAgent:
@@ -60,11 +64,19 @@ class LangChainEducationAgent:
             )
             raise
 
-        self.llm = ChatOpenAI(
-            model=self.prompt_config["model"],
-            temperature=self.prompt_config["temperature"],
-            max_tokens=self.prompt_config["max_tokens"],
-        ).with_structured_output(EducationAnalysisResponseAdapter)
+        self.llm = resilient(
+            ChatOpenAI(
+                model=self.prompt_config["model"],
+                temperature=self.prompt_config["temperature"],
+                max_tokens=self.prompt_config["max_tokens"],
+                max_retries=0,
+            ).with_structured_output(EducationAnalysisResponseAdapter),
+            "education_agent",
+            config,
+        )
+        self.batch = BatchAnalysisSupport(
+            config, self.prompt_config, EducationAnalysisResponseAdapter
+        )
 
     def analyze_education_match(
         self, cv_content: str, job_content: str
@@ -88,7 +100,7 @@ class LangChainEducationAgent:
             )
 
             raw_response = self.llm.invoke([system_message, user_message])
-            adapter: EducationAnalysisResponseAdapter = raw_response  # type: ignore
+            adapter: EducationAnalysisResponseAdapter = raw_response
             response = adapter.to_domain()
 
             result = {
@@ -115,11 +127,47 @@ class LangChainEducationAgent:
                 self.AGENT_NAME,
                 f"Response validation error: {e}",
             )
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
 
         except Exception as e:
             logger.error(
                 self.AGENT_NAME,
                 f"Unexpected error in education analysis: {str(e)}",
             )
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
+
+    def analyze_education_match_batch(
+        self, cv_contents: List[str], job_content: str
+    ) -> List[EducationAnalysisResult]:
+        """Analyze educational compatibility of several CVs with one job."""
+        logger.info(
+            self.AGENT_NAME,
+            f"Starting batched education analysis of {len(cv_contents)} CVs",
+        )
+
+        try:
+            messages = [
+                SystemMessage(content=self.prompt_config["system_message"]),
+                HumanMessage(
+                    content=self.batch.user_message(cv_contents, job_content)
+                ),
+            ]
+
+            raw_response = self.batch.llm(len(cv_contents)).invoke(messages)
+            results = self.batch.results(
+                raw_response, len(cv_contents), dict(self.DEFAULT_RESPONSE)
+            )
+
+            logger.success(
+                self.AGENT_NAME,
+                "Batched education analysis completed",
+                f"Candidates: {len(results)}",
+            )
+            return results  # type: ignore
+
+        except ValidationError as e:
+            logger.error(self.AGENT_NAME, "Validation error", str(e))
+        except Exception as e:
+            logger.error(self.AGENT_NAME, "Unexpected error", str(e))
+
+        return [failed_result(self.DEFAULT_RESPONSE) for _ in cv_contents]
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import List, NotRequired, TypedDict
 
 import yaml  # type: ignore
 from langchain.schema import HumanMessage, SystemMessage
@@ -6,12 +6,12 @@ from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
 from skillo.infrastructure.adapters import ExperienceAnalysisResponseAdapter
+from skillo.infrastructure.agents.agent_failure import failed_result
+from skillo.infrastructure.agents.batch_support import BatchAnalysisSupport
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
-from skillo.infrastructure.tools import (
-    calculate_years_between_tool,
-    get_current_date_tool,
-)
+from skillo.infrastructure.tools import current_date_text
 
 DEFAULT_EXPERIENCE_LEVEL = "Not specified"
 
@@ -23,6 +23,7 @@ class ExperienceAnalysisResult(TypedDict):
     required_level: str
     score: float
     explanation: str
+    failed: NotRequired[bool]
 
 
 class LangChainExperienceAgent:
@@ -48,12 +49,16 @@ class LangChainExperienceAgent:
             model=self.prompt_config["model"],
             temperature=self.prompt_config["temperature"],
             max_tokens=self.prompt_config["max_tokens"],
+            max_retries=0,
         )
 
-        self.tools = [get_current_date_tool, calculate_years_between_tool]
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
-        self.llm_structured = self.llm.with_structured_output(
-            ExperienceAnalysisResponseAdapter
+        self.llm_structured = resilient(
+            self.llm.with_structured_output(ExperienceAnalysisResponseAdapter),
+            "experience_agent",
+            config,
+        )
+        self.batch = BatchAnalysisSupport(
+            config, self.prompt_config, ExperienceAnalysisResponseAdapter
         )
 
     def analyze_experience_match(
@@ -67,49 +72,15 @@ class LangChainExperienceAgent:
             )
             user_message = HumanMessage(
                 content=self.prompt_config["user_message"].format(
-                    cv_content=cv_content, job_content=job_content
+                    cv_content=cv_content,
+                    job_content=job_content,
                 )
+                + f"\n\n{current_date_text()}"
             )
-
-            messages = [system_message, user_message]
-
-            tool_response = self.llm_with_tools.invoke(messages)
-
-            enhanced_content = str(user_message.content)
-            if (
-                hasattr(tool_response, "tool_calls")
-                and tool_response.tool_calls
-            ):
-                logger.info(self.AGENT_NAME, "Date calculation tools called")
-                for tool_call in tool_response.tool_calls:
-                    if tool_call["name"] == "get_current_date_tool":
-                        tool_result = get_current_date_tool.invoke({})
-                        logger.info(
-                            self.AGENT_NAME,
-                            "Current date retrieved",
-                            str(tool_result),
-                        )
-                        enhanced_content = enhanced_content + (
-                            f"\n\nCurrent date info: {tool_result}"
-                        )
-                    elif tool_call["name"] == "calculate_years_between_tool":
-                        tool_result = calculate_years_between_tool.invoke(
-                            tool_call["args"]
-                        )
-                        logger.info(
-                            self.AGENT_NAME,
-                            "Years calculated",
-                            str(tool_result),
-                        )
-                        enhanced_content = enhanced_content + (
-                            f"\n\nYears calculation: {tool_result}"
-                        )
-
-            user_message = HumanMessage(content=enhanced_content)
             structured_messages = [system_message, user_message]
 
             raw_response = self.llm_structured.invoke(structured_messages)
-            adapter: ExperienceAnalysisResponseAdapter = raw_response  # type: ignore
+            adapter: ExperienceAnalysisResponseAdapter = raw_response
             response = adapter.to_domain()
 
             result = {
@@ -130,7 +101,45 @@ class LangChainExperienceAgent:
 
         except ValidationError as e:
             logger.error(self.AGENT_NAME, "Validation error", str(e))
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
         except Exception as e:
             logger.error(self.AGENT_NAME, "Unexpected error", str(e))
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
+
+    def analyze_experience_match_batch(
+        self, cv_contents: List[str], job_content: str
+    ) -> List[ExperienceAnalysisResult]:
+        logger.info(
+            self.AGENT_NAME,
+            f"Starting batched experience analysis of {len(cv_contents)} CVs",
+        )
+
+        try:
+            system_message = SystemMessage(
+                content=self.prompt_config["system_message"]
+            )
+            user_message = HumanMessage(
+                content=self.batch.user_message(cv_contents, job_content)
+                + f"\n\n{current_date_text()}"
+            )
+
+            raw_response = self.batch.llm(len(cv_contents)).invoke(
+                [system_message, user_message]
+            )
+            results = self.batch.results(
+                raw_response, len(cv_contents), dict(self.DEFAULT_RESPONSE)
+            )
+
+            logger.success(
+                self.AGENT_NAME,
+                "Batched experience analysis completed",
+                f"Candidates: {len(results)}",
+            )
+            return results  # type: ignore
+
+        except ValidationError as e:
+            logger.error(self.AGENT_NAME, "Validation error", str(e))
+        except Exception as e:
+            logger.error(self.AGENT_NAME, "Unexpected error", str(e))
+
+        return [failed_result(self.DEFAULT_RESPONSE) for _ in cv_contents]
@@ -4,6 +4,7 @@ from pydantic import ValidationError
 
 from skillo.domain.schemas import DocumentProcessingResponse
 from skillo.infrastructure.adapters import DocumentProcessingResponseAdapter
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
 
@@ -18,11 +19,16 @@ class LangChainJobProcessingAgent:
         with open(prompt_template, "r", encoding="utf-8") as f:
             self.prompt_config = yaml.safe_load(f)["job_processing"]
 
-        self.llm = ChatOpenAI(
-            model=self.prompt_config["model"],
-            temperature=self.prompt_config["temperature"],
-            max_tokens=self.prompt_config["max_tokens"],
-        ).with_structured_output(DocumentProcessingResponseAdapter)
+        self.llm = resilient(
+            ChatOpenAI(
+                model=self.prompt_config["model"],
+                temperature=self.prompt_config["temperature"],
+                max_tokens=self.prompt_config["max_tokens"],
+                max_retries=0,
+            ).with_structured_output(DocumentProcessingResponseAdapter),
+            "job_processing_agent",
+            config,
+        )
 
     def process_document(self, content: str) -> DocumentProcessingResponse:
         logger.info(self.AGENT_NAME, "Starting job posting processing")
@@ -38,7 +44,7 @@ class LangChainJobProcessingAgent:
             ]
 
             raw_response = self.llm.invoke(messages)
-            adapter: DocumentProcessingResponseAdapter = raw_response  # type: ignore
+            adapter: DocumentProcessingResponseAdapter = raw_response
             response = adapter.to_domain()
 
             logger.success(
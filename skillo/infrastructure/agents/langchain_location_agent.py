@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Any, Dict, List, NotRequired, Optional, TypedDict
 
 import yaml  # type: ignore
 from langchain.schema import HumanMessage, SystemMessage
@@ -6,8 +6,13 @@ from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
 from skillo.infrastructure.adapters import LocationAnalysisResponseAdapter
+from skillo.infrastructure.agents.agent_failure import failed_result
+from skillo.infrastructure.agents.batch_support import BatchAnalysisSupport
+from skillo.infrastructure.agents.location_rules import LocationRuleScorer
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
+from skillo.infrastructure.metrics import metrics
 from skillo.infrastructure.tools import calculate_distance_tool
 
 DEFAULT_REMOTE_STATUS = "Not specified"
@@ -22,6 +27,7 @@ class LocationAnalysisResult(TypedDict):
     commute_feasibility: str
     score: float
     explanation: str
+    failed: NotRequired[bool]
 
 
 class LangChainLocationAgent:
@@ -48,18 +54,44 @@ class LangChainLocationAgent:
             model=self.prompt_config["model"],
             temperature=self.prompt_config["temperature"],
             max_tokens=self.prompt_config["max_tokens"],
+            max_retries=0,
         )
 
         self.tools = [calculate_distance_tool]
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
-        self.llm_structured = self.llm.with_structured_output(
-            LocationAnalysisResponseAdapter
+        self.llm_with_tools = resilient(
+            self.llm.bind_tools(self.tools), "location_agent", config
         )
+        self.llm_structured = resilient(
+            self.llm.with_structured_output(LocationAnalysisResponseAdapter),
+            "location_agent",
+            config,
+        )
+        self.batch = BatchAnalysisSupport(
+            config, self.prompt_config, LocationAnalysisResponseAdapter
+        )
+        self.rule_scorer = LocationRuleScorer()
+
+    def analyze_location_fast_path(
+        self, cv_metadata: Dict[str, Any], job_metadata: Dict[str, Any]
+    ) -> Optional[LocationAnalysisResult]:
+        """Rule-based result for resolvable pairs, None when the LLM is needed."""
+        result = self.rule_scorer.score(cv_metadata, job_metadata)
+        if result is None:
+            return None
+
+        metrics.increment("location_agent.fast_path")
+        logger.success(
+            self.AGENT_NAME,
+            "Analysis completed without LLM",
+            f"Score: {result['score']:.2f}, Distance: {result['distance_km']}",
+        )
+        return result  # type: ignore
 
     def analyze_location_match(
         self, cv_content: str, job_content: str
     ) -> LocationAnalysisResult:
         logger.info(self.AGENT_NAME, "Starting location analysis")
+        metrics.increment("location_agent.llm")
 
         try:
             system_message = SystemMessage(
@@ -71,37 +103,13 @@ class LangChainLocationAgent:
                 )
             )
 
-            messages = [system_message, user_message]
-
-            tool_response = self.llm_with_tools.invoke(messages)
-
-            enhanced_content = str(user_message.content)
-            if (
-                hasattr(tool_response, "tool_calls")
-                and tool_response.tool_calls
-            ):
-                logger.info(
-                    self.AGENT_NAME, "Distance calculation tool called"
-                )
-                for tool_call in tool_response.tool_calls:
-                    if tool_call["name"] == "calculate_distance_tool":
-                        tool_result = calculate_distance_tool.invoke(
-                            tool_call["args"]
-                        )
-                        logger.info(
-                            self.AGENT_NAME,
-                            "Distance calculated",
-                            str(tool_result),
-                        )
-                        enhanced_content = enhanced_content + (
-                            f"\n\nDistance calculation result: {tool_result}"
-                        )
-
-            user_message = HumanMessage(content=enhanced_content)
+            user_message = self._with_tool_results(
+                system_message, user_message
+            )
             structured_messages = [system_message, user_message]
 
             raw_response = self.llm_structured.invoke(structured_messages)
-            adapter: LocationAnalysisResponseAdapter = raw_response  # type: ignore
+            adapter: LocationAnalysisResponseAdapter = raw_response
             response = adapter.to_domain()
 
             result = {
@@ -123,7 +131,74 @@ class LangChainLocationAgent:
 
         except ValidationError as e:
             logger.error(self.AGENT_NAME, "Validation error", str(e))
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
+        except Exception as e:
+            logger.error(self.AGENT_NAME, "Unexpected error", str(e))
+            return failed_result(self.DEFAULT_RESPONSE)
+
+    def analyze_location_match_batch(
+        self, cv_contents: List[str], job_content: str
+    ) -> List[LocationAnalysisResult]:
+        logger.info(
+            self.AGENT_NAME,
+            f"Starting batched location analysis of {len(cv_contents)} CVs",
+        )
+        metrics.increment("location_agent.llm", len(cv_contents))
+
+        try:
+            system_message = SystemMessage(
+                content=self.prompt_config["system_message"]
+            )
+            user_message = self._with_tool_results(
+                system_message,
+                HumanMessage(
+                    content=self.batch.user_message(cv_contents, job_content)
+                ),
+            )
+
+            raw_response = self.batch.llm(len(cv_contents)).invoke(
+                [system_message, user_message]
+            )
+            results = self.batch.results(
+                raw_response, len(cv_contents), dict(self.DEFAULT_RESPONSE)
+            )
+
+            logger.success(
+                self.AGENT_NAME,
+                "Batched location analysis completed",
+                f"Candidates: {len(results)}",
+            )
+            return results  # type: ignore
+
+        except ValidationError as e:
+            logger.error(self.AGENT_NAME, "Validation error", str(e))
         except Exception as e:
             logger.error(self.AGENT_NAME, "Unexpected error", str(e))
-            return self.DEFAULT_RESPONSE
+
+        return [failed_result(self.DEFAULT_RESPONSE) for _ in cv_contents]
+
+    def _with_tool_results(
+        self, system_message: SystemMessage, user_message: HumanMessage
+    ) -> HumanMessage:
+        tool_response = self.llm_with_tools.invoke(
+            [system_message, user_message]
+        )
+
+        enhanced_content = str(user_message.content)
+        if hasattr(tool_response, "tool_calls") and tool_response.tool_calls:
+            logger.info(self.AGENT_NAME, "Distance calculation tool called")
+            for tool_call in tool_response.tool_calls:
+                if tool_call["name"] == "calculate_distance_tool":
+                    tool_result = calculate_distance_tool.invoke(
+                        tool_call["args"]
+                    )
+                    logger.info(
+                        self.AGENT_NAME,
+                        "Distance calculated",
+                        str(tool_result),
+                    )
+                    enhanced_content = enhanced_content + (
+                        f"\n\nDistance calculation result: {tool_result}"
+                    )
+
+        return HumanMessage(content=enhanced_content)
@@ -7,6 +7,7 @@ from skillo.domain.schemas import (
     NormalizationResponse,
 )
 from skillo.infrastructure.adapters import NormalizationResponseAdapter
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
 
@@ -21,11 +22,16 @@ class LangChainNormalizationAgent:
         with open(prompt_template, "r", encoding="utf-8") as f:
             self.prompt_config = yaml.safe_load(f)["normalization"]
 
-        self.llm = ChatOpenAI(
-            model=self.prompt_config["model"],
-            temperature=self.prompt_config["temperature"],
-            max_tokens=self.prompt_config["max_tokens"],
-        ).with_structured_output(NormalizationResponseAdapter)
+        self.llm = resilient(
+            ChatOpenAI(
+                model=self.prompt_config["model"],
+                temperature=self.prompt_config["temperature"],
+                max_tokens=self.prompt_config["max_tokens"],
+                max_retries=0,
+            ).with_structured_output(NormalizationResponseAdapter),
+            "normalization_agent",
+            config,
+        )
 
     def normalize_cv_data(
         self, cv_response: DocumentProcessingResponse
@@ -45,6 +51,11 @@ class LangChainNormalizationAgent:
                     if cv_response.experience
                     else "Not specified"
                 ),
+                education=(
+                    "; ".join(cv_response.education)
+                    if cv_response.education
+                    else "Not specified"
+                ),
                 location=cv_response.location,
                 preferences=(
                     "; ".join(cv_response.preferences)
@@ -59,7 +70,7 @@ class LangChainNormalizationAgent:
             ]
 
             raw_response = self.llm.invoke(messages)
-            adapter: NormalizationResponseAdapter = raw_response  # type: ignore
+            adapter: NormalizationResponseAdapter = raw_response
             response = adapter.to_domain()
 
             logger.success(
@@ -97,6 +108,11 @@ class LangChainNormalizationAgent:
                     if job_response.experience
                     else "Not specified"
                 ),
+                education=(
+                    "; ".join(job_response.education)
+                    if job_response.education
+                    else "Not specified"
+                ),
                 location=job_response.location,
                 culture_preferences=(
                     "; ".join(job_response.preferences)
@@ -111,7 +127,7 @@ class LangChainNormalizationAgent:
             ]
 
             raw_response = self.llm.invoke(messages)
-            adapter: NormalizationResponseAdapter = raw_response  # type: ignore
+            adapter: NormalizationResponseAdapter = raw_response
             response = adapter.to_domain()
 
             logger.success(
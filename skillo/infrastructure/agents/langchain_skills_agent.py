@@ -1,4 +1,4 @@
-from typing import List, TypedDict
+from typing import List, NotRequired, TypedDict
 
 import yaml  # type: ignore
 from langchain.schema import HumanMessage, SystemMessage
@@ -6,6 +6,9 @@ from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
 from skillo.infrastructure.adapters import SkillsAnalysisResponseAdapter
+from skillo.infrastructure.agents.agent_failure import failed_result
+from skillo.infrastructure.agents.batch_support import BatchAnalysisSupport
+from skillo.infrastructure.concurrency.resilience import resilient
 from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.logger import logger
 
@@ -16,6 +19,7 @@ class SkillsAnalysisResult(TypedDict):
     matched_skills: List[str]
     score: float
     explanation: str
+    failed: NotRequired[bool]
 
 
 class LangChainSkillsAgent:
@@ -36,11 +40,19 @@ class LangChainSkillsAgent:
         with open(prompt_template, "r", encoding="utf-8") as f:
             self.prompt_config = yaml.safe_load(f)["skills_analysis"]
 
-        self.llm = ChatOpenAI(
-            model=self.prompt_config["model"],
-            temperature=self.prompt_config["temperature"],
-            max_tokens=self.prompt_config["max_tokens"],
-        ).with_structured_output(SkillsAnalysisResponseAdapter)
+        self.llm = resilient(
+            ChatOpenAI(
+                model=self.prompt_config["model"],
+                temperature=self.prompt_config["temperature"],
+                max_tokens=self.prompt_config["max_tokens"],
+                max_retries=0,
+            ).with_structured_output(SkillsAnalysisResponseAdapter),
+            "skills_agent",
+            config,
+        )
+        self.batch = BatchAnalysisSupport(
+            config, self.prompt_config, SkillsAnalysisResponseAdapter
+        )
 
     def analyze_skills_match(
         self, cv_content: str, job_content: str
@@ -60,7 +72,7 @@ class LangChainSkillsAgent:
             formatted_prompt = [system_message, user_message]
 
             raw_response = self.llm.invoke(formatted_prompt)
-            adapter: SkillsAnalysisResponseAdapter = raw_response  # type: ignore
+            adapter: SkillsAnalysisResponseAdapter = raw_response
             response = adapter.to_domain()
 
             result: SkillsAnalysisResult = {
@@ -80,7 +92,42 @@ class LangChainSkillsAgent:
 
         except ValidationError as e:
             logger.error(self.AGENT_NAME, "Validation error", str(e))
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
         except Exception as e:
             logger.error(self.AGENT_NAME, "Unexpected error", str(e))
-            return self.DEFAULT_RESPONSE
+            return failed_result(self.DEFAULT_RESPONSE)
+
+    def analyze_skills_match_batch(
+        self, cv_contents: List[str], job_content: str
+    ) -> List[SkillsAnalysisResult]:
+        logger.info(
+            self.AGENT_NAME,
+            f"Starting batched skills analysis of {len(cv_contents)} CVs",
+        )
+
+        try:
+            messages = [
+                SystemMessage(content=self.prompt_config["system_message"]),
+                HumanMessage(
+                    content=self.batch.user_message(cv_contents, job_content)
+                ),
+            ]
+
+            raw_response = self.batch.llm(len(cv_contents)).invoke(messages)
+            results = self.batch.results(
+                raw_response, len(cv_contents), dict(self.DEFAULT_RESPONSE)
+            )
+
+            logger.success(
+                self.AGENT_NAME,
+                "Batched skills analysis completed",
+                f"Candidates: {len(results)}",
+            )
+            return results  # type: ignore
+
+        except ValidationError as e:
+            logger.error(self.AGENT_NAME, "Validation error", str(e))
+        except Exception as e:
+            logger.error(self.AGENT_NAME, "Unexpected error", str(e))
+
+        return [failed_result(self.DEFAULT_RESPONSE) for _ in cv_contents]
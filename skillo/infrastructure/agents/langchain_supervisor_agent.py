@@ -1,9 +1,9 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import yaml  # type: ignore
 from langchain_openai import ChatOpenAI
 
-from skillo.domain.entities import Document
+from skillo.domain.entities import AnalysisProfile, Document
 from skillo.domain.enums import MatchRecommendation
 from skillo.domain.exceptions import SkilloAgentError
 from skillo.domain.services import SupervisorAgentInterface
@@ -31,6 +31,14 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
 
     AGENT_NAME = "SUPERVISOR AGENT"
 
+    PROFILE_FIELDS = {
+        "skills": ("skills", "certifications"),
+        "location": ("location", "remote_preference"),
+        "experience": ("total_years", "employment_spans", "level", "skills"),
+        "preferences": ("preferences", "remote_preference", "level"),
+        "education": ("degree", "field_of_study", "certifications"),
+    }
+
     def __init__(self, config: Config):
         """Initialize with config."""
         prompts_dir = config.PROMPTS_DIR
@@ -69,16 +77,7 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
 
     def _get_recommendation(self, score: float) -> str:
         """Convert score to recommendation enum."""
-        if score >= 0.8:
-            return MatchRecommendation.STRONG_MATCH.value
-        elif score >= 0.6:
-            return MatchRecommendation.GOOD_MATCH.value
-        elif score >= 0.4:
-            return MatchRecommendation.FAIR_MATCH.value
-        elif score >= 0.2:
-            return MatchRecommendation.POOR_MATCH.value
-        else:
-            return MatchRecommendation.NO_MATCH.value
+        return MatchRecommendation.from_score(score).value
 
     def analyze_match(
         self, cv_document: Document, job_document: Document
@@ -105,32 +104,95 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
             logger.error(self.AGENT_NAME, "Document analysis error", error_msg)
             raise SkilloAgentError(f"Document analysis failed: {error_msg}")
 
+    def analyze_match_batch(
+        self, cv_documents: List[Document], job_document: Document
+    ) -> List[Dict[str, Any]]:
+        """Analyze several CVs against one job with batched agent calls.
+
+        Candidates with a failed or missing batched agent result are
+        analysed again one by one.
+        """
+        logger.info(
+            self.AGENT_NAME,
+            f"Starting batched match analysis of {len(cv_documents)} CVs",
+        )
+
+        try:
+            batch_results = self._execute_all_agents_batch(
+                cv_documents, job_document
+            )
+
+            agent_weights = self.get_agent_weights()
+            final_results = [
+                self._calculate_final_result(results, agent_weights)
+                for results in batch_results
+            ]
+            retries = [
+                index
+                for index, result in enumerate(final_results)
+                if result["degraded"]
+            ]
+            if retries:
+                logger.warning(
+                    self.AGENT_NAME,
+                    f"Re-analysing {len(retries)} candidates one by one",
+                )
+            for index in retries:
+                final_results[index] = self.analyze_match(
+                    cv_documents[index], job_document
+                )
+
+            logger.success(
+                self.AGENT_NAME,
+                "Batched analysis completed",
+                f"Candidates: {len(final_results)}",
+            )
+
+            return final_results
+
+        except Exception as e:
+            error_msg = f"Error in batched document analysis: {str(e)}"
+            logger.error(self.AGENT_NAME, "Document analysis error", error_msg)
+            raise SkilloAgentError(f"Document analysis failed: {error_msg}")
+
     def _execute_all_agents(
         self, cv_document: Document, job_document: Document
     ) -> Dict[str, Any]:
         """Execute all analysis agents directly."""
         results: Dict[str, Any] = {}
+        cv_profile = AnalysisProfile.from_metadata(cv_document.metadata)
+        job_profile = AnalysisProfile.from_metadata(job_document.metadata)
+
+        def inputs(agent: str) -> tuple[str, str]:
+            return (
+                self._agent_input(cv_document, cv_profile, agent),
+                self._agent_input(job_document, job_profile, agent),
+            )
 
         try:
             results["skills"] = self.skills_agent.analyze_skills_match(
-                cv_document.content, job_document.content
+                *inputs("skills")
             )
-            results["location"] = self.location_agent.analyze_location_match(
-                cv_document.content, job_document.content
+            results[
+                "location"
+            ] = self.location_agent.analyze_location_fast_path(
+                cv_document.metadata, job_document.metadata
+            ) or self.location_agent.analyze_location_match(
+                *inputs("location")
             )
             results["experience"] = (
                 self.experience_agent.analyze_experience_match(
-                    cv_document.content, job_document.content
+                    *inputs("experience")
                 )
             )
             results["preferences"] = (
                 self.preferences_agent.analyze_preferences_match(
-                    cv_document.content, job_document.content
+                    *inputs("preferences")
                 )
             )
             results["education"] = (
                 self.education_agent.analyze_education_match(
-                    cv_document.content, job_document.content
+                    *inputs("education")
                 )
             )
         except Exception as e:
@@ -139,6 +201,93 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
 
         return results
 
+    def _execute_all_agents_batch(
+        self, cv_documents: List[Document], job_document: Document
+    ) -> List[Dict[str, Any]]:
+        """Execute every agent once for the whole candidate batch."""
+        job_profile = AnalysisProfile.from_metadata(job_document.metadata)
+        cv_profiles = [
+            AnalysisProfile.from_metadata(cv_document.metadata)
+            for cv_document in cv_documents
+        ]
+
+        def inputs(agent: str) -> tuple[List[str], str]:
+            return (
+                [
+                    self._agent_input(cv_document, cv_profile, agent)
+                    for cv_document, cv_profile in zip(
+                        cv_documents, cv_profiles
+                    )
+                ],
+                self._agent_input(job_document, job_profile, agent),
+            )
+
+        agent_results: Dict[str, List[Any]] = {}
+        try:
+            agent_results["skills"] = (
+                self.skills_agent.analyze_skills_match_batch(*inputs("skills"))
+            )
+            agent_results["location"] = self._location_batch(
+                cv_documents, job_document, *inputs("location")
+            )
+            agent_results["experience"] = (
+                self.experience_agent.analyze_experience_match_batch(
+                    *inputs("experience")
+                )
+            )
+            agent_results["preferences"] = (
+                self.preferences_agent.analyze_preferences_match_batch(
+                    *inputs("preferences")
+                )
+            )
+            agent_results["education"] = (
+                self.education_agent.analyze_education_match_batch(
+                    *inputs("education")
+                )
+            )
+        except Exception as e:
+            logger.error(self.AGENT_NAME, "Agent execution failed", str(e))
+            raise
+
+        return [
+            {agent: results[index] for agent, results in agent_results.items()}
+            for index in range(len(cv_documents))
+        ]
+
+    def _location_batch(
+        self,
+        cv_documents: List[Document],
+        job_document: Document,
+        cv_inputs: List[str],
+        job_input: str,
+    ) -> List[Any]:
+        """Fast-path location results, one batched call for the rest."""
+        results = [
+            self.location_agent.analyze_location_fast_path(
+                cv_document.metadata, job_document.metadata
+            )
+            for cv_document in cv_documents
+        ]
+        pending = [index for index, result in enumerate(results) if not result]
+        if pending:
+            llm_results = self.location_agent.analyze_location_match_batch(
+                [cv_inputs[index] for index in pending], job_input
+            )
+            for index, result in zip(pending, llm_results):
+                results[index] = result
+        return results
+
+    def _agent_input(
+        self,
+        document: Document,
+        profile: AnalysisProfile | None,
+        agent: str,
+    ) -> str:
+        """Profile fields an agent compares, raw content when unprofiled."""
+        if profile is None:
+            return document.content
+        return profile.to_prompt_text(*self.PROFILE_FIELDS[agent])
+
     def _calculate_final_result(
         self, results: Dict[str, Any], agent_weights: Dict[str, float]
     ) -> Dict[str, Any]:
@@ -165,6 +314,11 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
         )
 
         recommendation = self._get_recommendation(weighted_final_score)
+        failed_agents = [
+            agent_name
+            for agent_name, result in results.items()
+            if isinstance(result, dict) and result.get("failed")
+        ]
 
         explanations = []
         for agent_name, result in results.items():
@@ -180,4 +334,6 @@ class LangChainSupervisorAgent(SupervisorAgentInterface):
             "explanation": "; ".join(explanations),
             "agent_weights": agent_weights,
             "detailed_results": results,
+            "failed_agents": failed_agents,
+            "degraded": bool(failed_agents),
         }
@@ -0,0 +1,131 @@
+from typing import Any, Callable, Dict, Optional
+
+from skillo.infrastructure.tools import distance_between
+
+UNKNOWN_VALUES = {"", "not specified", "unknown", "n/a", "none"}
+
+REMOTE_WORK_LABELS = {
+    "remote": "Yes",
+    "hybrid": "Hybrid",
+    "on-site": "No",
+    "onsite": "No",
+}
+
+
+class LocationRuleScorer:
+    """Scores unambiguous location pairs without an LLM call.
+
+    Uses the normalized ``location`` and ``remote_work_status`` metadata
+    and the scoring bands of the location prompt. Returns None whenever
+    the pair needs judgement, so the caller falls back to the agent.
+    """
+
+    NEAR_KM = 50
+    COMMUTE_KM = 100
+    HYBRID_KM = 500
+    RELOCATION_KM = 500
+
+    def __init__(
+        self,
+        distance_fn: Callable[[str, str], Optional[float]] = distance_between,
+    ) -> None:
+        self._distance_fn = distance_fn
+
+    def score(
+        self, cv_metadata: Dict[str, Any], job_metadata: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Location result for a resolvable pair, None otherwise."""
+        cv_location = self._known(cv_metadata.get("location"))
+        job_location = self._known(job_metadata.get("location"))
+        job_remote = str(job_metadata.get("remote_work_status", "")).lower()
+        remote_work = REMOTE_WORK_LABELS.get(job_remote, "Not specified")
+
+        if job_remote == "remote":
+            return self._result(
+                cv_location,
+                job_location,
+                remote_work,
+                "Not calculated",
+                1.0,
+                "Excellent",
+                "Fully remote role, candidate location does not restrict it",
+            )
+
+        if not cv_location or not job_location:
+            return None
+
+        if cv_location.lower() == job_location.lower():
+            return self._result(
+                cv_location,
+                job_location,
+                remote_work,
+                "0.0",
+                1.0,
+                "Excellent",
+                "Candidate is based in the job's city",
+            )
+
+        try:
+            distance_km = self._distance_fn(cv_location, job_location)
+        except Exception:
+            return None
+        if distance_km is None:
+            return None
+
+        band = self._band(distance_km, job_remote)
+        if band is None:
+            return None
+
+        score, feasibility, explanation = band
+        return self._result(
+            cv_location,
+            job_location,
+            remote_work,
+            f"{distance_km:.1f}",
+            score,
+            feasibility,
+            f"{distance_km:.0f} km apart: {explanation}",
+        )
+
+    def _band(
+        self, distance_km: float, job_remote: str
+    ) -> Optional[tuple[float, str, str]]:
+        """Score band for a distance, None for ambiguous distances."""
+        if distance_km < self.NEAR_KM:
+            return 0.95, "Excellent", "easy daily commute"
+        if distance_km < self.COMMUTE_KM:
+            return 0.8, "Good", "feasible daily commute"
+        if job_remote == "hybrid" and distance_km < self.HYBRID_KM:
+            return 0.65, "Fair", "commute feasible for hybrid attendance"
+        if job_remote in ("on-site", "onsite") and (
+            distance_km >= self.RELOCATION_KM
+        ):
+            return 0.1, "Very Poor", "on-site role requires relocation"
+        return None
+
+    @staticmethod
+    def _known(value: Any) -> str:
+        """Location text, empty when unknown."""
+        text = str(value or "").strip()
+        return "" if text.lower() in UNKNOWN_VALUES else text
+
+    @staticmethod
+    def _result(
+        cv_location: str,
+        job_location: str,
+        remote_work: str,
+        distance_km: str,
+        score: float,
+        feasibility: str,
+        explanation: str,
+    ) -> Dict[str, Any]:
+        """Result in the location agent's shape."""
+        return {
+            "candidate_location": cv_location or "Not specified",
+            "job_location": job_location or "Not specified",
+            "remote_work": remote_work,
+            "distance_km": distance_km,
+            "commute_feasibility": feasibility,
+            "score": score,
+            "explanation": explanation,
+        }
@@ -0,0 +1,286 @@
+import atexit
+import itertools
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from skillo.domain.entities import Document
+from skillo.domain.exceptions import SkilloAgentError
+from skillo.domain.services import SupervisorAgentInterface
+from skillo.infrastructure.concurrency.circuit_breaker import CircuitBreaker
+from skillo.infrastructure.config.settings import Config
+from skillo.infrastructure.logger import logger
+
+Request = Tuple[int, str, Tuple[Any, ...]]
+Response = Tuple[int, bool, Any]
+Outcome = Tuple[bool, Any]
+SupervisorFactory = Callable[[], SupervisorAgentInterface]
+
+
+def build_langchain_supervisor() -> SupervisorAgentInterface:
+    """Supervisor with its own agents, configured from the environment."""
+    from skillo.infrastructure.agents.langchain_supervisor_agent import (
+        LangChainSupervisorAgent,
+    )
+
+    return LangChainSupervisorAgent(Config())
+
+
+def _serve_shard(
+    requests: "multiprocessing.Queue[Optional[Request]]",
+    responses: "multiprocessing.Queue[Response]",
+    threads: int,
+    supervisor_factory: SupervisorFactory,
+) -> None:
+    """Worker process loop: analyse requests on a local thread pool.
+
+    The process builds its own supervisor, agents, caches and LLM
+    circuit; analyses it could not run come back with failed agents.
+    """
+    supervisor = supervisor_factory()
+
+    def handle(request_id: int, method: str, args: Tuple[Any, ...]) -> None:
+        try:
+            result = getattr(supervisor, method)(*args)
+            ok = True
+        except Exception as e:
+            result, ok = f"{type(e).__name__}: {e}", False
+        responses.put((request_id, ok, result))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            executor.submit(handle, *request)
+
+
+class _Shard:
+    """One worker process with its request and response queues."""
+
+    POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        context: Any,
+        index: int,
+        threads: int,
+        supervisor_factory: SupervisorFactory,
+    ) -> None:
+        self.requests = context.Queue()
+        self.responses = context.Queue()
+        self.process: BaseProcess = context.Process(
+            target=_serve_shard,
+            args=(self.requests, self.responses, threads, supervisor_factory),
+            name=f"skillo-shard-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        self._pending: Dict[int, Future[Outcome]] = {}
+        self._lock = threading.Lock()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name=f"skillo-shard-{index}-results"
+        )
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    @property
+    def outstanding(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(
+        self, request_id: int, method: str, args: Tuple[Any, ...]
+    ) -> Future[Outcome]:
+        """Send a request; the future resolves to the raw response."""
+        future: Future[Outcome] = Future()
+        with self._lock:
+            self._pending[request_id] = future
+        self.requests.put((request_id, method, args))
+        return future
+
+    def close(self) -> None:
+        """Ask the process to exit, killing it if it does not."""
+        if self.alive:
+            self.requests.put(None)
+            self.process.join(timeout=5)
+        if self.alive:
+            self.process.terminate()
+
+    def kill(self) -> None:
+        """Terminate a stuck process; its waiting requests fail."""
+        self.process.terminate()
+        self.process.join(timeout=5)
+
+    def _dispatch(self) -> None:
+        """Resolve futures from responses; fail them if the process dies."""
+        while True:
+            try:
+                request_id, ok, result = self.responses.get(
+                    timeout=self.POLL_SECONDS
+                )
+            except queue.Empty:
+                if self.alive:
+                    continue
+                self._fail_pending()
+                return
+
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future:
+                future.set_result((ok, result))
+
+    def _fail_pending(self) -> None:
+        """Fail every waiting request after the process exited."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(
+                SkilloAgentError("Matching worker process exited")
+            )
+
+
+class ProcessShardedSupervisorAgent(SupervisorAgentInterface):
+    """Supervisor running analyses in a set of worker processes.
+
+    Prompt formatting, structured-output parsing and validation then run
+    on several cores instead of under one interpreter lock. Each request
+    goes to the shard with the fewest outstanding requests; a shard that
+    dies or does not answer within the timeout is replaced on the next
+    request. Only such shard failures count against the circuit breaker;
+    analyses come back as the worker produced them, failed agents
+    included, for the caller to judge.
+    """
+
+    AGENT_NAME = "PROCESS SHARDS"
+
+    def __init__(
+        self,
+        shard_count: int,
+        threads_per_shard: int = 4,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        supervisor_factory: SupervisorFactory = build_langchain_supervisor,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize; worker processes start on first use.
+
+        The factory must be a module-level callable so worker processes
+        can import it.
+        """
+        self._shard_count = max(1, shard_count)
+        self._threads_per_shard = max(1, threads_per_shard)
+        self._circuit_breaker = circuit_breaker
+        self._supervisor_factory = supervisor_factory
+        self._timeout = timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._shards: List[Optional[_Shard]] = [None] * self._shard_count
+        self._request_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def analyze_match(
+        self, cv_document: Document, job_document: Document
+    ) -> Dict[str, Any]:
+        """Analyze a CV-job pair in a worker process."""
+        result: Dict[str, Any] = self._call(
+            "analyze_match", cv_document, job_document
+        )
+        return result
+
+    def analyze_match_batch(
+        self, cv_documents: List[Document], job_document: Document
+    ) -> List[Dict[str, Any]]:
+        """Analyze several CVs against one job in a worker process."""
+        results: List[Dict[str, Any]] = self._call(
+            "analyze_match_batch", cv_documents, job_document
+        )
+        return results
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            shards, self._shards = self._shards, [None] * self._shard_count
+        for shard in shards:
+            if shard:
+                shard.close()
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Run a supervisor method in the least loaded shard."""
+        shard, request_id = self._next_shard()
+        future = shard.submit(request_id, method, args)
+        try:
+            ok, result = future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            logger.warning(
+                self.AGENT_NAME,
+                f"No answer within {self._timeout:g}s, stopping the shard",
+            )
+            shard.kill()
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
+            raise SkilloAgentError(
+                f"Document analysis timed out after {self._timeout:g}s"
+            )
+        except SkilloAgentError:
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
+            raise
+
+        if not ok:
+            raise SkilloAgentError(f"Document analysis failed: {result}")
+        return result
+
+    def _next_shard(self) -> Tuple[_Shard, int]:
+        """Least loaded live shard, starting or replacing shards lazily."""
+        with self._lock:
+            for index, shard in enumerate(self._shards):
+                if shard is None or not shard.alive:
+                    if shard is not None:
+                        logger.warning(
+                            self.AGENT_NAME, f"Restarting shard {index}"
+                        )
+                    self._shards[index] = _Shard(
+                        self._context,
+                        index,
+                        self._threads_per_shard,
+                        self._supervisor_factory,
+                    )
+            live = [shard for shard in self._shards if shard is not None]
+            return (
+                min(live, key=lambda shard: shard.outstanding),
+                next(self._request_ids),
+            )
+
+
+_sharded_supervisor: Optional[ProcessShardedSupervisorAgent] = None
+_sharded_supervisor_lock = threading.Lock()
+
+
+def get_process_sharded_supervisor(
+    shard_count: int,
+    threads_per_shard: int,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    timeout: Optional[float] = None,
+) -> ProcessShardedSupervisorAgent:
+    """Process-wide sharded supervisor shared by every session.
+
+    The first call fixes the shard layout; workers stop at exit.
+    """
+    global _sharded_supervisor
+    with _sharded_supervisor_lock:
+        if _sharded_supervisor is None:
+            _sharded_supervisor = ProcessShardedSupervisorAgent(
+                shard_count,
+                threads_per_shard,
+                circuit_breaker,
+                timeout=timeout,
+            )
+            atexit.register(_sharded_supervisor.close)
+        return _sharded_supervisor
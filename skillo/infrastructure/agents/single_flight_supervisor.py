@@ -0,0 +1,51 @@
+import copy
+from typing import Any, Dict, List
+
+from skillo.domain.entities import Document, MatchRecord
+from skillo.domain.services import SupervisorAgentInterface
+from skillo.infrastructure.concurrency.single_flight import (
+    SingleFlight,
+    text_key,
+)
+
+
+class SingleFlightSupervisorAgent(SupervisorAgentInterface):
+    """Supervisor sharing in-flight analyses of identical requests.
+
+    Requests are keyed by the stored-match fingerprint of each pair
+    (contents and analysis profiles), so two sessions matching the same
+    CV and job at once pay for one analysis. Each caller gets its own copy of the result.
+    """
+
+    def __init__(
+        self, supervisor: SupervisorAgentInterface, flights: SingleFlight
+    ) -> None:
+        """Initialize with the supervisor doing the analyses."""
+        self.supervisor = supervisor
+        self.flights = flights
+
+    def analyze_match(
+        self, cv_document: Document, job_document: Document
+    ) -> Dict[str, Any]:
+        """Analyze a pair unless the same pair is already being analyzed."""
+        result = self.flights.do(
+            ("pair", MatchRecord.fingerprint_for(cv_document, job_document)),
+            lambda: self.supervisor.analyze_match(cv_document, job_document),
+        )
+        return copy.deepcopy(result)
+
+    def analyze_match_batch(
+        self, cv_documents: List[Document], job_document: Document
+    ) -> List[Dict[str, Any]]:
+        """Analyze a batch unless the same batch is already in flight."""
+        fingerprints = [
+            MatchRecord.fingerprint_for(cv_document, job_document)
+            for cv_document in cv_documents
+        ]
+        results = self.flights.do(
+            ("batch", text_key(*fingerprints)),
+            lambda: self.supervisor.analyze_match_batch(
+                cv_documents, job_document
+            ),
+        )
+        return copy.deepcopy(results)
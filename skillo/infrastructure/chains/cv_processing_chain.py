@@ -17,6 +17,7 @@ from skillo.infrastructure.agents.langchain_normalization_agent import (
     LangChainNormalizationAgent,
 )
 from skillo.infrastructure.logger import logger
+from skillo.infrastructure.tools import summarize_experience
 
 
 class LangChainCVProcessingChain:
@@ -99,12 +100,18 @@ class LangChainCVProcessingChain:
 
     def _build_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Build CV document using injected DocumentBuilder."""
+        experience = data["processing_response"].experience
+        employment_spans, total_years = summarize_experience(
+            experience if isinstance(experience, list) else []
+        )
         document = self._document_builder.build_cv_document(
             doc_id=data["doc_id"],
             filename=data["filename"],
             processing_response=data["processing_response"],
             normalization_response=data["normalization_response"],
             profile=data["profile"],
+            employment_spans=employment_spans,
+            total_years=total_years if employment_spans else None,
         )
 
         return {**data, "document": document}
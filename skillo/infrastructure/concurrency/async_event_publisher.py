@@ -0,0 +1,202 @@
+import itertools
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type
+
+from skillo.domain.events import BaseEvent, DomainEventPublisher, EventHandler
+from skillo.infrastructure.logger import logger
+
+QueuedEvent = Tuple[float, BaseEvent]
+
+
+class AsyncEventPublisher(DomainEventPublisher):
+    """Event publisher handing events to a dispatcher thread.
+
+    ``publish`` only enqueues, so slow handlers no longer hold up uploads
+    and matching. The dispatcher takes up to ``max_batch`` queued events
+    at a time; a handler with a ``handle_batch`` method receives its share
+    of a batch in one call, others get one ``handle`` call per event. A
+    failing handler is logged and does not affect the others. When the
+    queue stays full for ``publish_timeout`` seconds the event is dropped.
+    Inline subscribers still run on the publishing thread. Each instance
+    gets a process-unique ``instance_id`` to key its stats.
+    """
+
+    LAG_WINDOW = 200
+
+    _instance_ids = itertools.count(1)
+
+    def __init__(
+        self,
+        max_queue: int = 1000,
+        max_batch: int = 50,
+        publish_timeout: float = 1.0,
+    ) -> None:
+        """Initialize with queue bound, batch size and publish timeout."""
+        super().__init__()
+        self.instance_id = next(self._instance_ids)
+        self._queue: "queue.Queue[QueuedEvent]" = queue.Queue(max_queue)
+        self._max_batch = max(1, max_batch)
+        self._publish_timeout = publish_timeout
+        self._inline_handlers: Dict[Type[BaseEvent], List[EventHandler]] = {}
+        self._lag_ms: Deque[float] = deque(maxlen=self.LAG_WINDOW)
+        self._counts = {
+            "published": 0,
+            "dropped": 0,
+            "batches": 0,
+            "handler_errors": 0,
+        }
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        event_type: Type[BaseEvent],
+        handler: EventHandler,
+        inline: bool = False,
+    ) -> None:
+        """Subscribe handler; inline handlers run on the publishing thread."""
+        if not inline:
+            super().subscribe(event_type, handler)
+            return
+        with self._lock:
+            self._inline_handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: BaseEvent) -> None:
+        """Run inline handlers, then queue the event for the others."""
+        with self._lock:
+            inline_handlers = list(self._inline_handlers.get(type(event), []))
+        for handler in inline_handlers:
+            self._deliver(handler, [event])
+
+        if not self.handlers_for(type(event)):
+            return
+
+        self._ensure_worker()
+        try:
+            self._queue.put(
+                (time.monotonic(), event), timeout=self._publish_timeout
+            )
+        except queue.Full:
+            self._count("dropped")
+            logger.warning(
+                "EVENT PUBLISHER",
+                f"Event queue full, dropped {event.event_type}",
+            )
+            return
+        self._count("published")
+
+    def clear(self) -> None:
+        """Clear all subscriptions, inline ones included."""
+        super().clear()
+        with self._lock:
+            self._inline_handlers.clear()
+
+    def wait_until_idle(self) -> None:
+        """Block until every queued event has been handled."""
+        self._queue.join()
+
+    def stats(self) -> Dict[str, float]:
+        """Queue length, event counts and recent publish-to-handle lag."""
+        with self._lock:
+            lag_ms = sorted(self._lag_ms)
+            values: Dict[str, float] = dict(self._counts)
+        values["queued"] = self._queue.qsize()
+        values["avg_lag_ms"] = sum(lag_ms) / len(lag_ms) if lag_ms else 0.0
+        values["p95_lag_ms"] = (
+            lag_ms[int(len(lag_ms) * 0.95) - 1]
+            if len(lag_ms) >= 20
+            else max(lag_ms, default=0.0)
+        )
+        return values
+
+    def _ensure_worker(self) -> None:
+        """Start the daemon dispatcher on first use."""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="event-dispatcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Dispatch queued events in batches, forever."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _dispatch(self, batch: List[QueuedEvent]) -> None:
+        """Deliver a batch, grouping each handler's events in order.
+
+        An event's lag is recorded once the last handler it went to has
+        returned, so it covers the time spent in earlier handlers.
+        """
+        deliveries: Dict[int, Tuple[EventHandler, List[BaseEvent]]] = {}
+        handler_keys: List[List[int]] = []
+        for _, event in batch:
+            keys = []
+            for handler in self.handlers_for(type(event)):
+                deliveries.setdefault(id(handler), (handler, []))[1].append(
+                    event
+                )
+                keys.append(id(handler))
+            handler_keys.append(keys)
+
+        position = {key: index for index, key in enumerate(deliveries)}
+        handled_after: Dict[int, List[float]] = defaultdict(list)
+        for (published_at, _), keys in zip(batch, handler_keys):
+            last = max((position[key] for key in keys), default=-1)
+            handled_after[last].append(published_at)
+
+        self._count("batches")
+        self._record_lag(handled_after[-1])
+        for index, (handler, events) in enumerate(deliveries.values()):
+            self._deliver(handler, events)
+            self._record_lag(handled_after[index])
+
+    def _deliver(self, handler: EventHandler, events: List[BaseEvent]) -> None:
+        """Hand events to a handler, as one batch when it supports that."""
+        handle_batch = getattr(handler, "handle_batch", None)
+        if handle_batch and len(events) > 1:
+            self._call(handler, handle_batch, events)
+            return
+        for event in events:
+            self._call(handler, handler.handle, event)
+
+    def _call(
+        self, handler: EventHandler, method: Callable[[Any], None], arg: Any
+    ) -> None:
+        """Call a handler method, logging instead of raising failures."""
+        try:
+            method(arg)
+        except Exception as e:
+            self._count("handler_errors")
+            logger.error(
+                "EVENT PUBLISHER",
+                f"{type(handler).__name__} failed",
+                f"{type(e).__name__}: {e}",
+            )
+
+    def _record_lag(self, published_at: List[float]) -> None:
+        """Record publish-to-handled lag of events handled just now."""
+        if not published_at:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._lag_ms.extend((now - start) * 1000 for start in published_at)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
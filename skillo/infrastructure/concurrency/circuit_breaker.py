@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from skillo.infrastructure.config.settings import Config
+from skillo.infrastructure.logger import logger
+from skillo.infrastructure.metrics import metrics
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by all callers.
+
+    Opens after ``failure_threshold`` consecutive failures and rejects
+    calls for ``reset_timeout`` seconds. Then a single probe call is let
+    through: its success closes the circuit, its failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize closed with the opening threshold and cool-down."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        with self._lock:
+            if self._state == self.OPEN:
+                return not self._cooled_down()
+            return self._state == self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a call may proceed; claims the probe after cool-down."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._cooled_down():
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a call reached the provider."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.success(self.name.upper(), "Circuit closed")
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_neutral(self) -> None:
+        """Release the probe of a call that says nothing about health.
+
+        Requests the provider refuses, such as a 400 or 401, neither
+        close the circuit nor count against it; a refused probe leaves it
+        open for the next caller to probe again.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.OPEN:
+                return
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                metrics.increment(f"{self.name}.opened")
+                logger.error(
+                    self.name.upper(),
+                    "Circuit opened",
+                    f"{self._failures} consecutive failures, "
+                    f"retrying in {self.reset_timeout:.0f}s",
+                )
+
+    def stats(self) -> Dict[str, float]:
+        """Open flag and consecutive failures."""
+        with self._lock:
+            return {
+                "open": float(self._state != self.CLOSED),
+                "consecutive_failures": self._failures,
+            }
+
+    def _cooled_down(self) -> bool:
+        """Whether the open period is over; caller holds the lock."""
+        return self._clock() - self._opened_at >= self.reset_timeout
+
+
+_llm_circuit_breaker: Optional[CircuitBreaker] = None
+_llm_circuit_breaker_lock = threading.Lock()
+
+
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    """Process-wide breaker around every LLM call, configured from settings."""
+    global _llm_circuit_breaker
+    with _llm_circuit_breaker_lock:
+        if _llm_circuit_breaker is None:
+            config = Config()
+            _llm_circuit_breaker = CircuitBreaker(
+                "llm_circuit",
+                failure_threshold=config.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=config.LLM_CIRCUIT_RESET_SECONDS,
+            )
+            metrics.register_source("llm_circuit", _llm_circuit_breaker.stats)
+        return _llm_circuit_breaker
@@ -0,0 +1,176 @@
+import atexit
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from skillo.infrastructure.concurrency.thread_pool_executor import (
+    ThreadPoolParallelExecutor,
+)
+from skillo.infrastructure.concurrency.worker_pool import WorkerPool, WorkItem
+from skillo.infrastructure.metrics import metrics
+
+
+class TaskPriority(str, Enum):
+    """Scheduling classes of pool work."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class PriorityScheduler(WorkerPool):
+    """Worker pool sharing its workers between priority classes.
+
+    Each class may occupy at most its share of the workers, so a bulk
+    ingest always leaves room for interactive matching. When several
+    classes have queued work, the next task goes to the class using the
+    smallest fraction of its share, ties going to the higher priority.
+    Within a class, flows (one per session) are served round-robin, so
+    one session's large job cannot starve another's.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        shares: Dict[TaskPriority, float],
+        name: str = "skillo-worker",
+    ) -> None:
+        """Initialize with the fraction of workers each class may use."""
+        super().__init__(max_workers, name)
+        self._limits = {
+            priority: max(1, min(self.max_workers, round(share * max_workers)))
+            for priority, share in shares.items()
+        }
+        self._flows: Dict[
+            TaskPriority, "OrderedDict[Hashable, Deque[WorkItem]]"
+        ] = {priority: OrderedDict() for priority in TaskPriority}
+        self._running = {priority: 0 for priority in TaskPriority}
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        priority: TaskPriority = TaskPriority.INTERACTIVE,
+        flow: Hashable = None,
+    ) -> Future[Any]:
+        """Queue a task of a priority class on behalf of a flow."""
+        return self._submit(fn, lane=priority, flow=flow)
+
+    def stats(self) -> Dict[str, float]:
+        """Pool statistics plus running and queued tasks per class."""
+        values = super().stats()
+        with self._lock:
+            for priority in TaskPriority:
+                values[f"{priority.value}_active"] = self._running[priority]
+                values[f"{priority.value}_queued"] = sum(
+                    len(tasks) for tasks in self._flows[priority].values()
+                )
+                values[f"{priority.value}_limit"] = self._limit(priority)
+        return values
+
+    def _limit(self, priority: TaskPriority) -> int:
+        """Workers a class may occupy; unlisted classes may use all."""
+        return self._limits.get(priority, self.max_workers)
+
+    @staticmethod
+    def _priority(item: WorkItem) -> TaskPriority:
+        """Class a task was queued under, its lane."""
+        return TaskPriority(item.lane)
+
+    def _push(self, item: WorkItem) -> None:
+        flows = self._flows[self._priority(item)]
+        flows.setdefault(item.flow, deque()).append(item)
+
+    def _pop(self) -> Optional[WorkItem]:
+        eligible = [
+            priority
+            for priority in TaskPriority
+            if self._flows[priority]
+            and self._running[priority] < self._limit(priority)
+        ]
+        if not eligible:
+            return None
+
+        priority = min(
+            eligible,
+            key=lambda p: self._running[p] / self._limit(p),
+        )
+        flows = self._flows[priority]
+        flow, tasks = next(iter(flows.items()))
+        item = tasks.popleft()
+        if tasks:
+            flows.move_to_end(flow)
+        else:
+            del flows[flow]
+        return item
+
+    def _drain(self) -> List[WorkItem]:
+        items = [
+            item
+            for flows in self._flows.values()
+            for tasks in flows.values()
+            for item in tasks
+        ]
+        for flows in self._flows.values():
+            flows.clear()
+        return items
+
+    def _queued_count(self) -> int:
+        return sum(
+            len(tasks)
+            for flows in self._flows.values()
+            for tasks in flows.values()
+        )
+
+    def _started(self, item: WorkItem) -> None:
+        self._running[self._priority(item)] += 1
+
+    def _finished(self, item: WorkItem) -> None:
+        self._running[self._priority(item)] -= 1
+
+
+class PriorityParallelExecutor(ThreadPoolParallelExecutor):
+    """Parallel execution service submitting as one class and flow."""
+
+    def __init__(
+        self,
+        scheduler: PriorityScheduler,
+        priority: TaskPriority,
+        flow: Optional[Hashable] = None,
+    ):
+        """Initialize with the shared scheduler; flow defaults to unique."""
+        super().__init__(scheduler.max_workers, pool=scheduler)
+        self._scheduler = scheduler
+        self._priority = priority
+        self._flow = flow if flow is not None else uuid.uuid4().hex
+
+    def _submit(self, fn: Callable[[], Any]) -> Future[Any]:
+        return self._scheduler.submit(fn, self._priority, self._flow)
+
+
+_shared_scheduler: Optional[PriorityScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_priority_scheduler(
+    max_workers: int, batch_share: float
+) -> PriorityScheduler:
+    """Process-wide scheduler shared by every session and job.
+
+    The first call fixes the size and shares; the scheduler is shut down
+    at exit and its statistics are published under ``worker_pool.*``.
+    """
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = PriorityScheduler(
+                max_workers,
+                shares={
+                    TaskPriority.INTERACTIVE: 1.0,
+                    TaskPriority.BATCH: batch_share,
+                },
+            )
+            metrics.register_source("worker_pool", _shared_scheduler.stats)
+            atexit.register(_shared_scheduler.shutdown, wait=False)
+        return _shared_scheduler
@@ -0,0 +1,38 @@
+import threading
+import time
+
+from skillo.domain.services.interfaces import RateLimiter
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Thread-safe token bucket; a non-positive rate disables limiting."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """Initialize with refill rate and bucket size."""
+        self._rate = rate_per_second
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        if self._rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._rate,
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self._rate
+
+            time.sleep(wait_seconds)
@@ -0,0 +1,267 @@
+import contextvars
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, List, Optional, TypeVar
+
+import openai
+from langchain_core.embeddings import Embeddings
+
+from skillo.infrastructure.concurrency.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_llm_circuit_breaker,
+)
+from skillo.infrastructure.config.settings import Config
+from skillo.infrastructure.logger import logger
+from skillo.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed remote call may succeed when repeated."""
+    if isinstance(error, openai.APIConnectionError):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Server-requested delay from Retry-After headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    milliseconds = headers.get("retry-after-ms")
+    if milliseconds:
+        try:
+            return max(0.0, float(milliseconds) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ResilientCaller:
+    """Retries and optionally hedges one kind of remote call.
+
+    Transient failures (timeouts, connection errors, 429 and 5xx) are
+    retried with full-jitter exponential backoff, or after the delay the
+    server asks for. Other errors are raised at once. With hedging on, a
+    duplicate request starts when the first one outlives the recent p95
+    latency, and whichever finishes first wins.
+    """
+
+    LATENCY_WINDOW = 200
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_THREADS = 64
+
+    _hedge_executor: Optional[ThreadPoolExecutor] = None
+    _hedge_executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        hedging: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize with a metric name and retry settings."""
+        self.name = name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self._sleep = sleep
+        self._latencies: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        config: Config,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> "ResilientCaller":
+        """Caller with the LLM retry settings of the config."""
+        return cls(
+            name,
+            max_attempts=config.LLM_MAX_ATTEMPTS,
+            base_delay=config.LLM_RETRY_BASE_DELAY,
+            max_delay=config.LLM_RETRY_MAX_DELAY,
+            hedging=config.LLM_HEDGING_ENABLED,
+            circuit_breaker=circuit_breaker,
+        )
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run fn, retrying transient failures.
+
+        With a circuit breaker, every attempt is refused while it is
+        open; transient failures count against it, successful calls
+        close it and non-retryable errors leave it as it is. Failures,
+        refusals included, are raised for the caller to mark its result
+        as failed rather than score it.
+        """
+        attempt = 1
+        while True:
+            breaker = self.circuit_breaker
+            if breaker and not breaker.allow_request():
+                metrics.increment(f"{self.name}.rejected")
+                raise CircuitOpenError(f"{breaker.name} is open")
+
+            try:
+                result = self._hedged(fn)
+            except Exception as e:
+                if not is_retryable(e):
+                    if breaker:
+                        breaker.record_neutral()
+                    raise
+                if breaker:
+                    breaker.record_failure()
+                if attempt >= self.max_attempts:
+                    metrics.increment(f"{self.name}.gave_up")
+                    raise
+
+                delay = self.backoff_delay(attempt, e)
+                metrics.increment(f"{self.name}.retries")
+                logger.warning(
+                    self.name.upper(),
+                    f"Retrying after attempt {attempt} failed",
+                    f"{type(e).__name__}, waiting {delay:.1f}s",
+                )
+                self._sleep(delay)
+                attempt += 1
+            else:
+                if breaker:
+                    breaker.record_success()
+                return result
+
+    def backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """Retry-After when given, otherwise full-jitter exponential."""
+        requested = retry_after_seconds(error)
+        if requested is not None:
+            return min(requested, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Recent p95 latency, None until hedging has enough samples."""
+        if not self.hedging:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def _timed(self, fn: Callable[[], T]) -> T:
+        """Run fn and record its latency when it succeeds."""
+        started = time.perf_counter()
+        result = fn()
+        with self._lock:
+            self._latencies.append(time.perf_counter() - started)
+        return result
+
+    def _hedged(self, fn: Callable[[], T]) -> T:
+        """Run fn, racing a duplicate once it is slower than the p95."""
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(fn)
+
+        executor = self._executor()
+        primary = executor.submit(
+            contextvars.copy_context().run, self._timed, fn
+        )
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+
+        metrics.increment(f"{self.name}.hedges")
+        backup = executor.submit(
+            contextvars.copy_context().run, self._timed, fn
+        )
+        pending = {primary, backup}
+        errors: List[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is backup:
+                        metrics.increment(f"{self.name}.hedge_wins")
+                    return future.result()
+                errors.append(error)
+        raise errors[0]
+
+    @classmethod
+    def _executor(cls) -> ThreadPoolExecutor:
+        """Threads for hedged calls, separate from the worker pool.
+
+        Calls made from pool workers must not wait on the pool itself.
+        """
+        with cls._hedge_executor_lock:
+            if cls._hedge_executor is None:
+                cls._hedge_executor = ThreadPoolExecutor(
+                    max_workers=cls.HEDGE_THREADS,
+                    thread_name_prefix="skillo-hedge",
+                )
+            return cls._hedge_executor
+
+
+class ResilientRunnable:
+    """Runnable whose ``invoke`` goes through a resilient caller."""
+
+    def __init__(self, runnable: Any, caller: ResilientCaller) -> None:
+        self.runnable = runnable
+        self.caller = caller
+
+    def invoke(self, input: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.caller.call(
+            lambda: self.runnable.invoke(input, *args, **kwargs)
+        )
+
+
+class ResilientEmbeddings(Embeddings):
+    """Embeddings whose requests go through a resilient caller."""
+
+    def __init__(self, embeddings: Embeddings, caller: ResilientCaller):
+        self.embeddings = embeddings
+        self.caller = caller
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.caller.call(lambda: self.embeddings.embed_documents(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.caller.call(lambda: self.embeddings.embed_query(text))
+
+
+def resilient(runnable: Any, name: str, config: Config) -> ResilientRunnable:
+    """Wrap an LLM runnable with retries, hedging and the LLM circuit."""
+    return ResilientRunnable(
+        runnable,
+        ResilientCaller.from_config(
+            name, config, circuit_breaker=get_llm_circuit_breaker()
+        ),
+    )
@@ -0,0 +1,20 @@
+import os
+import sqlite3
+
+BUSY_TIMEOUT_MS = 30_000
+
+
+def connect_shared(path: str) -> sqlite3.Connection:
+    """SQLite connection safe to share between threads and processes.
+
+    Write-ahead logging lets readers in other workers proceed during a
+    write, and the busy timeout makes a writer wait on the file lock
+    instead of failing with "database is locked".
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    connection = sqlite3.connect(
+        path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    return connection
@@ -0,0 +1,94 @@
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar
+
+from langchain_core.embeddings import Embeddings
+
+from skillo.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one.
+
+    The first caller of a key runs the computation; callers arriving
+    while it is in flight wait for it and share its result or error.
+    Nothing is kept once the call finishes, so later calls run again.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize with the metric name of shared calls."""
+        self.name = name
+        self._calls: Dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn for key, or wait for the call already running it."""
+        with self._lock:
+            running: Optional[Future[Any]] = self._calls.get(key)
+            if running is None:
+                future: Future[Any] = Future()
+                self._calls[key] = future
+
+        if running is not None:
+            metrics.increment(f"{self.name}.shared")
+            shared: T = running.result()
+            return shared
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def text_key(*parts: str) -> str:
+    """Hash of text parts, used as a flight key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SingleFlightEmbeddings(Embeddings):
+    """Embeddings sharing in-flight requests for identical texts."""
+
+    def __init__(
+        self, embeddings: Embeddings, flights: SingleFlight, model: str
+    ) -> None:
+        self.embeddings = embeddings
+        self.flights = flights
+        self.model = model
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.flights.do(
+            ("documents", text_key(self.model, *texts)),
+            lambda: self.embeddings.embed_documents(texts),
+        )
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.flights.do(
+            ("query", text_key(self.model, text)),
+            lambda: self.embeddings.embed_query(text),
+        )
+
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Process-wide group, so duplicates are shared across sessions."""
+    with _flights_lock:
+        if name not in _flights:
+            _flights[name] = SingleFlight(name)
+        return _flights[name]
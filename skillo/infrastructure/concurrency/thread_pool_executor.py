@@ -1,42 +1,146 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
 
+from skillo.domain.services import CancellationToken
 from skillo.domain.services.interfaces import ParallelExecutionService
+from skillo.infrastructure.concurrency.worker_pool import WorkerPool
+from skillo.infrastructure.logger import logger
+from skillo.infrastructure.metrics import metrics
 
 
 class ThreadPoolParallelExecutor(ParallelExecutionService):
-    """ThreadPool-based parallel execution service."""
+    """Parallel execution service on a long-lived worker pool."""
 
-    def __init__(self, max_workers: int = 5):
-        """Initialize with max workers."""
+    CANCEL_POLL_SECONDS = 0.2
+
+    def __init__(
+        self, max_workers: int = 5, pool: Optional[WorkerPool] = None
+    ):
+        """Initialize with a shared pool, or a private one of max workers."""
         self._max_workers = max_workers
+        self._pool = pool
+
+    @property
+    def pool(self) -> WorkerPool:
+        """Worker pool running the tasks, created on first use."""
+        if self._pool is None:
+            self._pool = WorkerPool(self._max_workers)
+        return self._pool
+
+    def stats(self) -> Dict[str, float]:
+        """Live statistics of the underlying pool."""
+        return self.pool.stats()
 
     def execute_tasks_with_progress(
         self,
         tasks: List[Any],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> List[Any]:
         """Execute tasks in parallel with progress tracking."""
         if not tasks:
             return []
 
         results = []
-        completed_count = 0
         total_count = len(tasks)
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            future_to_task = {executor.submit(task): task for task in tasks}
-
-            for future in as_completed(future_to_task):
-                try:
-                    result = future.result()
-                    if result is not None:
-                        results.append(result)
-                except Exception:
-                    continue
-                finally:
-                    completed_count += 1
-                    if progress_callback:
-                        progress_callback(completed_count, total_count)
+        for completed_count, result in enumerate(
+            self.iter_task_results(tasks, cancellation_token), 1
+        ):
+            if result is not None:
+                results.append(result)
+            if progress_callback:
+                progress_callback(completed_count, total_count)
 
         return results
+
+    def iter_task_results(
+        self,
+        tasks: Iterable[Any],
+        cancellation_token: Optional[CancellationToken] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield results in completion order, None for failed tasks.
+
+        With max_in_flight, tasks are taken from the iterable only as
+        earlier ones finish, so a lazy iterable never has more than that
+        many tasks (and what they reference) alive at once. Cancelling
+        the token or closing the iterator early cancels tasks that have
+        not started and stops waiting for running ones.
+        """
+        remaining = iter(tasks)
+        pending: Set[Future[Any]] = self._submit_tasks(
+            islice(remaining, max_in_flight or None), cancellation_token
+        )
+        try:
+            while pending:
+                if cancellation_token and cancellation_token.cancelled:
+                    return
+
+                done, pending = wait(
+                    pending,
+                    timeout=(
+                        self.CANCEL_POLL_SECONDS
+                        if cancellation_token
+                        else None
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                if max_in_flight:
+                    pending |= self._submit_tasks(
+                        islice(remaining, max_in_flight - len(pending)),
+                        cancellation_token,
+                    )
+                for future in done:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        metrics.increment("parallel_executor.failed_tasks")
+                        logger.error(
+                            "PARALLEL EXECUTOR",
+                            "Task failed",
+                            f"{type(e).__name__}: {e}",
+                        )
+                        result = None
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _submit_tasks(
+        self,
+        tasks: Iterable[Any],
+        cancellation_token: Optional[CancellationToken],
+    ) -> Set[Future[Any]]:
+        """Queue tasks on the pool, each skipped if cancelled first."""
+        return {
+            self._submit(
+                partial(self._unless_cancelled, task, cancellation_token)
+            )
+            for task in tasks
+        }
+
+    def _submit(self, fn: Callable[[], Any]) -> Future[Any]:
+        """Queue a task on the pool."""
+        return self.pool.submit(fn)
+
+    @staticmethod
+    def _unless_cancelled(
+        task: Callable[[], Any],
+        cancellation_token: Optional[CancellationToken],
+    ) -> Any:
+        """Run a task unless the job was cancelled before it started."""
+        if cancellation_token and cancellation_token.cancelled:
+            return None
+        return task()
@@ -0,0 +1,184 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+
+class WorkItem(NamedTuple):
+    """Queued task with its future and scheduling keys."""
+
+    submitted_at: float
+    future: Future[Any]
+    fn: Callable[[], Any]
+    lane: Hashable = None
+    flow: Hashable = None
+
+
+class WorkerPool:
+    """Fixed set of long-lived worker threads with live statistics.
+
+    Workers start on first use and serve every caller, so the pool size
+    is a hard cap on concurrent tasks no matter how many jobs submit.
+    Tasks run in submission order; subclasses choose another order by
+    overriding the queue hooks, which are called with the lock held.
+    """
+
+    LATENCY_WINDOW = 500
+
+    def __init__(self, max_workers: int, name: str = "skillo-worker") -> None:
+        """Initialize with the worker count; threads start lazily."""
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._queue: Deque[WorkItem] = deque()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._active = 0
+        self._completed = 0
+        self._wait_ms: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._run_ms: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(self, fn: Callable[[], Any]) -> Future[Any]:
+        """Queue a task; the future can be cancelled until it starts."""
+        return self._submit(fn)
+
+    def stats(self) -> Dict[str, float]:
+        """Active workers, queue length and recent task latencies."""
+        with self._lock:
+            wait_ms = list(self._wait_ms)
+            run_ms = list(self._run_ms)
+            return {
+                "max_workers": self._max_workers,
+                "active_workers": self._active,
+                "queued_tasks": self._queued_count(),
+                "completed_tasks": self._completed,
+                "avg_wait_ms": sum(wait_ms) / len(wait_ms) if wait_ms else 0.0,
+                "avg_task_ms": sum(run_ms) / len(run_ms) if run_ms else 0.0,
+                "p95_task_ms": (
+                    sorted(run_ms)[int(len(run_ms) * 0.95) - 1]
+                    if len(run_ms) >= 20
+                    else max(run_ms, default=0.0)
+                ),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel queued tasks and stop workers after their current task."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            threads = list(self._threads)
+            for item in self._drain():
+                item.future.cancel()
+            self._work_available.notify_all()
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _submit(
+        self,
+        fn: Callable[[], Any],
+        lane: Hashable = None,
+        flow: Hashable = None,
+    ) -> Future[Any]:
+        """Queue a task under scheduling keys and wake a worker."""
+        future: Future[Any] = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Worker pool is shut down")
+            self._start_workers()
+            self._push(WorkItem(time.perf_counter(), future, fn, lane, flow))
+            self._work_available.notify()
+        return future
+
+    def _push(self, item: WorkItem) -> None:
+        """Add a task to the queue."""
+        self._queue.append(item)
+
+    def _pop(self) -> Optional[WorkItem]:
+        """Next task allowed to start, None when none is."""
+        return self._queue.popleft() if self._queue else None
+
+    def _drain(self) -> List[WorkItem]:
+        """Remove and return every queued task."""
+        items = list(self._queue)
+        self._queue.clear()
+        return items
+
+    def _queued_count(self) -> int:
+        """Number of queued tasks."""
+        return len(self._queue)
+
+    def _started(self, item: WorkItem) -> None:
+        """Record that a task started running."""
+
+    def _finished(self, item: WorkItem) -> None:
+        """Record that a task stopped running."""
+
+    def _start_workers(self) -> None:
+        """Start worker threads on first use; caller holds the lock."""
+        if self._threads:
+            return
+        for index in range(self._max_workers):
+            thread = threading.Thread(
+                target=self._work, name=f"{self._name}-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_item(self) -> Optional[WorkItem]:
+        """Block until a task may start; None once the pool shuts down."""
+        with self._lock:
+            while not self._shutdown:
+                item = self._pop()
+                if item is None:
+                    self._work_available.wait()
+                    continue
+                if not item.future.set_running_or_notify_cancel():
+                    continue
+
+                self._active += 1
+                self._started(item)
+                self._wait_ms.append(
+                    (time.perf_counter() - item.submitted_at) * 1000
+                )
+                return item
+            return None
+
+    def _work(self) -> None:
+        """Run queued tasks until shutdown."""
+        while True:
+            item = self._next_item()
+            if item is None:
+                return
+
+            started_at = time.perf_counter()
+            try:
+                item.future.set_result(item.fn())
+            except BaseException as e:
+                item.future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+                    self._finished(item)
+                    self._run_ms.append(
+                        (time.perf_counter() - started_at) * 1000
+                    )
+                    self._work_available.notify_all()
@@ -1,5 +1,5 @@
 import os
-from typing import Dict
+from typing import Any, Dict
 
 from dotenv import load_dotenv
 
@@ -11,9 +11,59 @@ class Config:
 
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 
+    VECTOR_BACKEND: str = os.getenv("VECTOR_BACKEND", "chroma")
+
     CHROMA_DB_PATH: str = os.getenv("CHROMA_DB_PATH", "./chroma_db")
+    CHROMA_HOST: str = os.getenv("CHROMA_HOST", "")
+    CHROMA_PORT: int = int(os.getenv("CHROMA_PORT", "8000"))
     COLLECTION_NAME: str = os.getenv("COLLECTION_NAME", "skillo")
 
+    CHROMA_COLLECTION_LAYOUT: str = os.getenv(
+        "CHROMA_COLLECTION_LAYOUT", "shared"
+    )
+
+    CHROMA_HNSW_SPACE: str = os.getenv("CHROMA_HNSW_SPACE", "l2")
+    CHROMA_HNSW_EF_CONSTRUCTION: int = int(
+        os.getenv("CHROMA_HNSW_EF_CONSTRUCTION", "100")
+    )
+    CHROMA_HNSW_EF_SEARCH: int = int(os.getenv("CHROMA_HNSW_EF_SEARCH", "100"))
+    CHROMA_HNSW_M: int = int(os.getenv("CHROMA_HNSW_M", "16"))
+
+    NUMPY_INDEX_PATH: str = os.getenv("NUMPY_INDEX_PATH", "./numpy_index")
+    NUMPY_INDEX_TYPE: str = os.getenv("NUMPY_INDEX_TYPE", "flat")
+    NUMPY_IVF_NLIST: int = int(os.getenv("NUMPY_IVF_NLIST", "64"))
+    NUMPY_IVF_NPROBE: int = int(os.getenv("NUMPY_IVF_NPROBE", "8"))
+
+    MATCH_DB_PATH: str = os.getenv("MATCH_DB_PATH", "./data/matches.db")
+    MATCH_BATCH_CHUNK_SIZE: int = int(
+        os.getenv("MATCH_BATCH_CHUNK_SIZE", "20")
+    )
+    MATCH_RATE_LIMIT_PER_SECOND: float = float(
+        os.getenv("MATCH_RATE_LIMIT_PER_SECOND", "0")
+    )
+    MATCH_RATE_LIMIT_BURST: int = int(os.getenv("MATCH_RATE_LIMIT_BURST", "5"))
+    MATCH_BATCH_SIZE: int = int(os.getenv("MATCH_BATCH_SIZE", "1"))
+    INCREMENTAL_MATCHING_ENABLED: bool = (
+        os.getenv("INCREMENTAL_MATCHING_ENABLED", "false").lower() == "true"
+    )
+    INCREMENTAL_MATCH_NEIGHBOURS: int = int(
+        os.getenv("INCREMENTAL_MATCH_NEIGHBOURS", "10")
+    )
+
+    GEOCODE_CACHE_PATH: str = os.getenv(
+        "GEOCODE_CACHE_PATH", "./data/geocode_cache.db"
+    )
+    GAZETTEER_PATH: str = os.getenv("GAZETTEER_PATH", "./data/gazetteer.npy")
+    GEOCODE_ONLINE: bool = (
+        os.getenv("GEOCODE_ONLINE", "true").lower() == "true"
+    )
+
+    UPLOAD_MAX_IN_FLIGHT: int = int(os.getenv("UPLOAD_MAX_IN_FLIGHT", "16"))
+    UPLOAD_BATCH_SIZE: int = int(os.getenv("UPLOAD_BATCH_SIZE", "16"))
+    PDF_SPOOL_THRESHOLD_BYTES: int = int(
+        os.getenv("PDF_SPOOL_THRESHOLD_BYTES", str(8 * 1024 * 1024))
+    )
+
     CV_UPLOAD_DIR: str = os.getenv("CV_UPLOAD_DIR", "./data/cvs")
     JOB_UPLOAD_DIR: str = os.getenv("JOB_UPLOAD_DIR", "./data/jobs")
     PROMPTS_DIR: str = os.getenv(
@@ -30,6 +80,33 @@ class Config:
     MIN_MATCH_SCORE: float = float(os.getenv("MIN_MATCH_SCORE", "0.3"))
     TOP_CANDIDATES_COUNT: int = int(os.getenv("TOP_CANDIDATES_COUNT", "5"))
     MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "5"))
+    BATCH_WORKER_SHARE: float = float(os.getenv("BATCH_WORKER_SHARE", "0.6"))
+    MATCH_PROCESS_SHARDS: int = int(os.getenv("MATCH_PROCESS_SHARDS", "0"))
+    MATCH_PROCESS_THREADS: int = int(os.getenv("MATCH_PROCESS_THREADS", "4"))
+    MATCH_PROCESS_TIMEOUT_SECONDS: float = float(
+        os.getenv("MATCH_PROCESS_TIMEOUT_SECONDS", "300")
+    )
+
+    EVENT_DISPATCH_ASYNC: bool = (
+        os.getenv("EVENT_DISPATCH_ASYNC", "true").lower() == "true"
+    )
+    EVENT_QUEUE_SIZE: int = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+    EVENT_BATCH_SIZE: int = int(os.getenv("EVENT_BATCH_SIZE", "50"))
+
+    LLM_MAX_ATTEMPTS: int = int(os.getenv("LLM_MAX_ATTEMPTS", "4"))
+    LLM_RETRY_BASE_DELAY: float = float(
+        os.getenv("LLM_RETRY_BASE_DELAY", "0.5")
+    )
+    LLM_RETRY_MAX_DELAY: float = float(os.getenv("LLM_RETRY_MAX_DELAY", "30"))
+    LLM_HEDGING_ENABLED: bool = (
+        os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true"
+    )
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = int(
+        os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5")
+    )
+    LLM_CIRCUIT_RESET_SECONDS: float = float(
+        os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30")
+    )
 
     @property
     def AGENT_WEIGHTS(self) -> Dict[str, float]:
@@ -44,6 +121,16 @@ class Config:
             "education_weight": float(os.getenv("EDUCATION_WEIGHT", "0.20")),
         }
 
+    @property
+    def HNSW_SETTINGS(self) -> Dict[str, Any]:
+        """Get HNSW index settings as Chroma collection metadata."""
+        return {
+            "hnsw:space": self.CHROMA_HNSW_SPACE,
+            "hnsw:construction_ef": self.CHROMA_HNSW_EF_CONSTRUCTION,
+            "hnsw:search_ef": self.CHROMA_HNSW_EF_SEARCH,
+            "hnsw:M": self.CHROMA_HNSW_M,
+        }
+
     def validate_weights(self) -> bool:
         """Validate agent weights sum to 1.0."""
         total = sum(self.AGENT_WEIGHTS.values())
@@ -72,4 +159,38 @@ def validate_config(config: Config | None = None) -> bool:
     if config.TOP_CANDIDATES_COUNT < 1:
         raise ValueError("TOP_CANDIDATES_COUNT must be at least 1")
 
+    if config.VECTOR_BACKEND not in ("chroma", "numpy"):
+        raise ValueError("VECTOR_BACKEND must be one of: chroma, numpy")
+
+    if config.NUMPY_INDEX_TYPE not in ("flat", "ivf"):
+        raise ValueError("NUMPY_INDEX_TYPE must be one of: flat, ivf")
+
+    if min(config.NUMPY_IVF_NLIST, config.NUMPY_IVF_NPROBE) < 1:
+        raise ValueError("IVF parameters must be positive integers")
+
+    if config.MATCH_BATCH_CHUNK_SIZE < 1:
+        raise ValueError("MATCH_BATCH_CHUNK_SIZE must be at least 1")
+
+    if config.MATCH_BATCH_SIZE < 1:
+        raise ValueError("MATCH_BATCH_SIZE must be at least 1")
+
+    if config.INCREMENTAL_MATCH_NEIGHBOURS < 1:
+        raise ValueError("INCREMENTAL_MATCH_NEIGHBOURS must be at least 1")
+
+    if config.CHROMA_COLLECTION_LAYOUT not in ("shared", "partitioned"):
+        raise ValueError(
+            "CHROMA_COLLECTION_LAYOUT must be one of: shared, partitioned"
+        )
+
+    if config.CHROMA_HNSW_SPACE not in ("l2", "ip", "cosine"):
+        raise ValueError("CHROMA_HNSW_SPACE must be one of: l2, ip, cosine")
+
+    hnsw_params = (
+        config.CHROMA_HNSW_EF_CONSTRUCTION,
+        config.CHROMA_HNSW_EF_SEARCH,
+        config.CHROMA_HNSW_M,
+    )
+    if min(hnsw_params) < 1:
+        raise ValueError("HNSW parameters must be positive integers")
+
     return True
@@ -1,7 +1,10 @@
 import hashlib
 import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 import fitz  # type: ignore
 
@@ -13,6 +16,8 @@ from skillo.infrastructure.config.settings import Config
 class BaseDocumentProcessor(ABC):
     """Base class for document processors."""
 
+    SPOOL_CHUNK_BYTES = 1024 * 1024
+
     def __init__(self, config: Config) -> None:
         self.config = config
 
@@ -25,30 +30,60 @@ class BaseDocumentProcessor(ABC):
 
     def _extract_with_pymupdf(self, pdf_file: Any) -> str:
         """Extract text with links using PyMuPDF."""
-        pdf_file.seek(0)
-        doc = fitz.open(stream=pdf_file.read(), filetype="pdf")
+        with self._open_pdf(pdf_file) as doc:
+            text = ""
+            for page_num in range(len(doc)):
+                page = doc[page_num]
+                page_text = page.get_text()
 
-        text = ""
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
+                links = page.get_links()
+                for link in links:
+                    if "uri" in link and "from" in link:
+                        rect = link["from"]
+                        link_text = page.get_textbox(rect).strip()
+                        url = link["uri"]
 
-            links = page.get_links()
-            for link in links:
-                if "uri" in link and "from" in link:
-                    rect = link["from"]
-                    link_text = page.get_textbox(rect).strip()
-                    url = link["uri"]
+                        if link_text and url:
+                            enhanced_text = f"{link_text} ({url})"
+                            page_text = page_text.replace(
+                                link_text, enhanced_text
+                            )
 
-                    if link_text and url:
-                        enhanced_text = f"{link_text} ({url})"
-                        page_text = page_text.replace(link_text, enhanced_text)
+                text += page_text + "\n"
 
-            text += page_text + "\n"
-
-        doc.close()
         return text.strip()
 
+    @contextmanager
+    def _open_pdf(self, pdf_file: Any) -> Iterator[Any]:
+        """Open an uploaded PDF, spooling large ones to a temp file.
+
+        Large PDFs are copied to disk in chunks and opened by path, so
+        PyMuPDF does not need a second in-memory copy of their bytes.
+        """
+        pdf_file.seek(0)
+        size = getattr(pdf_file, "size", None)
+        if (
+            not isinstance(size, int)
+            or size <= self.config.PDF_SPOOL_THRESHOLD_BYTES
+        ):
+            doc = fitz.open(stream=pdf_file.read(), filetype="pdf")
+            try:
+                yield doc
+            finally:
+                doc.close()
+            return
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            shutil.copyfileobj(pdf_file, f, self.SPOOL_CHUNK_BYTES)
+        try:
+            doc = fitz.open(f.name)
+            try:
+                yield doc
+            finally:
+                doc.close()
+        finally:
+            os.unlink(f.name)
+
     def generate_document_id(self, content: str, filename: str) -> str:
         """Generate document ID."""
         combined = f"{filename}_{content[:100]}"
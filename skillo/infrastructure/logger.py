@@ -1,7 +1,7 @@
-import threading
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 
 class LogLevel(Enum):
@@ -27,24 +27,21 @@ class LogEntry:
 
 
 class Logger:
-    """Thread-safe logging system."""
+    """Thread-safe logging system.
+
+    Entries go to a bounded deque, whose appends are atomic, so agents
+    logging from many worker threads never wait on each other.
+    """
 
     def __init__(self) -> None:
-        self._logs: List[LogEntry] = []
         self._max_logs = 100
-        self._log_lock = threading.Lock()
+        self._logs: Deque[LogEntry] = deque(maxlen=self._max_logs)
 
     def _add_log(
         self, level: LogLevel, agent: str, action: str, details: str = ""
     ) -> None:
         """Add log entry to collection."""
-        log_entry = LogEntry(level, agent, action, details)
-
-        with self._log_lock:
-            self._logs.append(log_entry)
-
-            if len(self._logs) > self._max_logs:
-                self._logs = self._logs[-self._max_logs:]
+        self._logs.append(LogEntry(level, agent, action, details))
 
     def info(self, agent: str, action: str, details: str = "") -> None:
         """Log info message."""
@@ -64,15 +61,14 @@ class Logger:
 
     def get_logs(self, last_n: Optional[int] = None) -> List[LogEntry]:
         """Get log entries."""
-        with self._log_lock:
-            if last_n:
-                return self._logs[-last_n:].copy()
-            return self._logs.copy()
+        logs = list(self._logs)
+        if last_n:
+            return logs[-last_n:]
+        return logs
 
     def clear_logs(self) -> None:
         """Clear all log entries."""
-        with self._log_lock:
-            self._logs.clear()
+        self._logs.clear()
 
 
 logger = Logger()
@@ -0,0 +1,42 @@
+import threading
+from typing import Callable, Dict
+
+
+class Metrics:
+    """Thread-safe in-process counters and live gauge sources."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+        self._sources: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a named counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def register_source(
+        self, prefix: str, source: Callable[[], Dict[str, float]]
+    ) -> None:
+        """Include a component's live values under ``prefix.`` in snapshots."""
+        with self._lock:
+            self._sources[prefix] = source
+
+    def snapshot(self) -> Dict[str, float]:
+        """Copy of all counters plus current gauge values."""
+        with self._lock:
+            values: Dict[str, float] = dict(self._counters)
+            sources = dict(self._sources)
+
+        for prefix, source in sources.items():
+            for name, value in source().items():
+                values[f"{prefix}.{name}"] = value
+        return values
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self._counters.clear()
+
+
+metrics = Metrics()
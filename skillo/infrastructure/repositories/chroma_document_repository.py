@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from langchain_chroma import Chroma
 from langchain_core.documents import Document as LangChainDocument
@@ -9,6 +9,14 @@ from skillo.domain.entities import Document
 from skillo.domain.enums import DocumentType
 from skillo.domain.exceptions import SkilloRepositoryError
 from skillo.domain.repositories import DocumentRepository
+from skillo.infrastructure.concurrency.resilience import (
+    ResilientCaller,
+    ResilientEmbeddings,
+)
+from skillo.infrastructure.concurrency.single_flight import (
+    SingleFlightEmbeddings,
+    get_single_flight,
+)
 from skillo.infrastructure.config.settings import Config
 
 
@@ -18,83 +26,253 @@ class QueryConstants:
     DEFAULT_SIMILARITY_LIMIT = 10
 
 
+class CollectionLayout:
+    """Supported collection layouts."""
+
+    SHARED = "shared"
+    PARTITIONED = "partitioned"
+
+
 class ChromaDocumentRepository(DocumentRepository):
     """Chroma document repository implementation."""
 
     def __init__(self, config: Config) -> None:
         """Initialize with config."""
         self.config = config
-        self.embeddings = OpenAIEmbeddings(
-            api_key=self.config.OPENAI_API_KEY,  # type: ignore
-            model=self.config.EMBEDDING_MODEL,
+        self.collection_name = self.config.COLLECTION_NAME
+        self.layout = self.config.CHROMA_COLLECTION_LAYOUT
+        self.embeddings = SingleFlightEmbeddings(
+            ResilientEmbeddings(
+                OpenAIEmbeddings(
+                    api_key=self.config.OPENAI_API_KEY,  # type: ignore
+                    model=self.config.EMBEDDING_MODEL,
+                    max_retries=0,
+                ),
+                ResilientCaller.from_config("embeddings", self.config),
+            ),
+            get_single_flight("embeddings"),
+            self.config.EMBEDDING_MODEL,
         )
         self._initialize_vectorstore()
 
     def _initialize_vectorstore(self) -> None:
         """Initialize Chroma vectorstore."""
         try:
-            os.makedirs(self.config.CHROMA_DB_PATH, exist_ok=True)
+            if not self.config.CHROMA_HOST:
+                os.makedirs(self.config.CHROMA_DB_PATH, exist_ok=True)
 
-            self.vectorstore = Chroma(
-                collection_name=self.config.COLLECTION_NAME,
-                embedding_function=self.embeddings,
-                persist_directory=self.config.CHROMA_DB_PATH,
-            )
+            self.vectorstores = {
+                name: self.create_vectorstore(name)
+                for name in self.collection_names(self.collection_name)
+            }
+            self.vectorstore = next(iter(self.vectorstores.values()))
 
         except Exception as e:
-            path = self.config.CHROMA_DB_PATH
-            error_msg = f"Failed to init vector store at '{path}': {str(e)}"
+            location = self.location
+            error_msg = (
+                f"Failed to init vector store at '{location}': {str(e)}"
+            )
             raise SkilloRepositoryError(error_msg)
 
+    @property
+    def location(self) -> str:
+        """Chroma server address, or the directory of the embedded store."""
+        if self.config.CHROMA_HOST:
+            return f"{self.config.CHROMA_HOST}:{self.config.CHROMA_PORT}"
+        return self.config.CHROMA_DB_PATH
+
+    def create_vectorstore(self, collection_name: str) -> Chroma:
+        """Open or create a collection with configured HNSW settings."""
+        return Chroma(
+            collection_name=collection_name,
+            embedding_function=self.embeddings,
+            collection_metadata=self.config.HNSW_SETTINGS,
+            **self._connection_settings(),
+        )
+
+    def _connection_settings(self) -> Dict[str, Any]:
+        """Chroma server when a host is set, otherwise the local directory.
+
+        Only a server can be shared by several application processes.
+        """
+        if self.config.CHROMA_HOST:
+            return {
+                "host": self.config.CHROMA_HOST,
+                "port": self.config.CHROMA_PORT,
+            }
+        return {"persist_directory": self.config.CHROMA_DB_PATH}
+
+    def collection_names(
+        self, base_name: str, layout: Optional[str] = None
+    ) -> List[str]:
+        """Collection names backing the given layout."""
+        if (layout or self.layout) == CollectionLayout.PARTITIONED:
+            return [
+                self.partition_name(base_name, doc_type)
+                for doc_type in DocumentType
+            ]
+        return [base_name]
+
+    def partition_name(self, base_name: str, doc_type: DocumentType) -> str:
+        """Collection name holding one document type."""
+        return f"{base_name}_{doc_type.value}"
+
+    def switch_collection(
+        self, collection_name: str, layout: Optional[str] = None
+    ) -> None:
+        """Serve reads and writes from another collection or layout."""
+        self.collection_name = collection_name
+        if layout:
+            self.layout = layout
+        self._initialize_vectorstore()
+
+    def _collection_name_for(self, doc_type: DocumentType) -> str:
+        """Name of the collection holding documents of the given type."""
+        if self.layout == CollectionLayout.PARTITIONED:
+            return self.partition_name(self.collection_name, doc_type)
+        return self.collection_name
+
+    def _vectorstore_for(self, doc_type: DocumentType) -> Chroma:
+        """Collection holding documents of the given type."""
+        return self.vectorstores[self._collection_name_for(doc_type)]
+
+    def _type_filter(self, doc_type: DocumentType) -> Optional[Dict[str, Any]]:
+        """Metadata filter needed to select a type in the active layout."""
+        if self.layout == CollectionLayout.PARTITIONED:
+            return None
+        return {"document_type": doc_type.value}
+
+    @staticmethod
+    def _id_filter(document_ids: List[str]) -> Dict[str, Any]:
+        """Metadata filter matching entries of any of the documents."""
+        return {"document_id": {"$in": list(document_ids)}}
+
     def add_document(self, document: Document) -> bool:
-        """Add document to vector store."""
-        try:
-            langchain_doc = LangChainDocument(
-                page_content=document.content,
-                metadata={
-                    "document_id": document.id,
-                    "document_type": document.document_type.value,
-                    **document.metadata,
-                },
-            )
+        """Add or replace document in vector store."""
+        return self.add_documents([document])
+
+    def add_documents(self, documents: List[Document]) -> bool:
+        """Upsert documents keyed by document id."""
+        if not documents:
+            return True
+
+        unique_documents = {document.id: document for document in documents}
+
+        by_collection: Dict[str, List[Document]] = {}
+        for document in unique_documents.values():
+            name = self._collection_name_for(document.document_type)
+            by_collection.setdefault(name, []).append(document)
 
-            self.vectorstore.add_documents([langchain_doc])
+        try:
+            for name, batch in by_collection.items():
+                self.vectorstores[name].add_documents(
+                    [self._to_langchain_document(d) for d in batch],
+                    ids=[document.id for document in batch],
+                )
             return True
 
         except Exception as e:
+            document_ids = ", ".join(unique_documents.keys())
             raise SkilloRepositoryError(
-                f"Failed to add document {document.id}: {str(e)}"
+                f"Failed to add documents {document_ids}: {str(e)}"
             )
 
+    def _to_langchain_document(self, document: Document) -> LangChainDocument:
+        """Convert domain document to LangChain document."""
+        return LangChainDocument(
+            page_content=document.content,
+            metadata={
+                "document_id": document.id,
+                "document_type": document.document_type.value,
+                **document.metadata,
+            },
+        )
+
+    def _to_domain_document(
+        self, content: str, metadata: Dict[str, Any]
+    ) -> Document:
+        """Convert stored content and metadata to domain document."""
+        return Document(
+            id=metadata["document_id"],
+            document_type=DocumentType(metadata["document_type"]),
+            content=content,
+            metadata={
+                k: v
+                for k, v in metadata.items()
+                if k not in ["document_id", "document_type"]
+            },
+        )
+
     def get_documents_by_type(self, doc_type: DocumentType) -> List[Document]:
         """Get documents by type."""
         try:
-            results = self.vectorstore.get(
-                where={"document_type": doc_type.value}
+            results = self._vectorstore_for(doc_type).get(
+                where=self._type_filter(doc_type)
             )
 
-            documents = []
-            for i, document_content in enumerate(results["documents"]):
-                metadata = results["metadatas"][i]
-                doc = Document(
-                    id=metadata["document_id"],
-                    document_type=DocumentType(metadata["document_type"]),
-                    content=document_content,
-                    metadata={
-                        k: v
-                        for k, v in metadata.items()
-                        if k not in ["document_id", "document_type"]
-                    },
+            return [
+                self._to_domain_document(content, metadata)
+                for content, metadata in zip(
+                    results["documents"], results["metadatas"]
                 )
-                documents.append(doc)
-
-            return documents
+            ]
 
         except Exception as e:
             raise SkilloRepositoryError(
                 f"Failed to get documents by type {doc_type}: {str(e)}"
             )
 
+    def get_documents_by_ids(self, document_ids: List[str]) -> List[Document]:
+        """Get stored documents by id, skipping unknown ids."""
+        if not document_ids:
+            return []
+
+        try:
+            documents: Dict[str, Document] = {}
+            for vectorstore in self.vectorstores.values():
+                results = vectorstore.get(where=self._id_filter(document_ids))
+                for content, metadata in zip(
+                    results["documents"], results["metadatas"]
+                ):
+                    document = self._to_domain_document(content, metadata)
+                    documents[document.id] = document
+
+            return list(documents.values())
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to get documents {', '.join(document_ids)}: {str(e)}"
+            )
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """Delete all stored entries of the given documents."""
+        if not document_ids:
+            return 0
+
+        try:
+            deleted_ids: Set[str] = set()
+            for vectorstore in self.vectorstores.values():
+                entries = vectorstore.get(
+                    where=self._id_filter(document_ids),
+                    include=["metadatas"],
+                )
+                if not entries["ids"]:
+                    continue
+
+                vectorstore.delete(ids=entries["ids"])
+                deleted_ids.update(
+                    metadata["document_id"]
+                    for metadata in entries["metadatas"]
+                )
+
+            return len(deleted_ids)
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to delete documents {', '.join(document_ids)}: "
+                f"{str(e)}"
+            )
+
     def find_similar_documents(
         self,
         query: str,
@@ -103,27 +281,43 @@ class ChromaDocumentRepository(DocumentRepository):
     ) -> List[Document]:
         """Find documents similar to the query text."""
         try:
-            results = self.vectorstore.similarity_search(
-                query=query, k=limit, filter={"document_type": doc_type.value}
+            results = self._vectorstore_for(doc_type).similarity_search(
+                query=query, k=limit, filter=self._type_filter(doc_type)
+            )
+
+            return [
+                self._to_domain_document(result.page_content, result.metadata)
+                for result in results
+            ]
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to find similar documents: {str(e)}"
+            )
+
+    def find_similar_documents_with_scores(
+        self,
+        query: str,
+        doc_type: DocumentType,
+        limit: int = QueryConstants.DEFAULT_SIMILARITY_LIMIT,
+    ) -> List[Tuple[Document, float]]:
+        """Find similar documents with their relevance score."""
+        try:
+            results = self._vectorstore_for(
+                doc_type
+            ).similarity_search_with_relevance_scores(
+                query=query, k=limit, filter=self._type_filter(doc_type)
             )
 
-            documents = []
-            for result in results:
-                doc = Document(
-                    id=result.metadata["document_id"],
-                    document_type=DocumentType(
-                        result.metadata["document_type"]
+            return [
+                (
+                    self._to_domain_document(
+                        result.page_content, result.metadata
                     ),
-                    content=result.page_content,
-                    metadata={
-                        k: v
-                        for k, v in result.metadata.items()
-                        if k not in ["document_id", "document_type"]
-                    },
+                    min(1.0, max(0.0, float(score))),
                 )
-                documents.append(doc)
-
-            return documents
+                for result, score in results
+            ]
 
         except Exception as e:
             raise SkilloRepositoryError(
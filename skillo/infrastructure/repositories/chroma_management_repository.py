@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional
 
 from skillo.domain.entities import Document
 from skillo.domain.enums import DocumentType
@@ -6,9 +6,16 @@ from skillo.domain.exceptions import SkilloRepositoryError
 from skillo.domain.repositories import ManagementRepository
 from skillo.infrastructure.repositories.chroma_document_repository import (
     ChromaDocumentRepository,
+    CollectionLayout,
 )
 
 
+class ManagementConstants:
+    """Management repository constants."""
+
+    SCAN_PAGE_SIZE = 1000
+
+
 class ChromaManagementRepository(ManagementRepository):
     """Chroma implementation of ManagementRepository interface."""
 
@@ -19,7 +26,8 @@ class ChromaManagementRepository(ManagementRepository):
     def reset_database(self) -> bool:
         """Reset the entire database."""
         try:
-            self._document_repository.vectorstore.delete_collection()
+            for vectorstore in self._document_repository.vectorstores.values():
+                vectorstore.delete_collection()
             self._document_repository._initialize_vectorstore()
             return True
 
@@ -29,15 +37,180 @@ class ChromaManagementRepository(ManagementRepository):
     def get_all_documents(self) -> List[Document]:
         """Get all documents from database for management operations."""
         try:
-            cv_docs = self._document_repository.get_documents_by_type(
-                DocumentType.CV
+            repository = self._document_repository
+            return [
+                document
+                for document_type in (DocumentType.CV, DocumentType.JOB)
+                for document in repository.get_documents_by_type(document_type)
+            ]
+
+        except Exception as e:
+            error_msg = f"Failed to get all documents: {str(e)}"
+            raise SkilloRepositoryError(error_msg)
+
+    def compact_duplicates(self) -> int:
+        """Collapse entries sharing a document_id into one keyed entry."""
+        try:
+            removed_count = 0
+            for vectorstore in self._document_repository.vectorstores.values():
+                groups = self._group_entries_by_document_id(vectorstore)
+                collection = vectorstore._collection
+
+                for document_id, entry_ids in groups.items():
+                    if entry_ids == [document_id]:
+                        continue
+
+                    if document_id not in entry_ids:
+                        self._rekey_entry(
+                            collection, entry_ids[-1], document_id
+                        )
+
+                    stale_ids = [
+                        eid for eid in entry_ids if eid != document_id
+                    ]
+                    collection.delete(ids=stale_ids)
+                    removed_count += len(entry_ids) - 1
+
+            return removed_count
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to compact duplicates: {str(e)}"
+            )
+
+    def rebuild_index(self, target_collection_name: str) -> int:
+        """Copy the active collections into new ones with current settings."""
+        try:
+            copied_count = self._copy_entries(
+                target_collection_name, self._document_repository.layout
             )
-            job_docs = self._document_repository.get_documents_by_type(
-                DocumentType.JOB
+            self._document_repository.switch_collection(target_collection_name)
+            return copied_count
+
+        except SkilloRepositoryError:
+            raise
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to rebuild index: {str(e)}")
+
+    def migrate_layout(
+        self,
+        target_layout: str,
+        target_collection_name: Optional[str] = None,
+    ) -> int:
+        """Copy all entries into collections of another layout."""
+        if target_layout not in (
+            CollectionLayout.SHARED,
+            CollectionLayout.PARTITIONED,
+        ):
+            raise SkilloRepositoryError(
+                f"Unknown collection layout '{target_layout}'"
             )
 
-            return cv_docs + job_docs
+        target_name = (
+            target_collection_name or self._document_repository.collection_name
+        )
 
+        try:
+            copied_count = self._copy_entries(target_name, target_layout)
+            self._document_repository.switch_collection(
+                target_name, target_layout
+            )
+            return copied_count
+
+        except SkilloRepositoryError:
+            raise
         except Exception as e:
-            error_msg = f"Failed to get all documents: {str(e)}"
-            raise SkilloRepositoryError(error_msg)
+            raise SkilloRepositoryError(
+                f"Failed to migrate collection layout: {str(e)}"
+            )
+
+    def _copy_entries(self, target_name: str, target_layout: str) -> int:
+        """Copy entries with stored embeddings into empty target collections."""
+        repository = self._document_repository
+        target_names = repository.collection_names(target_name, target_layout)
+
+        overlapping = set(target_names) & set(repository.vectorstores)
+        if overlapping:
+            raise SkilloRepositoryError(
+                "Target collection must differ from the active collection: "
+                + ", ".join(sorted(overlapping))
+            )
+
+        targets = {
+            name: repository.create_vectorstore(name) for name in target_names
+        }
+        for name, target in targets.items():
+            if target._collection.count() > 0:
+                raise SkilloRepositoryError(
+                    f"Target collection '{name}' is not empty"
+                )
+
+        copied_count = 0
+        for source in repository.vectorstores.values():
+            for page in self._iter_pages(
+                source, ["embeddings", "documents", "metadatas"]
+            ):
+                routed: Dict[str, List[int]] = {}
+                for index, metadata in enumerate(page["metadatas"]):
+                    if target_layout == CollectionLayout.PARTITIONED:
+                        doc_type = DocumentType(metadata["document_type"])
+                        name = repository.partition_name(target_name, doc_type)
+                    else:
+                        name = target_name
+                    routed.setdefault(name, []).append(index)
+
+                for name, indexes in routed.items():
+                    targets[name]._collection.upsert(
+                        ids=[page["ids"][i] for i in indexes],
+                        embeddings=[page["embeddings"][i] for i in indexes],
+                        documents=[page["documents"][i] for i in indexes],
+                        metadatas=[page["metadatas"][i] for i in indexes],
+                    )
+                copied_count += len(page["ids"])
+
+        return copied_count
+
+    def _group_entries_by_document_id(
+        self, vectorstore: Any
+    ) -> Dict[str, List[str]]:
+        """Scan a collection and group stored entry ids by document_id."""
+        groups: Dict[str, List[str]] = {}
+
+        for page in self._iter_pages(vectorstore, ["metadatas"]):
+            for entry_id, metadata in zip(page["ids"], page["metadatas"]):
+                document_id = (metadata or {}).get("document_id", entry_id)
+                groups.setdefault(document_id, []).append(entry_id)
+
+        return groups
+
+    def _iter_pages(
+        self, vectorstore: Any, include: List[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield collection contents page by page."""
+        offset = 0
+
+        while True:
+            page = vectorstore.get(
+                include=include,
+                limit=ManagementConstants.SCAN_PAGE_SIZE,
+                offset=offset,
+            )
+            if not page["ids"]:
+                break
+
+            yield page
+            offset += len(page["ids"])
+
+    def _rekey_entry(
+        self, collection: Any, entry_id: str, document_id: str
+    ) -> None:
+        """Copy an entry under its document_id, reusing stored embedding."""
+        entry = collection.get(
+            ids=[entry_id], include=["embeddings", "documents", "metadatas"]
+        )
+        collection.upsert(
+            ids=[document_id],
+            embeddings=[entry["embeddings"][0]],
+            documents=[entry["documents"][0]],
+            metadatas=[entry["metadatas"][0]],
+        )
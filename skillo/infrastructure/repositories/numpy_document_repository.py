@@ -0,0 +1,622 @@
+import heapq
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+from skillo.domain.entities import Document
+from skillo.domain.enums import DocumentType
+from skillo.domain.exceptions import SkilloRepositoryError
+from skillo.domain.repositories import DocumentRepository
+from skillo.infrastructure.concurrency.resilience import (
+    ResilientCaller,
+    ResilientEmbeddings,
+)
+from skillo.infrastructure.concurrency.single_flight import (
+    SingleFlightEmbeddings,
+    get_single_flight,
+)
+from skillo.infrastructure.config.settings import Config
+
+
+class NumpyIndexConstants:
+    """NumPy vector index constants."""
+
+    DEFAULT_SIMILARITY_LIMIT = 10
+    INITIAL_CAPACITY = 1024
+    EMBEDDINGS_FILE = "embeddings.f32"
+    METADATA_FILE = "metadata.sqlite3"
+    IVF_TRAINING_ITERATIONS = 10
+    IVF_RETRAIN_DRIFT = 0.2
+    IVF = "ivf"
+    OPTIMISTIC_SEARCH_ATTEMPTS = 3
+
+
+class IVFIndex:
+    """Inverted file index over normalized vectors of one document type.
+
+    Rows written after training are filed into their nearest existing
+    list; the clustering is only redone once the rows added or removed
+    since exceed IVF_RETRAIN_DRIFT of the trained size.
+    """
+
+    def __init__(self, nlist: int, nprobe: int) -> None:
+        """Initialize with list count and probe count."""
+        self._nlist = nlist
+        self._nprobe = nprobe
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[np.ndarray] = []
+        self._trained_size = 0
+        self._changes = 0
+
+    @property
+    def needs_training(self) -> bool:
+        """Whether the index is untrained or has drifted too far."""
+        return (
+            self._centroids is None
+            or self._changes
+            > NumpyIndexConstants.IVF_RETRAIN_DRIFT * self._trained_size
+        )
+
+    def train(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        """Cluster vectors with spherical k-means and bucket their rows."""
+        nlist = min(self._nlist, len(rows))
+        rng = np.random.default_rng(0)
+        centroids = vectors[rng.choice(len(rows), nlist, replace=False)]
+
+        for _ in range(NumpyIndexConstants.IVF_TRAINING_ITERATIONS):
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            for list_id in range(nlist):
+                members = vectors[assignments == list_id]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[list_id] = centroid / np.linalg.norm(centroid)
+
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._lists = [rows[assignments == i] for i in range(nlist)]
+        self._trained_size = len(rows)
+        self._changes = 0
+
+    def add(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        """File rows into the lists of their nearest centroids."""
+        if self._centroids is None or not len(rows):
+            return
+
+        assignments = np.argmax(vectors @ self._centroids.T, axis=1)
+        for list_id in np.unique(assignments):
+            self._lists[list_id] = np.concatenate(
+                [self._lists[list_id], rows[assignments == list_id]]
+            )
+        self._changes += len(rows)
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Drop rows from the lists holding them."""
+        if self._centroids is None or not len(rows):
+            return
+
+        self._lists = [
+            members[~np.isin(members, rows)] for members in self._lists
+        ]
+        self._changes += len(rows)
+
+    def candidates(self, query: np.ndarray) -> np.ndarray:
+        """Rows in the lists closest to the query."""
+        if self._centroids is None:
+            return np.empty(0, dtype=np.int64)
+
+        nprobe = min(self._nprobe, len(self._lists))
+        probed = np.argpartition(-(self._centroids @ query), nprobe - 1)
+        return np.concatenate([self._lists[i] for i in probed[:nprobe]])
+
+
+class NumpyDocumentRepository(DocumentRepository):
+    """In-process vector repository on a memory-mapped embedding matrix."""
+
+    def __init__(self, config: Config) -> None:
+        """Initialize with config."""
+        self.config = config
+        self.index_path = self.config.NUMPY_INDEX_PATH
+        self.embeddings = SingleFlightEmbeddings(
+            ResilientEmbeddings(
+                OpenAIEmbeddings(
+                    api_key=self.config.OPENAI_API_KEY,  # type: ignore
+                    model=self.config.EMBEDDING_MODEL,
+                    max_retries=0,
+                ),
+                ResilientCaller.from_config("embeddings", self.config),
+            ),
+            get_single_flight("embeddings"),
+            self.config.EMBEDDING_MODEL,
+        )
+        self._lock = threading.RLock()
+        self._version = 0
+        self._initialize_index()
+
+    def _initialize_index(self) -> None:
+        """Open matrix file and metadata side table."""
+        try:
+            os.makedirs(self.index_path, exist_ok=True)
+
+            self._db = sqlite3.connect(
+                os.path.join(
+                    self.index_path, NumpyIndexConstants.METADATA_FILE
+                ),
+                check_same_thread=False,
+            )
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    row INTEGER PRIMARY KEY,
+                    document_id TEXT UNIQUE NOT NULL,
+                    document_type TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    metadata TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS index_info (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                """
+            )
+
+            info = dict(self._db.execute("SELECT key, value FROM index_info"))
+            self._matrix: Optional[np.memmap] = None
+            if info:
+                self._matrix = self._open_matrix(
+                    info["capacity"], info["dimension"], "r+"
+                )
+            self._load_rows()
+
+        except Exception as e:
+            path = self.index_path
+            error_msg = f"Failed to init vector index at '{path}': {str(e)}"
+            raise SkilloRepositoryError(error_msg)
+
+    def _open_matrix(
+        self, capacity: int, dimension: int, mode: Literal["r+", "w+"]
+    ) -> "np.memmap[Any, np.dtype[np.float32]]":
+        """Map the embedding matrix file."""
+        return np.memmap(
+            os.path.join(self.index_path, NumpyIndexConstants.EMBEDDINGS_FILE),
+            dtype=np.float32,
+            mode=mode,
+            shape=(capacity, dimension),
+        )
+
+    def _load_rows(self) -> None:
+        """Load the row layout from the side table.
+
+        Writes keep it up to date afterwards, so only opening the index
+        or recovering from a failed write reads the whole table.
+        """
+        self._row_by_id: Dict[str, int] = {}
+        self._id_by_row: Dict[int, str] = {}
+        self._type_by_row: Dict[int, DocumentType] = {}
+        self._rows_of_type: Dict[DocumentType, Set[int]] = {
+            doc_type: set() for doc_type in DocumentType
+        }
+        self._row_arrays: Dict[DocumentType, np.ndarray] = {}
+        self._ivf_indexes: Dict[DocumentType, IVFIndex] = {}
+        for row, document_id, document_type in self._db.execute(
+            "SELECT row, document_id, document_type FROM documents"
+        ):
+            self._assign_row(row, document_id, DocumentType(document_type))
+
+        self._next_row = max(self._id_by_row, default=-1) + 1
+        self._free_rows = sorted(
+            set(range(self._next_row)) - self._id_by_row.keys()
+        )
+        self._version += 1
+
+    def _assign_row(
+        self, row: int, document_id: str, doc_type: DocumentType
+    ) -> None:
+        """Record which document a matrix row holds."""
+        self._row_by_id[document_id] = row
+        self._id_by_row[row] = document_id
+        self._type_by_row[row] = doc_type
+        self._rows_of_type[doc_type].add(row)
+        self._row_arrays.pop(doc_type, None)
+
+    def _release_rows(self, rows: List[int]) -> None:
+        """Forget the documents of rows and drop them from IVF lists."""
+        for row in rows:
+            doc_type = self._type_by_row.pop(row)
+            self._rows_of_type[doc_type].discard(row)
+            self._row_arrays.pop(doc_type, None)
+            del self._row_by_id[self._id_by_row.pop(row)]
+
+        released = np.asarray(rows, dtype=np.int64)
+        for index in self._ivf_indexes.values():
+            index.remove(released)
+
+    def _index_rows(
+        self,
+        rows: List[int],
+        documents: List[Document],
+        vectors: np.ndarray,
+    ) -> None:
+        """Record written rows and file them into trained IVF lists."""
+        self._release_rows([row for row in rows if row in self._type_by_row])
+        for row, document in zip(rows, documents):
+            self._assign_row(row, document.id, document.document_type)
+
+        for doc_type, index in self._ivf_indexes.items():
+            selected = [
+                position
+                for position, document in enumerate(documents)
+                if document.document_type == doc_type
+            ]
+            index.add(
+                vectors[selected], np.asarray(rows, dtype=np.int64)[selected]
+            )
+        self._version += 1
+
+    def _type_rows(self, doc_type: DocumentType) -> np.ndarray:
+        """Matrix rows holding documents of a type."""
+        if doc_type not in self._row_arrays:
+            self._row_arrays[doc_type] = np.array(
+                sorted(self._rows_of_type[doc_type]), dtype=np.int64
+            )
+        return self._row_arrays[doc_type]
+
+    def _ensure_capacity(
+        self, required_rows: int, dimension: int
+    ) -> np.memmap:
+        """Create or grow the matrix file to hold the required rows."""
+        if self._matrix is not None:
+            if self._matrix.shape[1] != dimension:
+                raise SkilloRepositoryError(
+                    f"Embedding dimension {dimension} does not match index "
+                    f"dimension {self._matrix.shape[1]}"
+                )
+            if required_rows <= self._matrix.shape[0]:
+                return self._matrix
+
+        capacity = NumpyIndexConstants.INITIAL_CAPACITY
+        while capacity < required_rows:
+            capacity *= 2
+
+        if self._matrix is None:
+            self._matrix = self._open_matrix(capacity, dimension, "w+")
+        else:
+            self._matrix.flush()
+            del self._matrix
+            path = os.path.join(
+                self.index_path, NumpyIndexConstants.EMBEDDINGS_FILE
+            )
+            with open(path, "r+b") as matrix_file:
+                matrix_file.truncate(capacity * dimension * 4)
+            self._matrix = self._open_matrix(capacity, dimension, "r+")
+
+        self._db.executemany(
+            "INSERT OR REPLACE INTO index_info (key, value) VALUES (?, ?)",
+            [("capacity", capacity), ("dimension", dimension)],
+        )
+        return self._matrix
+
+    def reset(self) -> None:
+        """Remove all stored vectors and metadata."""
+        with self._lock:
+            self._db.close()
+            self._matrix = None
+            shutil.rmtree(self.index_path, ignore_errors=True)
+            self._initialize_index()
+
+    def add_document(self, document: Document) -> bool:
+        """Add or replace document in the index."""
+        return self.add_documents([document])
+
+    def add_documents(self, documents: List[Document]) -> bool:
+        """Embed and upsert documents keyed by document id."""
+        if not documents:
+            return True
+
+        unique_documents = list(
+            {document.id: document for document in documents}.values()
+        )
+
+        try:
+            vectors = self.embeddings.embed_documents(
+                [document.content for document in unique_documents]
+            )
+            return self.upsert_embeddings(unique_documents, vectors)
+
+        except SkilloRepositoryError:
+            raise
+        except Exception as e:
+            document_ids = ", ".join(d.id for d in unique_documents)
+            raise SkilloRepositoryError(
+                f"Failed to add documents {document_ids}: {str(e)}"
+            )
+
+    def upsert_embeddings(
+        self, documents: List[Document], vectors: Sequence[Sequence[float]]
+    ) -> bool:
+        """Store documents with precomputed embeddings."""
+        matrix_rows = np.array(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix_rows, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        matrix_rows /= norms
+
+        with self._lock:
+            rows = self._allocate_rows([d.id for d in documents])
+            try:
+                matrix = self._ensure_capacity(
+                    max(rows) + 1, matrix_rows.shape[1]
+                )
+                matrix[rows] = matrix_rows
+                matrix.flush()
+
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO documents "
+                    "(row, document_id, document_type, content, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            row,
+                            document.id,
+                            document.document_type.value,
+                            document.content,
+                            json.dumps(document.metadata, default=str),
+                        )
+                        for row, document in zip(rows, documents)
+                    ],
+                )
+                self._db.commit()
+
+            except SkilloRepositoryError:
+                self._db.rollback()
+                self._load_rows()
+                raise
+            except Exception as e:
+                self._db.rollback()
+                self._load_rows()
+                raise SkilloRepositoryError(
+                    f"Failed to store embeddings: {str(e)}"
+                )
+
+            self._index_rows(rows, documents, matrix_rows)
+            return True
+
+    def _allocate_rows(self, document_ids: List[str]) -> List[int]:
+        """Existing rows for known ids, freed or new rows for others."""
+        rows = []
+        for document_id in document_ids:
+            row = self._row_by_id.get(document_id)
+            if row is None:
+                if self._free_rows:
+                    row = heapq.heappop(self._free_rows)
+                else:
+                    row = self._next_row
+                    self._next_row += 1
+            rows.append(row)
+        return rows
+
+    def get_documents_by_type(self, doc_type: DocumentType) -> List[Document]:
+        """Get documents by type."""
+        try:
+            with self._lock:
+                records = self._db.execute(
+                    "SELECT document_id, document_type, content, metadata "
+                    "FROM documents WHERE document_type = ? ORDER BY row",
+                    (doc_type.value,),
+                ).fetchall()
+            return [self._to_domain_document(record) for record in records]
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to get documents by type {doc_type}: {str(e)}"
+            )
+
+    def get_documents_by_ids(self, document_ids: List[str]) -> List[Document]:
+        """Get stored documents by id, skipping unknown ids."""
+        if not document_ids:
+            return []
+
+        try:
+            placeholders = ", ".join("?" for _ in document_ids)
+            with self._lock:
+                records = self._db.execute(
+                    "SELECT document_id, document_type, content, metadata "
+                    f"FROM documents WHERE document_id IN ({placeholders})",
+                    document_ids,
+                ).fetchall()
+            return [self._to_domain_document(record) for record in records]
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to get documents {', '.join(document_ids)}: {str(e)}"
+            )
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """Delete documents; their matrix rows are reused by later writes."""
+        if not document_ids:
+            return 0
+
+        try:
+            placeholders = ", ".join("?" for _ in document_ids)
+            with self._lock:
+                cursor = self._db.execute(
+                    f"DELETE FROM documents WHERE document_id IN "
+                    f"({placeholders})",
+                    document_ids,
+                )
+                self._db.commit()
+                rows = [
+                    self._row_by_id[document_id]
+                    for document_id in set(document_ids)
+                    if document_id in self._row_by_id
+                ]
+                self._release_rows(rows)
+                for row in rows:
+                    heapq.heappush(self._free_rows, row)
+                self._version += 1
+            return cursor.rowcount
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to delete documents {', '.join(document_ids)}: "
+                f"{str(e)}"
+            )
+
+    def find_similar_documents(
+        self,
+        query: str,
+        doc_type: DocumentType,
+        limit: int = NumpyIndexConstants.DEFAULT_SIMILARITY_LIMIT,
+    ) -> List[Document]:
+        """Find documents similar to the query text."""
+        try:
+            query_vector = self.embeddings.embed_query(query)
+            return self.search_by_vector(query_vector, doc_type, limit)
+
+        except SkilloRepositoryError:
+            raise
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to find similar documents: {str(e)}"
+            )
+
+    def find_similar_documents_with_scores(
+        self,
+        query: str,
+        doc_type: DocumentType,
+        limit: int = NumpyIndexConstants.DEFAULT_SIMILARITY_LIMIT,
+    ) -> List[Tuple[Document, float]]:
+        """Find similar documents with their cosine similarity."""
+        try:
+            query_vector = self.embeddings.embed_query(query)
+            return self._scored_search(query_vector, doc_type, limit)
+
+        except SkilloRepositoryError:
+            raise
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to find similar documents: {str(e)}"
+            )
+
+    def search_by_vector(
+        self,
+        query_vector: Sequence[float],
+        doc_type: DocumentType,
+        limit: int = NumpyIndexConstants.DEFAULT_SIMILARITY_LIMIT,
+    ) -> List[Document]:
+        """Top-k documents of a type by cosine similarity to a vector."""
+        return [
+            document
+            for document, _ in self._scored_search(
+                query_vector, doc_type, limit
+            )
+        ]
+
+    def _scored_search(
+        self,
+        query_vector: Sequence[float],
+        doc_type: DocumentType,
+        limit: int,
+    ) -> List[Tuple[Document, float]]:
+        """Top-k documents with similarity clipped to [0, 1], best first."""
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        ranked = self._ranked_ids(query, doc_type, limit)
+        documents = {
+            document.id: document
+            for document in self.get_documents_by_ids(
+                [document_id for document_id, _ in ranked]
+            )
+        }
+        return [
+            (documents[document_id], float(np.clip(score, 0.0, 1.0)))
+            for document_id, score in ranked
+            if document_id in documents
+        ]
+
+    def _ranked_ids(
+        self, query: np.ndarray, doc_type: DocumentType, limit: int
+    ) -> List[Tuple[str, float]]:
+        """Top-k document ids with scores, best first.
+
+        Scoring runs outside the lock. A write in the meantime may have
+        given a ranked row to another document, so the rows are mapped to
+        ids only if no write happened; otherwise the search is retried,
+        the last time under the lock.
+        """
+        for _ in range(NumpyIndexConstants.OPTIMISTIC_SEARCH_ATTEMPTS):
+            with self._lock:
+                version = self._version
+                matrix = self._matrix
+                rows = self._candidate_rows(query, doc_type)
+
+            ranked = self._rank(matrix, rows, query, limit)
+            with self._lock:
+                if self._version == version:
+                    return [(self._id_by_row[row], s) for row, s in ranked]
+
+        with self._lock:
+            ranked = self._rank(
+                self._matrix,
+                self._candidate_rows(query, doc_type),
+                query,
+                limit,
+            )
+            return [(self._id_by_row[row], s) for row, s in ranked]
+
+    @staticmethod
+    def _rank(
+        matrix: Optional[np.memmap],
+        rows: np.ndarray,
+        query: np.ndarray,
+        limit: int,
+    ) -> List[Tuple[int, float]]:
+        """Top-k rows by cosine similarity to the query, best first."""
+        if matrix is None or len(rows) == 0:
+            return []
+
+        scores = matrix[rows] @ query
+        top_k = min(limit, len(rows))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [
+            (int(row), float(score))
+            for row, score in zip(rows[best], scores[best])
+        ]
+
+    def _candidate_rows(
+        self, query: np.ndarray, doc_type: DocumentType
+    ) -> np.ndarray:
+        """All rows of a type, or the IVF-probed subset when enabled."""
+        rows = self._type_rows(doc_type)
+        if (
+            self.config.NUMPY_INDEX_TYPE != NumpyIndexConstants.IVF
+            or self._matrix is None
+            or len(rows) <= self.config.NUMPY_IVF_NLIST
+        ):
+            return rows
+
+        index = self._ivf_indexes.get(doc_type)
+        if index is None or index.needs_training:
+            index = IVFIndex(
+                self.config.NUMPY_IVF_NLIST, self.config.NUMPY_IVF_NPROBE
+            )
+            index.train(np.asarray(self._matrix[rows]), rows)
+            self._ivf_indexes[doc_type] = index
+
+        return index.candidates(query)
+
+    def _to_domain_document(self, record: Tuple[Any, ...]) -> Document:
+        """Convert side table record to domain document."""
+        document_id, document_type, content, metadata = record
+        return Document(
+            id=document_id,
+            document_type=DocumentType(document_type),
+            content=content,
+            metadata=json.loads(metadata),
+        )
@@ -0,0 +1,61 @@
+from typing import List, Optional
+
+from skillo.domain.entities import Document
+from skillo.domain.enums import DocumentType
+from skillo.domain.exceptions import SkilloRepositoryError
+from skillo.domain.repositories import ManagementRepository
+from skillo.infrastructure.repositories.numpy_document_repository import (
+    NumpyDocumentRepository,
+)
+
+
+class NumpyManagementRepository(ManagementRepository):
+    """NumPy index implementation of ManagementRepository interface."""
+
+    def __init__(self, document_repository: NumpyDocumentRepository):
+        """Initialize with document repository for access to the index."""
+        self._document_repository = document_repository
+
+    def reset_database(self) -> bool:
+        """Reset the entire index."""
+        try:
+            self._document_repository.reset()
+            return True
+
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to reset database: {str(e)}")
+
+    def get_all_documents(self) -> List[Document]:
+        """Get all documents from the index for management operations."""
+        try:
+            return [
+                document
+                for doc_type in DocumentType
+                for document in self._document_repository.get_documents_by_type(
+                    doc_type
+                )
+            ]
+
+        except Exception as e:
+            error_msg = f"Failed to get all documents: {str(e)}"
+            raise SkilloRepositoryError(error_msg)
+
+    def compact_duplicates(self) -> int:
+        """Rows are keyed by document id, so there is nothing to collapse."""
+        return 0
+
+    def rebuild_index(self, target_collection_name: str) -> int:
+        """Collections only exist in the Chroma backend."""
+        raise SkilloRepositoryError(
+            "Index rebuild into a collection requires VECTOR_BACKEND=chroma"
+        )
+
+    def migrate_layout(
+        self,
+        target_layout: str,
+        target_collection_name: Optional[str] = None,
+    ) -> int:
+        """Collection layouts only exist in the Chroma backend."""
+        raise SkilloRepositoryError(
+            "Collection layout migration requires VECTOR_BACKEND=chroma"
+        )
@@ -0,0 +1,203 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from skillo.domain.entities import AgentScores, MatchRecord
+from skillo.domain.enums import MatchRecommendation
+from skillo.domain.exceptions import SkilloRepositoryError
+from skillo.domain.repositories import MatchRepository
+from skillo.infrastructure.concurrency.shared_sqlite import connect_shared
+from skillo.infrastructure.config.settings import Config
+
+
+class SqliteMatchRepository(MatchRepository):
+    """SQLite-backed match matrix with agent sub-scores."""
+
+    DELETE_CHUNK_SIZE = 400
+
+    COLUMNS = (
+        "cv_id, job_id, fingerprint, weighted_final_score, recommendation, "
+        "explanation, skills_score, location_score, experience_score, "
+        "preferences_score, education_score, detailed_results"
+    )
+
+    def __init__(self, config: Config) -> None:
+        """Initialize with config."""
+        self.db_path = config.MATCH_DB_PATH
+        self._lock = threading.Lock()
+
+        try:
+            self._db = connect_shared(self.db_path)
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS matches (
+                    cv_id TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    weighted_final_score REAL NOT NULL,
+                    recommendation TEXT NOT NULL,
+                    explanation TEXT NOT NULL,
+                    skills_score REAL NOT NULL,
+                    location_score REAL NOT NULL,
+                    experience_score REAL NOT NULL,
+                    preferences_score REAL NOT NULL,
+                    education_score REAL NOT NULL,
+                    detailed_results TEXT NOT NULL,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (cv_id, job_id)
+                );
+                CREATE INDEX IF NOT EXISTS matches_by_job
+                    ON matches (job_id, weighted_final_score);
+                """
+            )
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to init match store at '{self.db_path}': {str(e)}"
+            )
+
+    def save_matches(self, records: List[MatchRecord]) -> None:
+        """Insert or replace match records."""
+        if not records:
+            return
+
+        try:
+            with self._lock:
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO matches ({self.COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [self._to_row(record) for record in records],
+                )
+                self._db.commit()
+
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to save matches: {str(e)}")
+
+    def get_match(self, cv_id: str, job_id: str) -> Optional[MatchRecord]:
+        """Get stored match for a pair."""
+        records = self._query("WHERE cv_id = ? AND job_id = ?", cv_id, job_id)
+        return records[0] if records else None
+
+    def get_matches_for_cv(self, cv_id: str) -> List[MatchRecord]:
+        """Get stored matches of a CV, best first."""
+        return self._query(
+            "WHERE cv_id = ? ORDER BY weighted_final_score DESC", cv_id
+        )
+
+    def get_matches_for_job(self, job_id: str) -> List[MatchRecord]:
+        """Get stored matches of a job, best first."""
+        return self._query(
+            "WHERE job_id = ? ORDER BY weighted_final_score DESC", job_id
+        )
+
+    def get_fingerprints(self) -> Dict[Tuple[str, str], str]:
+        """Get stored fingerprints keyed by (cv_id, job_id)."""
+        try:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT cv_id, job_id, fingerprint FROM matches"
+                ).fetchall()
+            return {(cv_id, job_id): fp for cv_id, job_id, fp in rows}
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to read match fingerprints: {str(e)}"
+            )
+
+    def get_score_rows(self) -> List[Tuple[Any, ...]]:
+        """Get score rows of every stored pair."""
+        try:
+            with self._lock:
+                return self._db.execute(
+                    "SELECT cv_id, job_id, weighted_final_score, "
+                    "skills_score, location_score, experience_score, "
+                    "preferences_score, education_score FROM matches"
+                ).fetchall()
+
+        except Exception as e:
+            raise SkilloRepositoryError(
+                f"Failed to read match scores: {str(e)}"
+            )
+
+    def delete_matches_for(self, document_ids: List[str]) -> int:
+        """Delete stored matches involving any of the documents.
+
+        Ids are deleted in chunks to stay under SQLite's variable limit.
+        """
+        try:
+            deleted = 0
+            with self._lock:
+                size = self.DELETE_CHUNK_SIZE
+                for start in range(0, len(document_ids), size):
+                    end = start + size
+                    chunk = document_ids[start:end]
+                    marks = ", ".join("?" * len(chunk))
+                    deleted += self._db.execute(
+                        f"DELETE FROM matches WHERE cv_id IN ({marks}) "
+                        f"OR job_id IN ({marks})",
+                        chunk + chunk,
+                    ).rowcount
+                self._db.commit()
+            return deleted
+
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to delete matches: {str(e)}")
+
+    def delete_all_matches(self) -> None:
+        """Delete every stored match."""
+        try:
+            with self._lock:
+                self._db.execute("DELETE FROM matches")
+                self._db.commit()
+
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to clear matches: {str(e)}")
+
+    def _query(self, clause: str, *params: Any) -> List[MatchRecord]:
+        """Select records with a WHERE/ORDER clause."""
+        try:
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT {self.COLUMNS} FROM matches {clause}", params
+                ).fetchall()
+            return [self._to_record(row) for row in rows]
+
+        except Exception as e:
+            raise SkilloRepositoryError(f"Failed to read matches: {str(e)}")
+
+    def _to_row(self, record: MatchRecord) -> Tuple[Any, ...]:
+        """Flatten record into a table row."""
+        scores = record.agent_scores
+        return (
+            record.cv_id,
+            record.job_id,
+            record.fingerprint,
+            record.weighted_final_score,
+            record.recommendation.value,
+            record.explanation,
+            scores.skills_score,
+            scores.location_score,
+            scores.experience_score,
+            scores.preferences_score,
+            scores.education_score,
+            json.dumps(record.detailed_results, default=str),
+        )
+
+    def _to_record(self, row: Tuple[Any, ...]) -> MatchRecord:
+        """Build record from a table row."""
+        return MatchRecord(
+            cv_id=row[0],
+            job_id=row[1],
+            fingerprint=row[2],
+            weighted_final_score=row[3],
+            recommendation=MatchRecommendation(row[4]),
+            explanation=row[5],
+            agent_scores=AgentScores(
+                skills_score=row[6],
+                location_score=row[7],
+                experience_score=row[8],
+                preferences_score=row[9],
+                education_score=row[10],
+            ),
+            detailed_results=json.loads(row[11]),
+        )
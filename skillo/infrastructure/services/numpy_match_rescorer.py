@@ -0,0 +1,120 @@
+from typing import Dict, Set, Tuple
+
+import numpy as np
+
+from skillo.domain.entities import MatchRecord
+from skillo.domain.enums import RECOMMENDATION_THRESHOLDS, MatchRecommendation
+from skillo.domain.repositories import DocumentRepository, MatchRepository
+from skillo.domain.services import (
+    AGENT_SCORE_NAMES,
+    MatchRescoringService,
+    RescoredPair,
+    RescoreSummary,
+)
+
+
+class NumpyMatchRescorer(MatchRescoringService):
+    """Vectorized re-weighting of the stored match matrix."""
+
+    THRESHOLDS = np.array(
+        [threshold for threshold, _ in RECOMMENDATION_THRESHOLDS]
+    )
+    LABELS = [
+        recommendation.value for _, recommendation in RECOMMENDATION_THRESHOLDS
+    ] + [MatchRecommendation.NO_MATCH.value]
+
+    def __init__(
+        self,
+        match_repository: MatchRepository,
+        document_repository: DocumentRepository,
+    ) -> None:
+        """Initialize with the match store and the documents it refers to."""
+        self._match_repository = match_repository
+        self._document_repository = document_repository
+
+    def rescore(
+        self, agent_weights: Dict[str, float], top_count: int = 10
+    ) -> RescoreSummary:
+        """Recompute final scores and recommendations of stored pairs.
+
+        Only pairs that would still be served are counted: both documents
+        exist and the stored fingerprint matches their current state.
+        """
+        fresh_pairs = self._fresh_pairs()
+        rows = [
+            row
+            for row in self._match_repository.get_score_rows()
+            if (row[0], row[1]) in fresh_pairs
+        ]
+        if not rows:
+            return RescoreSummary()
+
+        table = np.array(rows, dtype=object)
+        stored_scores = table[:, 2].astype(np.float64)
+        agent_scores = table[:, 3:].astype(np.float64)
+
+        weights = np.array(
+            [
+                agent_weights.get(f"{name}_weight", 0.0)
+                for name in AGENT_SCORE_NAMES
+            ],
+            dtype=np.float64,
+        )
+        if weights.sum() > 0:
+            weights = weights / weights.sum()
+
+        scores = agent_scores @ weights
+        bands = self._bands(scores)
+        counts = np.bincount(bands, minlength=len(self.LABELS))
+
+        top_count = min(top_count, len(scores))
+        top_indices = np.argpartition(-scores, top_count - 1)[:top_count]
+        top_indices = top_indices[
+            np.argsort(-scores[top_indices], kind="stable")
+        ]
+
+        return RescoreSummary(
+            total_pairs=len(scores),
+            changed_recommendations=int(
+                np.count_nonzero(bands != self._bands(stored_scores))
+            ),
+            recommendation_counts={
+                label: int(count) for label, count in zip(self.LABELS, counts)
+            },
+            top_pairs=[
+                RescoredPair(
+                    cv_id=table[index, 0],
+                    job_id=table[index, 1],
+                    weighted_final_score=float(scores[index]),
+                    recommendation=self.LABELS[bands[index]],
+                    stored_score=float(stored_scores[index]),
+                )
+                for index in top_indices
+            ],
+        )
+
+    def _fresh_pairs(self) -> Set[Tuple[str, str]]:
+        """Stored pairs whose fingerprint matches the current documents."""
+        fingerprints = self._match_repository.get_fingerprints()
+        document_ids = {doc_id for pair in fingerprints for doc_id in pair}
+        documents = {
+            document.id: document
+            for document in self._document_repository.get_documents_by_ids(
+                list(document_ids)
+            )
+        }
+        return {
+            (cv_id, job_id)
+            for (cv_id, job_id), fingerprint in fingerprints.items()
+            if cv_id in documents
+            and job_id in documents
+            and fingerprint
+            == MatchRecord.fingerprint_for(documents[cv_id], documents[job_id])
+        }
+
+    def _bands(self, scores: np.ndarray) -> np.ndarray:
+        """Index into LABELS of each score's recommendation band."""
+        bands: np.ndarray = np.sum(
+            scores[:, None] < self.THRESHOLDS[None, :], axis=1
+        )
+        return bands
@@ -1,8 +1,16 @@
-from .date_tools import calculate_years_between_tool, get_current_date_tool
-from .geo_tools import calculate_distance_tool
+from .date_tools import (
+    calculate_years_between_tool,
+    current_date_text,
+    get_current_date_tool,
+    summarize_experience,
+)
+from .geo_tools import calculate_distance_tool, distance_between
 
 __all__ = [
     "calculate_distance_tool",
+    "distance_between",
     "get_current_date_tool",
     "calculate_years_between_tool",
+    "current_date_text",
+    "summarize_experience",
 ]
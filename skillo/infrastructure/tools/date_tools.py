@@ -1,14 +1,158 @@
+import re
 from datetime import datetime
+from typing import List, Optional, Set, Tuple
 
 from langchain.tools import tool
 
+PRESENT_WORDS = ("current", "present", "now", "today", "obecnie", "teraz")
+
+MONTH_NAMES = {
+    **{
+        name: number
+        for number, names in enumerate(
+            [
+                ("january", "jan", "styczen", "stycznia", "sty"),
+                ("february", "feb", "luty", "lutego", "lut"),
+                ("march", "mar", "marzec", "marca"),
+                ("april", "apr", "kwiecien", "kwietnia", "kwi"),
+                ("may", "maj", "maja"),
+                ("june", "jun", "czerwiec", "czerwca", "cze"),
+                ("july", "jul", "lipiec", "lipca", "lip"),
+                ("august", "aug", "sierpien", "sierpnia", "sie"),
+                ("september", "sep", "sept", "wrzesien", "wrzesnia", "wrz"),
+                ("october", "oct", "pazdziernik", "pazdziernika", "paz"),
+                ("november", "nov", "listopad", "listopada", "lis"),
+                ("december", "dec", "grudzien", "grudnia", "gru"),
+            ],
+            start=1,
+        )
+        for name in names
+    }
+}
+POLISH_LETTERS = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+
+DATE_TOKEN = re.compile(
+    r"(?P<month_num>\d{1,2})[./](?P<year_a>\d{4})"
+    r"|(?P<year_b>\d{4})-(?P<month_iso>\d{1,2})(?!\d)"
+    r"|\b(?P<month_name>"
+    + "|".join(sorted(MONTH_NAMES, key=len, reverse=True))
+    + r")\b\.?\s+(?P<year_c>\d{4})"
+    r"|(?P<year_d>(?:19|20)\d{2})"
+    r"|\b(?P<present>" + "|".join(PRESENT_WORDS) + r")\b",
+    re.IGNORECASE,
+)
+RANGE_SEPARATOR = re.compile(r"^\s*(?:[-–—]|to|do|until)\s*$", re.IGNORECASE)
+
+YearMonth = Tuple[int, int]
+
+
+def parse_year_month(text: str, is_end: bool = False) -> Optional[YearMonth]:
+    """Parse MM.YYYY, MM/YYYY, YYYY-MM, "Mon YYYY", YYYY or "present"."""
+    match = DATE_TOKEN.fullmatch(text.strip().translate(POLISH_LETTERS))
+    if not match:
+        return None
+    return _token_year_month(match, is_end)
+
+
+def years_between(start: YearMonth, end: YearMonth) -> float:
+    """Years from start to end month."""
+    return ((end[0] - start[0]) * 12 + (end[1] - start[1])) / 12.0
+
+
+def find_employment_spans(text: str) -> List[Tuple[YearMonth, YearMonth]]:
+    """Date ranges such as "03.2019 - present" found in free text."""
+    text = text.translate(POLISH_LETTERS)
+    tokens = list(DATE_TOKEN.finditer(text))
+    spans = []
+    for start_token, end_token in zip(tokens, tokens[1:]):
+        gap_start, gap_end = start_token.end(), end_token.start()
+        if not RANGE_SEPARATOR.match(text[gap_start:gap_end]):
+            continue
+
+        start = _token_year_month(start_token, is_end=False)
+        end = _token_year_month(end_token, is_end=True)
+        if start and end and start_token.group("present") is None:
+            if start <= end <= _current_year_month():
+                spans.append((start, end))
+    return spans
+
+
+def summarize_experience(entries: List[str]) -> Tuple[List[str], float]:
+    """Employment spans and total years, overlapping months counted once."""
+    spans = [
+        span for entry in entries for span in find_employment_spans(entry)
+    ]
+    if not spans:
+        return [], 0.0
+
+    covered_months: Set[int] = set()
+    for (start_year, start_month), (end_year, end_month) in spans:
+        covered_months.update(
+            range(
+                start_year * 12 + start_month - 1,
+                end_year * 12 + end_month,
+            )
+        )
+
+    current = _current_year_month()
+    labels = [
+        f"{_format(start)} to {'present' if end == current else _format(end)}"
+        for start, end in sorted(spans)
+    ]
+    return labels, round(len(covered_months) / 12.0, 1)
+
+
+def current_date_text() -> str:
+    """Current date line inserted into prompts."""
+    now = datetime.now()
+    return (
+        f"Current date: {now.strftime('%Y-%m-%d')}, Current year: {now.year}"
+    )
+
+
+def _token_year_month(
+    match: re.Match[str], is_end: bool
+) -> Optional[YearMonth]:
+    """Year and month of a matched date token.
+
+    A bare year ending a range means December of that year, or the
+    current month when that year is the current one.
+    """
+    if match.group("present"):
+        return _current_year_month()
+
+    if match.group("year_a"):
+        year, month = int(match.group("year_a")), int(match.group("month_num"))
+    elif match.group("year_b"):
+        year, month = int(match.group("year_b")), int(match.group("month_iso"))
+    elif match.group("year_c"):
+        name = match.group("month_name").lower()
+        year, month = int(match.group("year_c")), MONTH_NAMES[name]
+    else:
+        year, month = int(match.group("year_d")), 12 if is_end else 1
+        current_year, current_month = _current_year_month()
+        if is_end and year == current_year:
+            month = current_month
+
+    if not 1 <= month <= 12 or year < 1950:
+        return None
+    return year, month
+
+
+def _current_year_month() -> YearMonth:
+    now = datetime.now()
+    return now.year, now.month
+
+
+def _format(year_month: YearMonth) -> str:
+    return f"{year_month[0]}-{year_month[1]:02d}"
+
 
 @tool
 def get_current_date_tool() -> str:
     """Get the current date and year as a string."""
     try:
-        now = datetime.now()
-        return f"Current date: {now.strftime('%Y-%m-%d')}, Current year: {now.year}"
+        return current_date_text()
     except Exception as e:
         return f"Error getting current date: {str(e)}"
 
@@ -19,39 +163,14 @@ def calculate_years_between_tool(
 ) -> str:
     """Calculate years between two dates."""
     try:
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-
-        if "." in start_date:
-            month, year = start_date.split(".")
-            start_year = int(year)
-            start_month = int(month)
-        elif "-" in start_date:
-            year, month = start_date.split("-")[:2]
-            start_year = int(year)
-            start_month = int(month)
-        else:
-            start_year = int(start_date)
-            start_month = 1
-
-        if end_date.lower() in ["current", "obecnie", "present"]:
-            end_year = current_year
-            end_month = current_month
-        elif "." in end_date:
-            month, year = end_date.split(".")
-            end_year = int(year)
-            end_month = int(month)
-        elif "-" in end_date:
-            year, month = end_date.split("-")[:2]
-            end_year = int(year)
-            end_month = int(month)
-        else:
-            end_year = int(end_date)
-            end_month = 12
-
-        years = end_year - start_year
-        months = end_month - start_month
-        total_years = years + (months / 12.0)
+        start = parse_year_month(start_date)
+        end = parse_year_month(end_date, is_end=True)
+        if start is None or end is None:
+            raise ValueError(
+                f"Unrecognized date in '{start_date}' or '{end_date}'"
+            )
+
+        total_years = years_between(start, end)
 
         return f"Years between {start_date} and {end_date}: {total_years:.1f} years"
 
@@ -1,7 +1,26 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from geopy.distance import geodesic  # type: ignore
-from geopy.geocoders import Nominatim  # type: ignore
 from langchain.tools import tool
 
+from skillo.infrastructure.tools.geocoding import get_geocoder
+
+
+@lru_cache(maxsize=4096)
+def geocode_city(city: str) -> Optional[Tuple[float, float]]:
+    """Coordinates of a city from the gazetteer or geocode cache."""
+    return get_geocoder().locate(city)
+
+
+def distance_between(city1: str, city2: str) -> Optional[float]:
+    """Geodesic distance in km, None when a city cannot be resolved."""
+    coords1 = geocode_city(city1.strip())
+    coords2 = geocode_city(city2.strip())
+    if not coords1 or not coords2:
+        return None
+    return float(geodesic(coords1, coords2).kilometers)
+
 
 @tool
 def calculate_distance_tool(cities: str) -> str:
@@ -16,10 +35,8 @@ def calculate_distance_tool(cities: str) -> str:
         if not city1 or not city2:
             return "Error: Both city names are required"
 
-        geolocator = Nominatim(user_agent="skillo", timeout=10)
-
-        coords1 = geolocator.geocode(city1)
-        coords2 = geolocator.geocode(city2)
+        coords1 = geocode_city(city1)
+        coords2 = geocode_city(city2)
 
         if not coords1:
             return f"Error: Could not find coordinates for {city1}"
@@ -27,10 +44,7 @@ def calculate_distance_tool(cities: str) -> str:
         if not coords2:
             return f"Error: Could not find coordinates for {city2}"
 
-        distance_km = geodesic(
-            (coords1.latitude, coords1.longitude),
-            (coords2.latitude, coords2.longitude),
-        ).kilometers
+        distance_km = geodesic(coords1, coords2).kilometers
 
         return f"Distance between {city1} and {city2}: {distance_km:.1f} km"
 
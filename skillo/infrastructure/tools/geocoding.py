@@ -0,0 +1,196 @@
+import csv
+import os
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from geopy.geocoders import Nominatim  # type: ignore
+
+from skillo.infrastructure.concurrency.shared_sqlite import connect_shared
+from skillo.infrastructure.config.settings import Config
+
+Coordinates = Tuple[float, float]
+
+UNDECOMPOSABLE_LETTERS = str.maketrans(
+    {"ł": "l", "ø": "o", "đ": "d", "ß": "ss", "æ": "ae", "œ": "oe", "ı": "i"}
+)
+
+
+def normalize_place(name: str) -> str:
+    """Lowercase, accent-free, single-spaced place name."""
+    folded = name.lower().translate(UNDECOMPOSABLE_LETTERS)
+    decomposed = unicodedata.normalize("NFKD", folded)
+    ascii_name = decomposed.encode("ascii", "ignore").decode("ascii")
+    parts = [" ".join(part.split()) for part in ascii_name.split(",")]
+    return ", ".join(part for part in parts if part)
+
+
+class Gazetteer:
+    """Offline city coordinates, memory-mapped and sorted by name."""
+
+    NAME_BYTES = 64
+    DTYPE = np.dtype(
+        [
+            ("name", f"S{NAME_BYTES}"),
+            ("latitude", "<f4"),
+            ("longitude", "<f4"),
+        ]
+    )
+
+    def __init__(self, path: str) -> None:
+        """Map the gazetteer file without reading it into memory."""
+        self._entries = np.load(path, mmap_mode="r")
+        self._names = self._entries["name"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, name: str) -> Optional[Coordinates]:
+        """Coordinates for "City, Country" or, failing that, "City"."""
+        normalized = normalize_place(name)
+        candidates = [normalized, normalized.split(",")[0].strip()]
+        for candidate in candidates:
+            key = candidate.encode("ascii")[: self.NAME_BYTES]
+            index = int(np.searchsorted(self._names, key))
+            if index < len(self._names) and self._names[index] == key:
+                entry = self._entries[index]
+                return float(entry["latitude"]), float(entry["longitude"])
+        return None
+
+    @classmethod
+    def build_from_csv(cls, source_path: str, output_path: str) -> int:
+        """Build from a CSV with name, country, latitude, longitude columns.
+
+        An optional population column decides which city keeps the bare
+        "City" key when several countries share a name.
+        """
+        with open(source_path, "r", encoding="utf-8", newline="") as f:
+            return cls.build(csv.DictReader(f), output_path)
+
+    @classmethod
+    def build(cls, rows: Iterable[Dict[str, Any]], output_path: str) -> int:
+        """Write sorted entries keyed by "city, country" and "city"."""
+        entries: Dict[str, Tuple[float, Coordinates]] = {}
+        for row in rows:
+            city = normalize_place(row["name"])
+            country = normalize_place(row.get("country") or "")
+            coordinates = (float(row["latitude"]), float(row["longitude"]))
+            population = float(row.get("population") or 0)
+
+            keys = [city, f"{city}, {country}" if country else city]
+            for key in keys:
+                if key and population >= entries.get(key, (-1.0,))[0]:
+                    entries[key] = (population, coordinates)
+
+        names = sorted(
+            key
+            for key in entries
+            if len(key.encode("ascii")) <= cls.NAME_BYTES
+        )
+        table = np.zeros(len(names), dtype=cls.DTYPE)
+        for index, key in enumerate(names):
+            latitude, longitude = entries[key][1]
+            table[index] = (key.encode("ascii"), latitude, longitude)
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        np.save(output_path, table)
+        return len(names)
+
+
+class GeocodeCache:
+    """Persistent place-name to coordinates cache, misses included."""
+
+    def __init__(self, path: str) -> None:
+        """Open or create the cache database."""
+        self._lock = threading.Lock()
+        self._db = connect_shared(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS geocodes ("
+            "name TEXT PRIMARY KEY, latitude REAL, longitude REAL)"
+        )
+
+    def get(self, name: str) -> Tuple[bool, Optional[Coordinates]]:
+        """(hit, coordinates); coordinates are None for cached misses."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT latitude, longitude FROM geocodes WHERE name = ?",
+                (name,),
+            ).fetchone()
+        if row is None:
+            return False, None
+        if row[0] is None:
+            return True, None
+        return True, (row[0], row[1])
+
+    def put(self, name: str, coordinates: Optional[Coordinates]) -> None:
+        """Store a lookup result."""
+        latitude, longitude = coordinates or (None, None)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?)",
+                (name, latitude, longitude),
+            )
+            self._db.commit()
+
+
+class Geocoder:
+    """Gazetteer first, then the persistent cache, then Nominatim."""
+
+    def __init__(
+        self,
+        cache_path: str,
+        gazetteer_path: str = "",
+        online: bool = True,
+    ) -> None:
+        """Initialize lookup layers; the gazetteer is optional."""
+        self.gazetteer = (
+            Gazetteer(gazetteer_path)
+            if gazetteer_path and os.path.exists(gazetteer_path)
+            else None
+        )
+        self.cache = GeocodeCache(cache_path)
+        self.online = online
+        self._geolocator: Optional[Nominatim] = None
+
+    def locate(self, place: str) -> Optional[Coordinates]:
+        """Coordinates of a place, None when it cannot be resolved."""
+        name = normalize_place(place)
+        if not name:
+            return None
+
+        if self.gazetteer:
+            coordinates = self.gazetteer.lookup(name)
+            if coordinates:
+                return coordinates
+
+        hit, coordinates = self.cache.get(name)
+        if hit or not self.online:
+            return coordinates
+
+        if self._geolocator is None:
+            self._geolocator = Nominatim(user_agent="skillo", timeout=10)
+        location = self._geolocator.geocode(place)
+        coordinates = (
+            (location.latitude, location.longitude) if location else None
+        )
+        self.cache.put(name, coordinates)
+        return coordinates
+
+
+_geocoder: Optional[Geocoder] = None
+_geocoder_lock = threading.Lock()
+
+
+def get_geocoder() -> Geocoder:
+    """Process-wide geocoder configured from settings."""
+    global _geocoder
+    with _geocoder_lock:
+        if _geocoder is None:
+            config = Config()
+            _geocoder = Geocoder(
+                cache_path=config.GEOCODE_CACHE_PATH,
+                gazetteer_path=config.GAZETTEER_PATH,
+                online=config.GEOCODE_ONLINE,
+            )
+        return _geocoder
@@ -4,12 +4,21 @@ import streamlit as st
 from dependency_injector import containers, providers
 
 from skillo.application import (
+    CompactDatabase,
+    DeleteDocument,
     ExportToCSV,
     GetDocumentList,
     GetDocumentStats,
+    GetStoredMatches,
     MatchCVToJobs,
     MatchJobToCVs,
+    MatchNewDocument,
+    MigrateCollectionLayout,
+    RebuildIndex,
+    ReindexDocument,
+    RescoreStoredMatches,
     ResetDatabase,
+    RunBatchMatching,
     UploadDocument,
 )
 from skillo.application.facades import (
@@ -18,17 +27,25 @@ from skillo.application.facades import (
     DocumentFacade,
     MatchingFacade,
 )
-from skillo.application.services import ApplicationEventHandler
+from skillo.application.services import (
+    ApplicationEventHandler,
+    IncrementalMatchHandler,
+)
 from skillo.application.use_cases.process_and_upload_documents import (
     ProcessUploadedDocuments,
 )
 from skillo.domain.events import (
+    CollectionLayoutMigratedEvent,
+    DatabaseCompactedEvent,
     DatabaseResetEvent,
     DocumentExportCompletedEvent,
     DocumentExportFailedEvent,
+    DocumentsDeletedEvent,
+    DocumentsReindexedEvent,
     DocumentUploadedEvent,
     DocumentUploadFailedEvent,
     DomainEventPublisher,
+    IndexRebuiltEvent,
     MatchingCompletedEvent,
     MatchingFailedEvent,
 )
@@ -36,25 +53,56 @@ from skillo.domain.services import DocumentBuilder
 from skillo.infrastructure.agents.langchain_supervisor_agent import (
     LangChainSupervisorAgent,
 )
+from skillo.infrastructure.agents.process_sharded_supervisor import (
+    get_process_sharded_supervisor,
+)
+from skillo.infrastructure.agents.single_flight_supervisor import (
+    SingleFlightSupervisorAgent,
+)
 from skillo.infrastructure.chains import (
     create_cv_processing_chain,
     create_job_processing_chain,
 )
-from skillo.infrastructure.config.settings import Config
-from skillo.infrastructure.concurrency.thread_pool_executor import (
-    ThreadPoolParallelExecutor,
+from skillo.infrastructure.concurrency.async_event_publisher import (
+    AsyncEventPublisher,
 )
-from skillo.infrastructure.logger import logger
+from skillo.infrastructure.concurrency.circuit_breaker import (
+    get_llm_circuit_breaker,
+)
+from skillo.infrastructure.concurrency.priority_scheduler import (
+    PriorityParallelExecutor,
+    TaskPriority,
+    get_priority_scheduler,
+)
+from skillo.infrastructure.concurrency.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+from skillo.infrastructure.concurrency.single_flight import get_single_flight
+from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.document_processing.document_processor import (
     DocumentProcessor,
 )
+from skillo.infrastructure.logger import logger
+from skillo.infrastructure.metrics import metrics
 from skillo.infrastructure.repositories.chroma_document_repository import (
     ChromaDocumentRepository,
 )
 from skillo.infrastructure.repositories.chroma_management_repository import (
     ChromaManagementRepository,
 )
+from skillo.infrastructure.repositories.numpy_document_repository import (
+    NumpyDocumentRepository,
+)
+from skillo.infrastructure.repositories.numpy_management_repository import (
+    NumpyManagementRepository,
+)
+from skillo.infrastructure.repositories.sqlite_match_repository import (
+    SqliteMatchRepository,
+)
 from skillo.infrastructure.services.filesystem_service import FileSystemService
+from skillo.infrastructure.services.numpy_match_rescorer import (
+    NumpyMatchRescorer,
+)
 from skillo.infrastructure.tools.profile_classifier import ProfileClassifier
 from skillo.ui.app import run_ui
 from skillo.ui.components.notification import StreamlitNotificationHandler
@@ -65,22 +113,56 @@ class DIContainer(containers.DeclarativeContainer):
 
     config = providers.Singleton(Config)
     logger = providers.Object(logger)
+    metrics = providers.Object(metrics)
 
     event_publisher: providers.Dependency[Any] = providers.Dependency()
     document_builder: providers.Dependency[Any] = providers.Dependency()
 
-    document_repository = providers.Singleton(
+    vector_backend = providers.Callable(
+        lambda config: config.VECTOR_BACKEND, config
+    )
+
+    chroma_document_repository = providers.Singleton(
         ChromaDocumentRepository,
         config=config,
     )
 
-    management_repository = providers.Singleton(
-        ChromaManagementRepository,
-        document_repository=document_repository,
+    numpy_document_repository = providers.Singleton(
+        NumpyDocumentRepository,
+        config=config,
+    )
+
+    document_repository = providers.Selector(
+        vector_backend,
+        chroma=chroma_document_repository,
+        numpy=numpy_document_repository,
+    )
+
+    management_repository = providers.Selector(
+        vector_backend,
+        chroma=providers.Singleton(
+            ChromaManagementRepository,
+            document_repository=chroma_document_repository,
+        ),
+        numpy=providers.Singleton(
+            NumpyManagementRepository,
+            document_repository=numpy_document_repository,
+        ),
+    )
+
+    match_repository = providers.Singleton(
+        SqliteMatchRepository,
+        config=config,
     )
 
     filesystem_service = providers.Singleton(FileSystemService)
 
+    match_rescorer = providers.Singleton(
+        NumpyMatchRescorer,
+        match_repository=match_repository,
+        document_repository=document_repository,
+    )
+
     profile_classifier = providers.Singleton(
         ProfileClassifier,
         models_dir_path=config().MODELS_DIR_PATH,
@@ -99,14 +181,58 @@ class DIContainer(containers.DeclarativeContainer):
         document_builder=document_builder,
     )
 
+    llm_circuit_breaker = providers.Callable(get_llm_circuit_breaker)
+
+    matching_mode = providers.Callable(
+        lambda config: (
+            "processes" if config.MATCH_PROCESS_SHARDS > 0 else "threads"
+        ),
+        config,
+    )
+
+    analysis_supervisor = providers.Selector(
+        matching_mode,
+        threads=providers.Singleton(
+            LangChainSupervisorAgent,
+            config=config,
+        ),
+        processes=providers.Callable(
+            get_process_sharded_supervisor,
+            shard_count=config().MATCH_PROCESS_SHARDS,
+            threads_per_shard=config().MATCH_PROCESS_THREADS,
+            circuit_breaker=llm_circuit_breaker,
+            timeout=config().MATCH_PROCESS_TIMEOUT_SECONDS,
+        ),
+    )
+
     supervisor_agent = providers.Singleton(
-        LangChainSupervisorAgent,
-        config=config,
+        SingleFlightSupervisorAgent,
+        supervisor=analysis_supervisor,
+        flights=providers.Callable(get_single_flight, "analysis"),
     )
 
-    parallel_executor = providers.Singleton(
-        ThreadPoolParallelExecutor,
+    task_scheduler = providers.Callable(
+        get_priority_scheduler,
         max_workers=config().MAX_WORKERS,
+        batch_share=config().BATCH_WORKER_SHARE,
+    )
+
+    parallel_executor = providers.Singleton(
+        PriorityParallelExecutor,
+        scheduler=task_scheduler,
+        priority=TaskPriority.INTERACTIVE,
+    )
+
+    batch_executor = providers.Singleton(
+        PriorityParallelExecutor,
+        scheduler=task_scheduler,
+        priority=TaskPriority.BATCH,
+    )
+
+    rate_limiter = providers.Singleton(
+        TokenBucketRateLimiter,
+        rate_per_second=config().MATCH_RATE_LIMIT_PER_SECOND,
+        burst=config().MATCH_RATE_LIMIT_BURST,
     )
 
     document_processor = providers.Singleton(
@@ -124,6 +250,10 @@ class DIContainer(containers.DeclarativeContainer):
         top_candidates_count=config().TOP_CANDIDATES_COUNT,
         min_match_score=config().MIN_MATCH_SCORE,
         event_publisher=event_publisher,
+        match_repository=match_repository,
+        rate_limiter=rate_limiter,
+        circuit_breaker=llm_circuit_breaker,
+        agent_weights=config().AGENT_WEIGHTS,
     )
 
     match_job_to_cvs = providers.Factory(
@@ -134,6 +264,56 @@ class DIContainer(containers.DeclarativeContainer):
         top_candidates_count=config().TOP_CANDIDATES_COUNT,
         min_match_score=config().MIN_MATCH_SCORE,
         event_publisher=event_publisher,
+        match_repository=match_repository,
+        rate_limiter=rate_limiter,
+        match_batch_size=config().MATCH_BATCH_SIZE,
+        circuit_breaker=llm_circuit_breaker,
+        agent_weights=config().AGENT_WEIGHTS,
+    )
+
+    get_stored_matches = providers.Factory(
+        GetStoredMatches,
+        document_repository=document_repository,
+        match_repository=match_repository,
+        top_candidates_count=config().TOP_CANDIDATES_COUNT,
+        min_match_score=config().MIN_MATCH_SCORE,
+        agent_weights=config().AGENT_WEIGHTS,
+    )
+
+    rescore_stored_matches = providers.Factory(
+        RescoreStoredMatches,
+        match_rescorer=match_rescorer,
+        document_repository=document_repository,
+    )
+
+    run_batch_matching = providers.Factory(
+        RunBatchMatching,
+        document_repository=document_repository,
+        match_repository=match_repository,
+        supervisor_agent=supervisor_agent,
+        parallel_executor=batch_executor,
+        rate_limiter=rate_limiter,
+        chunk_size=config().MATCH_BATCH_CHUNK_SIZE,
+        event_publisher=event_publisher,
+        match_batch_size=config().MATCH_BATCH_SIZE,
+        circuit_breaker=llm_circuit_breaker,
+    )
+
+    match_new_document = providers.Factory(
+        MatchNewDocument,
+        document_repository=document_repository,
+        match_repository=match_repository,
+        supervisor_agent=supervisor_agent,
+        parallel_executor=batch_executor,
+        rate_limiter=rate_limiter,
+        neighbour_count=config().INCREMENTAL_MATCH_NEIGHBOURS,
+        match_batch_size=config().MATCH_BATCH_SIZE,
+        circuit_breaker=llm_circuit_breaker,
+    )
+
+    incremental_match_handler = providers.Singleton(
+        IncrementalMatchHandler,
+        match_new_document=match_new_document,
     )
 
     upload_document = providers.Factory(
@@ -159,6 +339,38 @@ class DIContainer(containers.DeclarativeContainer):
         ResetDatabase,
         management_repository=management_repository,
         event_publisher=event_publisher,
+        match_repository=match_repository,
+    )
+
+    compact_database = providers.Factory(
+        CompactDatabase,
+        management_repository=management_repository,
+        event_publisher=event_publisher,
+    )
+
+    rebuild_index = providers.Factory(
+        RebuildIndex,
+        management_repository=management_repository,
+        event_publisher=event_publisher,
+    )
+
+    migrate_collection_layout = providers.Factory(
+        MigrateCollectionLayout,
+        management_repository=management_repository,
+        event_publisher=event_publisher,
+    )
+
+    delete_document = providers.Factory(
+        DeleteDocument,
+        document_repository=document_repository,
+        event_publisher=event_publisher,
+        match_repository=match_repository,
+    )
+
+    reindex_document = providers.Factory(
+        ReindexDocument,
+        document_repository=document_repository,
+        event_publisher=event_publisher,
     )
 
     export_to_csv = providers.Factory(
@@ -171,8 +383,10 @@ class DIContainer(containers.DeclarativeContainer):
         ProcessUploadedDocuments,
         document_processor=document_processor,
         upload_service=upload_document,
-        parallel_executor=parallel_executor,
+        parallel_executor=batch_executor,
         event_publisher=event_publisher,
+        max_in_flight=config().UPLOAD_MAX_IN_FLIGHT,
+        upload_batch_size=config().UPLOAD_BATCH_SIZE,
     )
 
     document_facade = providers.Singleton(
@@ -185,18 +399,26 @@ class DIContainer(containers.DeclarativeContainer):
         document_processor=document_processor,
         process_and_upload_service=process_uploaded_documents,
         filesystem=filesystem_service,
+        compact_service=compact_database,
+        rebuild_index_service=rebuild_index,
+        delete_service=delete_document,
+        reindex_service=reindex_document,
     )
 
     matching_facade = providers.Singleton(
         MatchingFacade,
         cv_to_jobs_service=match_cv_to_jobs,
         job_to_cvs_service=match_job_to_cvs,
+        stored_matches_service=get_stored_matches,
+        batch_matching_service=run_batch_matching,
+        rescore_service=rescore_stored_matches,
     )
 
     config_facade = providers.Singleton(
         ConfigFacade,
         config_service=config,
         logger_service=logger,
+        metrics_service=metrics,
     )
 
     application_facade = providers.Singleton(
@@ -217,25 +439,54 @@ def create_container(
     )
 
 
+def create_event_publisher(config: Config) -> DomainEventPublisher:
+    """Async publisher reporting its dispatch lag, or the synchronous one.
+
+    Every session has its own publisher, so stats are kept per publisher.
+    """
+    if not config.EVENT_DISPATCH_ASYNC:
+        return DomainEventPublisher()
+
+    publisher = AsyncEventPublisher(
+        max_queue=config.EVENT_QUEUE_SIZE, max_batch=config.EVENT_BATCH_SIZE
+    )
+    metrics.register_source(f"events.{publisher.instance_id}", publisher.stats)
+    return publisher
+
+
 def setup_event_subscriptions(publisher, handler):
-    """Setup all event subscriptions."""
+    """Setup all event subscriptions.
+
+    UI notifications stay inline on the publishing thread, since
+    Streamlit only renders from the session's script thread; background
+    work such as incremental matching is subscribed as queued handlers.
+    """
     events = [
         MatchingCompletedEvent,
         MatchingFailedEvent,
         DocumentUploadedEvent,
         DocumentUploadFailedEvent,
+        DocumentsDeletedEvent,
+        DocumentsReindexedEvent,
         DatabaseResetEvent,
+        DatabaseCompactedEvent,
+        IndexRebuiltEvent,
+        CollectionLayoutMigratedEvent,
         DocumentExportCompletedEvent,
         DocumentExportFailedEvent,
     ]
+    inline = isinstance(publisher, AsyncEventPublisher)
     for event in events:
-        publisher.subscribe(event, handler)
+        if inline:
+            publisher.subscribe(event, handler, inline=True)
+        else:
+            publisher.subscribe(event, handler)
 
 
 def main():
     """Application entry point - Composition Root."""
     if "di_container" not in st.session_state:
-        domain_event_publisher = DomainEventPublisher()
+        domain_event_publisher = create_event_publisher(Config())
         document_builder = DocumentBuilder()
 
         st.session_state.di_container = create_container(
@@ -251,6 +502,12 @@ def main():
         ui_notification_handler = StreamlitNotificationHandler()
         domain_event_handler = ApplicationEventHandler(ui_notification_handler)
         setup_event_subscriptions(publisher, domain_event_handler)
+        if di_container.config().INCREMENTAL_MATCHING_ENABLED and isinstance(
+            publisher, AsyncEventPublisher
+        ):
+            publisher.subscribe(
+                DocumentUploadedEvent, di_container.incremental_match_handler()
+            )
         st.session_state["events_configured"] = True
 
     run_ui(app_facade)
@@ -0,0 +1,20 @@
+import streamlit as st
+
+from skillo.application import CancellationToken
+
+
+def start_cancellable_job(key: str) -> CancellationToken:
+    """Token for a long-running job, cancelled by its Cancel button.
+
+    The button callback runs before Streamlit reruns the page, so worker
+    threads see the cancellation at once. Starting a job cancels any
+    earlier one still registered under the same key.
+    """
+    previous = st.session_state.get(key)
+    if previous is not None:
+        previous.cancel()
+
+    token = CancellationToken()
+    st.session_state[key] = token
+    st.button("⏹️ Cancel", key=f"{key}_cancel", on_click=token.cancel)
+    return token
@@ -12,12 +12,9 @@ class MatchResultsDisplay:
     def display_job_matches(matches: List[MatchResultDto]) -> None:
         """Display job matches."""
         for i, match in enumerate(matches, 1):
-            company = match.job_metadata.get("contact", "Unknown Company")
-            job_title = match.job_metadata.get("job_title", "Unknown Position")
-            job_display = f"{company} - {job_title}"
-
             with st.expander(
-                f"#{i} {job_display} - Score: {UiHelpers.format_score(match.weighted_final_score)}"
+                f"#{i} {MatchResultsDisplay._job_label(match)} - "
+                f"{MatchResultsDisplay._score_text(match)}"
             ):
                 MatchResultsDisplay._render_match_details(match, f"job_{i}")
 
@@ -25,20 +22,70 @@ class MatchResultsDisplay:
     def display_candidate_matches(matches: List[MatchResultDto]) -> None:
         """Display candidate matches."""
         for i, match in enumerate(matches, 1):
-            name = match.cv_metadata.get("name", "Unknown")
-            profile = match.cv_metadata.get("job_title", "Unknown Position")
-            candidate_display = f"{name} - {profile}"
-
             with st.expander(
-                f"#{i} {candidate_display} - Score: {UiHelpers.format_score(match.weighted_final_score)}"
+                f"#{i} {MatchResultsDisplay._candidate_label(match)} - "
+                f"{MatchResultsDisplay._score_text(match)}"
             ):
                 MatchResultsDisplay._render_match_details(
                     match, f"candidate_{i}"
                 )
 
+    @staticmethod
+    def display_live_ranking(
+        placeholder: Any, matches: List[MatchResultDto], candidates: bool
+    ) -> None:
+        """Re-render the running ranking while analyses are still arriving."""
+        label = (
+            MatchResultsDisplay._candidate_label
+            if candidates
+            else MatchResultsDisplay._job_label
+        )
+        lines = [
+            f"{i}. **{label(match)}** - "
+            f"{MatchResultsDisplay._score_text(match)}"
+            for i, match in enumerate(matches, 1)
+        ]
+        placeholder.markdown(
+            "\n".join(lines) or "_Waiting for first result..._"
+        )
+
+    @staticmethod
+    def _job_label(match: MatchResultDto) -> str:
+        """Company and title of the matched job."""
+        company = match.job_metadata.get("contact", "Unknown Company")
+        job_title = match.job_metadata.get("job_title", "Unknown Position")
+        return f"{company} - {job_title}"
+
+    @staticmethod
+    def _candidate_label(match: MatchResultDto) -> str:
+        """Name and profile of the matched candidate."""
+        name = match.cv_metadata.get("name", "Unknown")
+        profile = match.cv_metadata.get("job_title", "Unknown Position")
+        return f"{name} - {profile}"
+
+    @staticmethod
+    def _score_text(match: MatchResultDto) -> str:
+        """Final score, or the similarity of a match never analysed."""
+        if match.degraded:
+            similarity = match.detailed_results.get("similarity", 0.0)
+            return (
+                f"Similarity: {UiHelpers.format_score(similarity)} "
+                "(not analysed)"
+            )
+        return f"Score: {UiHelpers.format_score(match.weighted_final_score)}"
+
     @staticmethod
     def _render_match_details(match: MatchResultDto, unique_key: str) -> None:
         """Render match details."""
+        if match.degraded:
+            st.warning(match.explanation)
+            st.metric(
+                "Document Similarity",
+                UiHelpers.format_score(
+                    match.detailed_results.get("similarity", 0.0)
+                ),
+            )
+            return
 
         col1, col2 = st.columns([1, 3])
 
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any, Dict, List
 
 import streamlit as st
 
@@ -68,6 +69,9 @@ def _render_documents_view(app_facade: ApplicationFacade) -> None:
             with col3:
                 st.metric("Jobs", job_count)
 
+            st.markdown("---")
+            _render_bulk_actions(app_facade, doc_data)
+
         else:
             st.info("No documents found in database.")
 
@@ -75,6 +79,47 @@ def _render_documents_view(app_facade: ApplicationFacade) -> None:
         st.error(f"Error retrieving documents: {str(e)}")
 
 
+def _render_bulk_actions(
+    app_facade: ApplicationFacade, doc_data: List[Dict[str, Any]]
+) -> None:
+    """Render delete and reindex actions for selected documents."""
+    st.markdown("**Selected Documents**")
+
+    filenames = {row["ID"]: row["Filename"] for row in doc_data}
+    selected_ids = st.multiselect(
+        "Select documents:",
+        options=list(filenames),
+        format_func=lambda doc_id: f"{filenames[doc_id]} ({doc_id})",
+    )
+
+    col_reindex, col_delete = st.columns(2)
+
+    with col_reindex:
+        if st.button("🔄 Reindex Selected", disabled=not selected_ids):
+            try:
+                count = app_facade.documents.reindex_documents(selected_ids)
+                st.success(f"Re-embedded {count} documents.")
+            except Exception as e:
+                st.error(f"Error reindexing documents: {str(e)}")
+
+    with col_delete:
+        confirm_delete = st.checkbox(
+            "✅ I confirm deleting the selected documents",
+            disabled=not selected_ids,
+        )
+        if st.button(
+            "🗑️ Delete Selected",
+            type="secondary",
+            disabled=not (selected_ids and confirm_delete),
+        ):
+            try:
+                count = app_facade.documents.delete_documents(selected_ids)
+                st.success(f"Deleted {count} documents.")
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error deleting documents: {str(e)}")
+
+
 def _render_database_actions(app_facade: ApplicationFacade) -> None:
     """Render the database actions tab."""
     st.subheader("Database Actions")
@@ -87,6 +132,15 @@ def _render_database_actions(app_facade: ApplicationFacade) -> None:
     with col2:
         _render_export_section(app_facade)
 
+    st.markdown("---")
+    _render_compact_section(app_facade)
+
+    st.markdown("---")
+    _render_rebuild_index_section(app_facade)
+
+    st.markdown("---")
+    _render_batch_matching_section(app_facade)
+
 
 def _render_reset_section(app_facade: ApplicationFacade) -> None:
     """Render the database reset section."""
@@ -127,6 +181,78 @@ def _render_reset_section(app_facade: ApplicationFacade) -> None:
                 st.rerun()
 
 
+def _render_compact_section(app_facade: ApplicationFacade) -> None:
+    """Render the duplicate compaction section."""
+    st.markdown("**Compact Database**")
+    st.caption(
+        "Collapse duplicate entries created by re-uploading the same file."
+    )
+
+    if st.button("🧹 Compact Duplicates"):
+        try:
+            removed_count = app_facade.documents.compact_database()
+            st.success(f"Removed {removed_count} duplicate entries.")
+        except Exception as e:
+            st.error(f"Error compacting database: {str(e)}")
+
+
+def _render_rebuild_index_section(app_facade: ApplicationFacade) -> None:
+    """Render the index rebuild section."""
+    st.markdown("**Rebuild Index**")
+    st.caption(
+        "Copy all vectors into a new collection built with the current "
+        "HNSW settings and switch to it."
+    )
+
+    target_collection_name = st.text_input(
+        "Target collection name", key="rebuild_index_target"
+    )
+
+    if st.button("🔁 Rebuild Index", disabled=not target_collection_name):
+        try:
+            document_count = app_facade.documents.rebuild_index(
+                target_collection_name
+            )
+            st.success(
+                f"Rebuilt {document_count} entries into "
+                f"'{target_collection_name}'. Set COLLECTION_NAME to keep "
+                "using it after restart."
+            )
+        except Exception as e:
+            st.error(f"Error rebuilding index: {str(e)}")
+
+
+def _render_batch_matching_section(app_facade: ApplicationFacade) -> None:
+    """Render the all-pairs batch matching section."""
+    st.markdown("**Batch Matching**")
+    st.caption(
+        "Match every CV against every job and store the results. Unchanged "
+        "pairs are skipped, so an interrupted run resumes where it stopped."
+    )
+
+    if st.button("🧮 Compute All Matches"):
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+
+        def progress_update(completed: int, total: int) -> None:
+            """Progress callback for batch matching."""
+            progress_bar.progress(completed / total)
+            status_text.text(f"Matched {completed}/{total} pairs...")
+
+        try:
+            summary = app_facade.matching.run_batch_matching(
+                progress_callback=progress_update
+            )
+            progress_bar.progress(1.0)
+            status_text.empty()
+            st.success(
+                f"Computed {summary.computed} pairs, reused "
+                f"{summary.reused}, failed {summary.failed}."
+            )
+        except Exception as e:
+            st.error(f"Error running batch matching: {str(e)}")
+
+
 def _render_export_section(app_facade: ApplicationFacade) -> None:
     """Render the data export section."""
     st.markdown("**Export Data**")
@@ -1,6 +1,7 @@
 import streamlit as st
 
 from skillo.application.facades import ApplicationFacade
+from skillo.ui.components.cancellation import start_cancellable_job
 from skillo.ui.components.log_display import display_logs_section
 from skillo.ui.components.matching import MatchResultsDisplay
 
@@ -47,21 +48,31 @@ def _render_cv_to_jobs_analysis(app_facade: ApplicationFacade) -> None:
 
         progress_bar = st.progress(0)
         status_text = st.empty()
-
-        def progress_update(completed: int, total: int) -> None:
-            """Real-time progress callback for CV matching."""
-            progress = completed / total
-            progress_bar.progress(progress)
-            status_text.text(f"Analyzing {completed}/{total} jobs...")
+        ranking = st.empty()
+        cancellation_token = start_cancellable_job("cv_matching_job")
 
         try:
             status_text.text("🚀 Starting CV to jobs analysis...")
-            matches = app_facade.matching.match_cv_to_jobs_with_progress(
-                selected_cv, progress_update
-            )
+            matches = []
+            for update in app_facade.matching.stream_cv_to_jobs(
+                selected_cv, cancellation_token
+            ):
+                matches = update.top_matches
+                progress_bar.progress(update.completed / update.total)
+                status_text.text(
+                    f"Analyzing {update.completed}/{update.total} jobs..."
+                )
+                MatchResultsDisplay.display_live_ranking(
+                    ranking, matches, candidates=False
+                )
 
             progress_bar.progress(1.0)
-            status_text.text("Analysis complete!")
+            status_text.text(
+                "Analysis cancelled."
+                if cancellation_token.cancelled
+                else "Analysis complete!"
+            )
+            ranking.empty()
 
             if matches:
                 MatchResultsDisplay.display_job_matches(matches)
@@ -70,6 +81,19 @@ def _render_cv_to_jobs_analysis(app_facade: ApplicationFacade) -> None:
             progress_bar.empty()
             status_text.empty()
             st.error(f"CV matching error: {str(e)}")
+        finally:
+            cancellation_token.cancel()
+
+    elif selected_cv_name:
+        try:
+            stored_matches = app_facade.matching.get_stored_cv_matches(
+                cv_options[selected_cv_name]
+            )
+            if stored_matches:
+                st.caption("Stored results from batch matching")
+                MatchResultsDisplay.display_job_matches(stored_matches)
+        except Exception as e:
+            st.error(f"Error reading stored matches: {str(e)}")
 
 
 def _render_job_to_cvs_analysis(app_facade: ApplicationFacade) -> None:
@@ -101,21 +125,31 @@ def _render_job_to_cvs_analysis(app_facade: ApplicationFacade) -> None:
 
         progress_bar = st.progress(0)
         status_text = st.empty()
-
-        def progress_update(completed: int, total: int) -> None:
-            """Real-time progress callback for job matching."""
-            progress = completed / total
-            progress_bar.progress(progress)
-            status_text.text(f"Analyzing {completed}/{total} candidates...")
+        ranking = st.empty()
+        cancellation_token = start_cancellable_job("job_matching_job")
 
         try:
             status_text.text("🚀 Starting job to candidates analysis...")
-            matches = app_facade.matching.match_job_to_cvs_with_progress(
-                selected_job, progress_update
-            )
+            matches = []
+            for update in app_facade.matching.stream_job_to_cvs(
+                selected_job, cancellation_token
+            ):
+                matches = update.top_matches
+                progress_bar.progress(update.completed / update.total)
+                status_text.text(
+                    f"Analyzing {update.completed}/{update.total} candidates..."
+                )
+                MatchResultsDisplay.display_live_ranking(
+                    ranking, matches, candidates=True
+                )
 
             progress_bar.progress(1.0)
-            status_text.text("Analysis complete!")
+            status_text.text(
+                "Analysis cancelled."
+                if cancellation_token.cancelled
+                else "Analysis complete!"
+            )
+            ranking.empty()
 
             if matches:
                 MatchResultsDisplay.display_candidate_matches(matches)
@@ -124,3 +158,16 @@ def _render_job_to_cvs_analysis(app_facade: ApplicationFacade) -> None:
             progress_bar.empty()
             status_text.empty()
             st.error(f"Job matching error: {str(e)}")
+        finally:
+            cancellation_token.cancel()
+
+    elif selected_job_name:
+        try:
+            stored_matches = app_facade.matching.get_stored_job_matches(
+                job_options[selected_job_name]
+            )
+            if stored_matches:
+                st.caption("Stored results from batch matching")
+                MatchResultsDisplay.display_candidate_matches(stored_matches)
+        except Exception as e:
+            st.error(f"Error reading stored matches: {str(e)}")
@@ -1,3 +1,6 @@
+import time
+from typing import Dict, List
+
 import streamlit as st
 
 from skillo.application.dto import ConfigDto, StatisticsDto
@@ -15,6 +18,8 @@ def render(app_facade: ApplicationFacade) -> None:
         _render_document_distribution(stats)
         _render_database_health(stats, config_values)
         _render_configuration_info(config_values)
+        _render_runtime_metrics(app_facade.config.get_metrics())
+        _render_weight_tuner(app_facade, config_values)
 
     except Exception as e:
         st.error(f"Error loading statistics: {str(e)}")
@@ -83,7 +88,14 @@ def _render_database_health(
         if total_docs > 0:
             st.success("✅ Database is operational")
 
-            st.info(f"📁 Vector store path: {config_values.chroma_db_path}")
+            if config_values.chroma_server:
+                st.info(
+                    f"🌐 Vector store server: {config_values.chroma_server}"
+                )
+            else:
+                st.info(
+                    f"📁 Vector store path: {config_values.chroma_db_path}"
+                )
 
             st.info(f"🗂️ Collection name: {config_values.collection_name}")
 
@@ -134,6 +146,10 @@ def _render_configuration_info(config_values: ConfigDto) -> None:
                     f"Top Candidates: {config_values.top_candidates_count}"
                 )
 
+                st.markdown("**Index Configuration**")
+                for name, value in config_values.index_settings.items():
+                    st.text(f"HNSW {name}: {value}")
+
             with col2:
                 st.markdown("**Agent Weights**")
                 weights = config_values.agent_weights
@@ -150,3 +166,163 @@ def _render_configuration_info(config_values: ConfigDto) -> None:
 
     except Exception as e:
         st.error(f"Error displaying configuration: {str(e)}")
+
+
+def _render_runtime_metrics(values: Dict[str, float]) -> None:
+    """Render in-process counters and worker pool gauges."""
+    st.subheader("Runtime Metrics")
+
+    if "worker_pool.max_workers" in values:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric(
+                "Active workers",
+                f"{values['worker_pool.active_workers']:.0f}"
+                f" / {values['worker_pool.max_workers']:.0f}",
+            )
+        with col2:
+            st.metric(
+                "Queued tasks", f"{values['worker_pool.queued_tasks']:.0f}"
+            )
+        with col3:
+            st.metric(
+                "Avg task latency",
+                f"{values['worker_pool.avg_task_ms'] / 1000:.1f} s",
+                help=(
+                    f"Avg queue wait "
+                    f"{values['worker_pool.avg_wait_ms'] / 1000:.1f} s"
+                ),
+            )
+        with col4:
+            st.metric(
+                "P95 task latency",
+                f"{values['worker_pool.p95_task_ms'] / 1000:.1f} s",
+            )
+
+        with st.expander("Scheduler classes"):
+            for priority in ("interactive", "batch"):
+                st.text(
+                    f"{priority}: "
+                    f"{values.get(f'worker_pool.{priority}_active', 0):.0f}"
+                    f" running / "
+                    f"{values.get(f'worker_pool.{priority}_limit', 0):.0f}"
+                    f" workers, "
+                    f"{values.get(f'worker_pool.{priority}_queued', 0):.0f}"
+                    " queued"
+                )
+
+    lags = _event_stat(values, "p95_lag_ms")
+    if lags:
+        st.metric(
+            "Event dispatch lag (p95)",
+            f"{max(lags):.0f} ms",
+            help=(
+                f"Worst of {len(lags)} session publishers; "
+                f"{sum(_event_stat(values, 'queued')):.0f} queued, "
+                f"{sum(_event_stat(values, 'dropped')):.0f} dropped, "
+                f"{sum(_event_stat(values, 'handler_errors')):.0f} "
+                "handler errors"
+            ),
+        )
+
+    counters = {
+        name: value
+        for name, value in values.items()
+        if not name.startswith("worker_pool.")
+    }
+    if not counters:
+        st.info("No agent calls recorded since startup")
+        return
+
+    fast_path = counters.get("location_agent.fast_path", 0)
+    llm_calls = counters.get("location_agent.llm", 0)
+    if fast_path + llm_calls:
+        st.metric(
+            "Location fast-path share",
+            f"{fast_path / (fast_path + llm_calls):.0%}",
+            help=f"{fast_path:.0f} rule-scored, {llm_calls:.0f} sent to the LLM",
+        )
+
+    with st.expander("All counters"):
+        for name, value in sorted(counters.items()):
+            st.text(f"{name}: {value:g}")
+
+
+def _event_stat(values: Dict[str, float], name: str) -> List[float]:
+    """Values of one stat across the per-session event publishers."""
+    return [
+        value
+        for key, value in values.items()
+        if key.startswith("events.") and key.endswith(f".{name}")
+    ]
+
+
+def _render_weight_tuner(
+    app_facade: ApplicationFacade, config_values: ConfigDto
+) -> None:
+    """Render agent weight tuner re-scoring the stored match matrix."""
+    st.subheader("Agent Weight Tuner")
+    st.caption(
+        "Re-weights stored agent sub-scores; no agents are re-run. "
+        "Weights are normalized to sum to 1."
+    )
+
+    columns = st.columns(len(config_values.agent_weights))
+    weights: Dict[str, float] = {}
+    for column, (agent, weight) in zip(
+        columns, config_values.agent_weights.items()
+    ):
+        with column:
+            weights[agent] = st.slider(
+                agent.replace("_weight", "").title(),
+                min_value=0.0,
+                max_value=1.0,
+                value=float(weight),
+                step=0.05,
+                key=f"tuner_{agent}",
+            )
+
+    try:
+        started = time.perf_counter()
+        summary = app_facade.matching.rescore_stored_matches(weights)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except Exception as e:
+        st.error(f"Error re-weighting stored matches: {str(e)}")
+        return
+
+    if not summary.total_pairs:
+        st.info("No stored matches yet. Run batch matching first.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Stored pairs", summary.total_pairs)
+    with col2:
+        st.metric("Changed recommendations", summary.changed_recommendations)
+    with col3:
+        st.metric("Re-scored in", f"{elapsed_ms:.1f} ms")
+
+    st.bar_chart(summary.recommendation_counts)
+    st.dataframe(
+        [
+            {
+                "Candidate": pair.cv_name,
+                "Job": pair.job_title,
+                "Score": round(pair.weighted_final_score, 3),
+                "Stored score": round(pair.stored_score, 3),
+                "Recommendation": pair.recommendation,
+            }
+            for pair in summary.top_pairs
+        ],
+        use_container_width=True,
+    )
+
+    total = sum(weights.values()) or 1.0
+    with st.expander("Apply these weights"):
+        st.code(
+            "\n".join(
+                f"{agent.upper()}={weight / total:.2f}"
+                for agent, weight in weights.items()
+            ),
+            language="bash",
+        )
@@ -3,6 +3,7 @@ from typing import Any, List
 import streamlit as st
 
 from skillo.application.facades import ApplicationFacade
+from skillo.ui.components.cancellation import start_cancellable_job
 from skillo.ui.components.log_display import display_logs_section
 
 
@@ -59,6 +60,7 @@ def _process_files(
 
     progress_bar = st.progress(0)
     status_text = st.empty()
+    cancellation_token = start_cancellable_job(f"{file_type}_upload_job")
 
     def progress_update(completed: int, total: int) -> None:
         """Real-time progress callback for parallel processing."""
@@ -69,7 +71,7 @@ def _process_files(
     try:
         batch_result = (
             app_facade.documents.process_uploaded_documents_parallel(
-                files, file_type, progress_update
+                files, file_type, progress_update, cancellation_token
             )
         )
 
@@ -80,9 +82,18 @@ def _process_files(
                 st.error(
                     f"❌ Failed to process: {result['filename']} - {result['error']}"
                 )
+        if batch_result.omitted_results:
+            st.caption(
+                f"{batch_result.omitted_results} earlier file results "
+                "not shown"
+            )
 
         progress_bar.progress(1.0)
-        status_text.text("Processing complete!")
+        status_text.text(
+            "Processing cancelled."
+            if cancellation_token.cancelled
+            else "Processing complete!"
+        )
 
         if batch_result.successful_uploads > 0:
             st.success(
@@ -101,5 +112,7 @@ def _process_files(
         st.error(f"❌ Parallel processing failed: {str(e)}")
         progress_bar.progress(1.0)
         status_text.text("Processing failed!")
+    finally:
+        cancellation_token.cancel()
 
     display_logs_section(app_facade, "🔍 Logs")
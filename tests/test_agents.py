@@ -294,6 +294,7 @@ def test_skills_agent_validation_error(mock_skills_agent):
             "matched_skills": [],
             "score": 0.0,
             "explanation": "Error in skills analysis",
+            "failed": True,
         }
 
 
@@ -308,6 +309,7 @@ def test_skills_agent_unexpected_error(mock_skills_agent):
             "matched_skills": [],
             "score": 0.0,
             "explanation": "Error in skills analysis",
+            "failed": True,
         }
 
 
@@ -541,3 +543,541 @@ def test_agent_error_resilience():
             assert isinstance(
                 result["score"], (int, float)
             ), f"Failed on {test_name}"
+
+
+def test_supervisor_agents_compare_stored_profiles(test_config):
+    from skillo.domain.entities import AnalysisProfile, Document
+    from skillo.domain.enums import DocumentType
+
+    with patch.dict(
+        "os.environ", {"OPENAI_API_KEY": test_config["OPENAI_API_KEY"]}
+    ):
+        agent = LangChainSupervisorAgent(config=Config())
+
+    for name in agent.PROFILE_FIELDS:
+        setattr(agent, f"{name}_agent", Mock())
+
+    profile = AnalysisProfile(
+        skills=["Python", "Django"], total_years="6", degree="Master"
+    )
+    cv = Document(
+        id="cv-1",
+        document_type=DocumentType.CV,
+        content="Long raw CV text",
+        metadata=profile.to_metadata(),
+    )
+    job = Document(
+        id="job-1", document_type=DocumentType.JOB, content="Raw job text"
+    )
+
+    agent._execute_all_agents(cv, job)
+
+    assert AnalysisProfile.from_metadata(cv.metadata) == profile
+    agent.skills_agent.analyze_skills_match.assert_called_once_with(
+        "Skills: Python, Django\nCertifications: Not specified", "Raw job text"
+    )
+    cv_education = agent.education_agent.analyze_education_match.call_args
+    assert cv_education.args[0].startswith("Degree: Master")
+
+
+def test_batch_support_orders_results_and_fills_gaps():
+    from skillo.infrastructure.adapters import SkillsAnalysisResponseAdapter
+    from skillo.infrastructure.agents.batch_support import (
+        BatchAnalysisSupport,
+    )
+
+    config = Mock(spec=Config)
+    config.PROMPTS_DIR = "./skillo/infrastructure/prompts"
+    batch = BatchAnalysisSupport(
+        config,
+        {"user_message": "CVs:\n{cv_content}\nJob:\n{job_content}"},
+        SkillsAnalysisResponseAdapter,
+    )
+    candidate = batch.response_model.model_fields["results"].annotation
+    item_model = candidate.__args__[0]
+    response = batch.response_model(
+        results=[
+            item_model(
+                candidate_number=2,
+                cv_skills=["Go"],
+                required_skills=["Go"],
+                matched_skills=["Go"],
+                score=0.9,
+                explanation="Go expert",
+            )
+        ]
+    )
+
+    prompt = batch.user_message(["Python dev", "Go dev"], "Go role")
+    results = batch.results(response, 2, {"score": 0.0})
+
+    assert "Candidate 1:\nPython dev" in prompt
+    assert "2 numbered candidates" in prompt
+    assert results[0] == {"score": 0.0, "failed": True}
+    assert results[1]["score"] == 0.9
+
+
+def test_supervisor_reanalyses_candidates_missing_from_batch(test_config):
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+
+    with patch.dict(
+        "os.environ", {"OPENAI_API_KEY": test_config["OPENAI_API_KEY"]}
+    ):
+        agent = LangChainSupervisorAgent(config=Config())
+
+    for name in agent.PROFILE_FIELDS:
+        sub_agent = Mock()
+        setattr(agent, f"{name}_agent", sub_agent)
+        getattr(sub_agent, f"analyze_{name}_match").return_value = {
+            "score": 0.5,
+            "explanation": "single",
+        }
+        getattr(sub_agent, f"analyze_{name}_match_batch").side_effect = (
+            lambda cv_contents, job_content: [
+                {"score": 0.9, "explanation": "batched"} for _ in cv_contents
+            ]
+        )
+    agent.location_agent.analyze_location_fast_path.return_value = None
+    agent.skills_agent.analyze_skills_match_batch.side_effect = None
+    agent.skills_agent.analyze_skills_match_batch.return_value = [
+        {"score": 0.9, "explanation": "batched"},
+        {"score": 0.0, "explanation": "missing", "failed": True},
+    ]
+    job = Document("job-1", DocumentType.JOB, "Python developer")
+    cvs = [Document(f"cv-{i}", DocumentType.CV, "Python") for i in range(2)]
+
+    results = agent.analyze_match_batch(cvs, job)
+
+    assert results[0]["skills_score"] == 0.9
+    assert results[1]["skills_score"] == 0.5
+    assert not any(result["degraded"] for result in results)
+    agent.skills_agent.analyze_skills_match.assert_called_once()
+
+
+def test_location_rule_scorer_resolves_clear_cases_only():
+    from skillo.infrastructure.agents.location_rules import LocationRuleScorer
+
+    distances = {("Warsaw, Poland", "Pruszkow, Poland"): 15.0}
+    scorer = LocationRuleScorer(
+        distance_fn=lambda a, b: distances.get((a, b), 1200.0)
+    )
+
+    def job(location, remote):
+        return {"location": location, "remote_work_status": remote}
+
+    cv = {"location": "Warsaw, Poland", "remote_work_status": "Hybrid"}
+
+    remote = scorer.score(cv, job("Berlin, Germany", "Remote"))
+    same_city = scorer.score(cv, job("warsaw, poland", "On-site"))
+    near = scorer.score(cv, job("Pruszkow, Poland", "On-site"))
+    relocation = scorer.score(cv, job("Madrid, Spain", "On-site"))
+
+    assert (remote["score"], remote["remote_work"]) == (1.0, "Yes")
+    assert same_city["score"] == 1.0
+    assert (near["score"], near["distance_km"]) == (0.95, "15.0")
+    assert relocation["commute_feasibility"] == "Very Poor"
+    assert scorer.score(cv, job("Madrid, Spain", "Hybrid")) is None
+    assert scorer.score({}, job("Madrid, Spain", "On-site")) is None
+
+
+def test_geocoder_uses_gazetteer_and_persistent_cache(tmp_path):
+    from skillo.infrastructure.tools.geocoding import Gazetteer, Geocoder
+
+    gazetteer_path = str(tmp_path / "gazetteer.npy")
+    Gazetteer.build(
+        [
+            {
+                "name": "Kraków",
+                "country": "Poland",
+                "latitude": 50.06,
+                "longitude": 19.94,
+                "population": 779115,
+            },
+            {
+                "name": "Warsaw",
+                "country": "Poland",
+                "latitude": 52.23,
+                "longitude": 21.01,
+                "population": 1790658,
+            },
+            {
+                "name": "Warsaw",
+                "country": "USA",
+                "latitude": 41.24,
+                "longitude": -85.85,
+                "population": 14000,
+            },
+        ],
+        gazetteer_path,
+    )
+    cache_path = str(tmp_path / "geocodes.db")
+    geocoder = Geocoder(cache_path, gazetteer_path, online=False)
+    geocoder.cache.put("lodz, poland", (51.76, 19.46))
+
+    assert geocoder.locate("KRAKOW,  Poland") == pytest.approx((50.06, 19.94))
+    assert geocoder.locate("Warsaw")[1] == pytest.approx(21.01)
+    assert geocoder.locate("Łódź, Poland") == (51.76, 19.46)
+    assert geocoder.locate("Paris, France") is None
+    assert Geocoder(cache_path).cache.get("lodz, poland") == (
+        True,
+        (51.76, 19.46),
+    )
+
+
+def test_experience_summary_merges_overlapping_spans():
+    from skillo.infrastructure.tools.date_tools import (
+        parse_year_month,
+        summarize_experience,
+    )
+
+    spans, total_years = summarize_experience(
+        [
+            "Senior Developer, Acme (03.2019 - 02.2021)",
+            "Developer, Foo 2015-06 to 2019-02, Marketing 2014",
+            "Freelance, Jan 2020 – Dec 2020",
+            "Stażysta, października 2014 do gru 2014",
+        ]
+    )
+
+    assert spans == [
+        "2014-10 to 2014-12",
+        "2015-06 to 2019-02",
+        "2019-03 to 2021-02",
+        "2020-01 to 2020-12",
+    ]
+    assert total_years == pytest.approx(6.0)
+    assert parse_year_month("2018", is_end=True) == (2018, 12)
+    assert summarize_experience(["No dates here"]) == ([], 0.0)
+
+
+def test_year_only_range_ending_this_year_runs_until_now():
+    from skillo.infrastructure.tools import date_tools
+
+    with patch.object(
+        date_tools, "_current_year_month", return_value=(2026, 10)
+    ):
+        spans, total_years = date_tools.summarize_experience(
+            ["Backend Developer, Acme 2022 - 2026"]
+        )
+        future = date_tools.find_employment_spans("Studies 2024 - 2027")
+
+    assert spans == ["2022-01 to present"]
+    assert total_years == pytest.approx(4.8)
+    assert future == []
+
+
+def test_resilient_caller_retries_transient_errors_only():
+    import httpx
+    import openai
+
+    from skillo.infrastructure.concurrency.resilience import ResilientCaller
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat")
+    throttled = openai.RateLimitError(
+        "Rate limited",
+        response=httpx.Response(
+            429, headers={"retry-after": "2"}, request=request
+        ),
+        body=None,
+    )
+    rejected = openai.BadRequestError(
+        "Bad request",
+        response=httpx.Response(400, request=request),
+        body=None,
+    )
+    delays = []
+    caller = ResilientCaller("test_llm", max_attempts=3, sleep=delays.append)
+
+    call = Mock(side_effect=[throttled, TimeoutError(), "ok"])
+    assert caller.call(call) == "ok"
+    assert call.call_count == 3
+    assert delays[0] == 2.0
+    assert 0 <= delays[1] <= 1.0
+
+    call = Mock(side_effect=rejected)
+    with pytest.raises(openai.BadRequestError):
+        caller.call(call)
+    assert call.call_count == 1
+
+    call = Mock(side_effect=throttled)
+    with pytest.raises(openai.RateLimitError):
+        caller.call(call)
+    assert call.call_count == 3
+
+
+def test_refused_llm_calls_neither_close_circuit_nor_score(
+    mock_skills_agent,
+):
+    import httpx
+    import openai
+
+    from skillo.infrastructure.concurrency.circuit_breaker import (
+        CircuitBreaker,
+    )
+    from skillo.infrastructure.concurrency.resilience import ResilientCaller
+
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "test_neutral_circuit",
+        failure_threshold=1,
+        reset_timeout=30,
+        clock=lambda: now[0],
+    )
+    caller = ResilientCaller(
+        "test_llm", max_attempts=1, circuit_breaker=breaker
+    )
+    unauthorized = openai.AuthenticationError(
+        "Invalid key",
+        response=httpx.Response(
+            401, request=httpx.Request("POST", "https://api.openai.com")
+        ),
+        body=None,
+    )
+
+    with pytest.raises(TimeoutError):
+        caller.call(Mock(side_effect=TimeoutError()))
+    now[0] = 31.0
+    with pytest.raises(openai.AuthenticationError):
+        caller.call(Mock(side_effect=unauthorized))
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    with patch.object(mock_skills_agent, "llm", Mock()) as llm:
+        llm.invoke.side_effect = lambda messages: caller.call(Mock())
+        result = mock_skills_agent.analyze_skills_match("cv", "job")
+
+    assert result["failed"] and result["score"] == 0.0
+
+
+class _EchoSupervisor:
+    """Supervisor stand-in for worker processes; fails on empty CVs."""
+
+    def analyze_match(self, cv_document, job_document):
+        if not cv_document.content:
+            raise ValueError("empty CV")
+        return {"pair": (cv_document.id, job_document.id), "pid": os.getpid()}
+
+
+def _echo_supervisor():
+    return _EchoSupervisor()
+
+
+def test_process_sharded_supervisor_routes_pairs_to_worker_processes():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.domain.exceptions import SkilloAgentError
+    from skillo.infrastructure.agents.process_sharded_supervisor import (
+        ProcessShardedSupervisorAgent,
+    )
+    from skillo.infrastructure.concurrency.circuit_breaker import (
+        CircuitBreaker,
+    )
+
+    breaker = CircuitBreaker("test_circuit", failure_threshold=1)
+    supervisor = ProcessShardedSupervisorAgent(
+        shard_count=1,
+        threads_per_shard=3,
+        circuit_breaker=breaker,
+        supervisor_factory=_echo_supervisor,
+    )
+    job = Document("job-1", DocumentType.JOB, "Python developer")
+    cvs = [Document(f"cv-{i}", DocumentType.CV, "Python") for i in range(6)]
+    try:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(lambda cv: supervisor.analyze_match(cv, job), cvs)
+            )
+
+        assert [r["pair"] for r in results] == [(cv.id, "job-1") for cv in cvs]
+        assert os.getpid() not in {r["pid"] for r in results}
+
+        with pytest.raises(SkilloAgentError, match="empty CV"):
+            supervisor.analyze_match(
+                Document("cv-empty", DocumentType.CV, ""), job
+            )
+        assert not breaker.is_open()
+    finally:
+        supervisor.close()
+
+
+def test_process_sharded_supervisor_stops_shards_that_do_not_answer():
+    from concurrent.futures import Future
+
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.domain.exceptions import SkilloAgentError
+    from skillo.infrastructure.agents.process_sharded_supervisor import (
+        ProcessShardedSupervisorAgent,
+    )
+    from skillo.infrastructure.concurrency.circuit_breaker import (
+        CircuitBreaker,
+    )
+
+    breaker = CircuitBreaker("test_shard_timeout_circuit", failure_threshold=1)
+    supervisor = ProcessShardedSupervisorAgent(
+        shard_count=1,
+        circuit_breaker=breaker,
+        supervisor_factory=_echo_supervisor,
+        timeout=0.1,
+    )
+    stuck_shard = Mock()
+    stuck_shard.submit.return_value = Future()
+    job = Document("job-1", DocumentType.JOB, "Python developer")
+    cv = Document("cv-1", DocumentType.CV, "Python")
+
+    with patch.object(
+        supervisor, "_next_shard", return_value=(stuck_shard, 0)
+    ):
+        with pytest.raises(SkilloAgentError, match="timed out"):
+            supervisor.analyze_match(cv, job)
+
+    stuck_shard.kill.assert_called_once()
+    assert breaker.is_open()
+
+
+def test_process_sharded_supervisor_counts_dead_shards_against_circuit():
+    from concurrent.futures import Future
+
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.domain.exceptions import SkilloAgentError
+    from skillo.infrastructure.agents.process_sharded_supervisor import (
+        ProcessShardedSupervisorAgent,
+    )
+    from skillo.infrastructure.concurrency.circuit_breaker import (
+        CircuitBreaker,
+    )
+
+    breaker = CircuitBreaker("test_dead_shard_circuit", failure_threshold=2)
+    supervisor = ProcessShardedSupervisorAgent(
+        shard_count=1,
+        circuit_breaker=breaker,
+        supervisor_factory=_echo_supervisor,
+    )
+    failed_analysis = {"weighted_final_score": 0.0, "degraded": True}
+    answered, dead = Future(), Future()
+    answered.set_result((True, failed_analysis))
+    dead.set_exception(SkilloAgentError("Matching worker process exited"))
+    shard = Mock()
+    shard.submit.side_effect = [answered, dead]
+    job = Document("job-1", DocumentType.JOB, "Python developer")
+    cv = Document("cv-1", DocumentType.CV, "Python")
+
+    with patch.object(supervisor, "_next_shard", return_value=(shard, 0)):
+        assert supervisor.analyze_match(cv, job) == failed_analysis
+        assert breaker.stats()["consecutive_failures"] == 0
+        with pytest.raises(SkilloAgentError, match="exited"):
+            supervisor.analyze_match(cv, job)
+
+    assert breaker.stats()["consecutive_failures"] == 1
+
+
+def test_single_flight_supervisor_shares_concurrent_identical_analyses():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.infrastructure.agents.single_flight_supervisor import (
+        SingleFlightSupervisorAgent,
+    )
+    from skillo.infrastructure.concurrency.single_flight import SingleFlight
+    from skillo.infrastructure.metrics import metrics
+
+    release = threading.Event()
+    inner = Mock()
+
+    def slow_analysis(cv_document, job_document):
+        release.wait(timeout=5)
+        return {"pair": [cv_document.id, job_document.id]}
+
+    inner.analyze_match.side_effect = slow_analysis
+    supervisor = SingleFlightSupervisorAgent(
+        inner, SingleFlight("test_single_flight")
+    )
+    job = Document("job-1", DocumentType.JOB, "Python developer")
+    cv = Document("cv-1", DocumentType.CV, "Python")
+    other_cv = Document("cv-2", DocumentType.CV, "Java")
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [
+            pool.submit(supervisor.analyze_match, cv, job) for _ in range(4)
+        ]
+        other = pool.submit(supervisor.analyze_match, other_cv, job)
+        deadline = time.monotonic() + 5
+        while metrics.snapshot().get("test_single_flight.shared", 0) < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert inner.analyze_match.call_count == 2
+    assert other.result() == {"pair": ["cv-2", "job-1"]}
+    assert all(result == {"pair": ["cv-1", "job-1"]} for result in results)
+    results[0]["pair"].append("changed")
+    assert results[1] == {"pair": ["cv-1", "job-1"]}
+
+
+def test_concurrent_match_analyses_keep_agent_state_isolated(test_config):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from skillo.domain.entities import AnalysisProfile, Document
+    from skillo.domain.enums import DocumentType
+    from skillo.infrastructure.adapters import SkillsAnalysisResponseAdapter
+    from skillo.infrastructure.logger import logger
+
+    with patch.dict(
+        "os.environ", {"OPENAI_API_KEY": test_config["OPENAI_API_KEY"]}
+    ):
+        agent = LangChainSupervisorAgent(config=Config())
+
+    def fake_skills_llm(messages):
+        skill = messages[-1].content.split("Skills: ")[1].split("\n")[0]
+        return SkillsAnalysisResponseAdapter(
+            cv_skills=[skill],
+            required_skills=[skill],
+            matched_skills=[skill],
+            score=0.8,
+            explanation=f"Knows {skill}",
+        )
+
+    agent.skills_agent.llm = Mock(invoke=fake_skills_llm)
+    failing_llm = Mock(invoke=Mock(side_effect=RuntimeError("rate limited")))
+    agent.location_agent.llm_with_tools = failing_llm
+    agent.location_agent.llm_structured = failing_llm
+    agent.experience_agent.llm_structured = failing_llm
+    agent.preferences_agent.llm = failing_llm
+    agent.education_agent.llm = failing_llm
+
+    job = Document("job-1", DocumentType.JOB, "Backend developer")
+
+    def analyze(number):
+        cv = Document(
+            f"cv-{number}",
+            DocumentType.CV,
+            "Raw CV",
+            metadata=AnalysisProfile(skills=[f"Skill{number}"]).to_metadata(),
+        )
+        return number, agent.analyze_match(cv, job)
+
+    logger.clear_logs()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        outcomes = list(pool.map(analyze, range(256)))
+
+    for number, result in outcomes:
+        details = result["detailed_results"]
+        assert details["skills"]["matched_skills"] == [f"Skill{number}"]
+        assert result["degraded"] and "skills" not in result["failed_agents"]
+        assert details["education"]["failed"]
+        assert result["weighted_final_score"] > 0
+    first, second = outcomes[0][1], outcomes[1][1]
+    first["detailed_results"]["education"]["score"] = 1.0
+    assert second["detailed_results"]["education"]["score"] == 0.0
+    assert len(logger.get_logs()) == 100
+    assert len(logger.get_logs(last_n=10)) == 10
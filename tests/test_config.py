@@ -23,3 +23,14 @@ def test_application_starts_with_valid_config(test_config):
 
         weights_sum = sum(config.AGENT_WEIGHTS.values())
         assert abs(weights_sum - 1.0) < 0.01
+
+
+def test_hnsw_settings_are_exposed_as_collection_metadata():
+    config = Config()
+
+    assert config.HNSW_SETTINGS == {
+        "hnsw:space": config.CHROMA_HNSW_SPACE,
+        "hnsw:construction_ef": config.CHROMA_HNSW_EF_CONSTRUCTION,
+        "hnsw:search_ef": config.CHROMA_HNSW_EF_SEARCH,
+        "hnsw:M": config.CHROMA_HNSW_M,
+    }
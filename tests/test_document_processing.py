@@ -474,3 +474,32 @@ def test_base_processor_save_file_success(
     expected_path = os.path.join("/test/upload/dir", "test.pdf")
     mock_file_open.assert_called_once_with(expected_path, "wb")
     assert result == expected_path
+
+
+def test_base_processor_spools_large_pdf_to_temp_file(mock_config):
+    """Test large PDFs are opened from a temp file that is removed after."""
+    import io
+
+    import fitz
+
+    class TestProcessor(BaseDocumentProcessor):
+        def process_document_content(
+            self, content: str, filename: str, doc_id: str
+        ) -> Document:
+            return Mock()
+
+    source = fitz.open()
+    source.new_page().insert_text((72, 72), "Spooled resume text")
+    pdf_file = io.BytesIO(source.tobytes())
+    pdf_file.size = len(pdf_file.getvalue())
+    source.close()
+
+    mock_config.PDF_SPOOL_THRESHOLD_BYTES = pdf_file.size - 1
+    processor = TestProcessor(mock_config)
+    with patch("fitz.open", wraps=fitz.open) as mock_fitz_open:
+        result = processor.extract_text_from_pdf(pdf_file)
+
+    assert "Spooled resume text" in result
+    spool_path = mock_fitz_open.call_args.args[0]
+    assert spool_path.endswith(".pdf")
+    assert not os.path.exists(spool_path)
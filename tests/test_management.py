@@ -0,0 +1,326 @@
+from unittest.mock import Mock
+
+import pytest
+
+from skillo.application.use_cases.compact_database import CompactDatabase
+from skillo.application.use_cases.delete_document import DeleteDocument
+from skillo.application.use_cases.rebuild_index import RebuildIndex
+from skillo.application.use_cases.reindex_document import ReindexDocument
+from skillo.domain.entities import Document
+from skillo.domain.enums import DocumentType
+from skillo.domain.events import (
+    DatabaseCompactedEvent,
+    DocumentsDeletedEvent,
+    DocumentsReindexedEvent,
+    DomainEventPublisher,
+    IndexRebuiltEvent,
+)
+from skillo.domain.exceptions import SkilloRepositoryError
+from skillo.infrastructure.repositories.chroma_management_repository import (
+    ChromaManagementRepository,
+)
+
+
+def _paged_get(ids, metadatas):
+    """Build vectorstore.get side effect returning a single page."""
+
+    def get(include=None, limit=None, offset=0):
+        return {
+            "ids": ids[offset : offset + limit],
+            "metadatas": metadatas[offset : offset + limit],
+        }
+
+    return get
+
+
+@pytest.fixture
+def duplicated_vectorstore():
+    """Vectorstore holding one keyed and two random-id duplicates."""
+    vectorstore = Mock()
+    vectorstore.get.side_effect = _paged_get(
+        ["cv-1", "uuid-a", "uuid-b", "uuid-c"],
+        [
+            {"document_id": "cv-1"},
+            {"document_id": "cv-1"},
+            {"document_id": "job-1"},
+            {"document_id": "job-1"},
+        ],
+    )
+    vectorstore._collection.get.return_value = {
+        "embeddings": [[0.1, 0.2]],
+        "documents": ["Job content"],
+        "metadatas": [{"document_id": "job-1"}],
+    }
+    return vectorstore
+
+
+def test_compact_duplicates_keeps_one_entry_per_document(
+    duplicated_vectorstore,
+):
+    document_repository = Mock()
+    document_repository.vectorstores = {"skillo": duplicated_vectorstore}
+    repository = ChromaManagementRepository(document_repository)
+
+    removed_count = repository.compact_duplicates()
+
+    collection = duplicated_vectorstore._collection
+    assert removed_count == 2
+    collection.upsert.assert_called_once_with(
+        ids=["job-1"],
+        embeddings=[[0.1, 0.2]],
+        documents=["Job content"],
+        metadatas=[{"document_id": "job-1"}],
+    )
+    deleted = [call.kwargs["ids"] for call in collection.delete.call_args_list]
+    assert deleted == [["uuid-a"], ["uuid-b", "uuid-c"]]
+
+
+def test_compact_duplicates_skips_keyed_entries():
+    vectorstore = Mock()
+    vectorstore.get.side_effect = _paged_get(
+        ["cv-1", "job-1"],
+        [{"document_id": "cv-1"}, {"document_id": "job-1"}],
+    )
+    document_repository = Mock()
+    document_repository.vectorstores = {"skillo": vectorstore}
+    repository = ChromaManagementRepository(document_repository)
+
+    assert repository.compact_duplicates() == 0
+    vectorstore._collection.delete.assert_not_called()
+
+
+def test_compact_database_publishes_event():
+    management_repository = Mock()
+    management_repository.compact_duplicates.return_value = 3
+    publisher = DomainEventPublisher()
+    handler = Mock()
+    publisher.subscribe(DatabaseCompactedEvent, handler)
+
+    removed_count = CompactDatabase(management_repository, publisher).execute()
+
+    assert removed_count == 3
+    event = handler.handle.call_args[0][0]
+    assert event.success is True
+    assert event.removed_count == 3
+
+
+def test_compact_database_failure_raises_repository_error():
+    management_repository = Mock()
+    management_repository.compact_duplicates.side_effect = Exception("boom")
+
+    with pytest.raises(SkilloRepositoryError):
+        CompactDatabase(
+            management_repository, DomainEventPublisher()
+        ).execute()
+
+
+def test_rebuild_index_copies_entries_and_switches_collection():
+    source = Mock()
+    source.get.side_effect = [
+        {
+            "ids": ["cv-1", "job-1"],
+            "embeddings": [[0.1], [0.2]],
+            "documents": ["CV", "Job"],
+            "metadatas": [{"document_id": "cv-1"}, {"document_id": "job-1"}],
+        },
+        {"ids": [], "embeddings": [], "documents": [], "metadatas": []},
+    ]
+    target = Mock()
+    target._collection.count.return_value = 0
+    document_repository = Mock()
+    document_repository.vectorstores = {"skillo": source}
+    document_repository.collection_names.return_value = ["skillo_v2"]
+    document_repository.create_vectorstore.return_value = target
+    repository = ChromaManagementRepository(document_repository)
+
+    copied_count = repository.rebuild_index("skillo_v2")
+
+    assert copied_count == 2
+    document_repository.create_vectorstore.assert_called_once_with("skillo_v2")
+    target._collection.upsert.assert_called_once_with(
+        ids=["cv-1", "job-1"],
+        embeddings=[[0.1], [0.2]],
+        documents=["CV", "Job"],
+        metadatas=[{"document_id": "cv-1"}, {"document_id": "job-1"}],
+    )
+    document_repository.switch_collection.assert_called_once_with("skillo_v2")
+
+
+def test_rebuild_index_rejects_active_collection():
+    document_repository = Mock()
+    document_repository.vectorstores = {"skillo": Mock()}
+    document_repository.collection_names.return_value = ["skillo"]
+    repository = ChromaManagementRepository(document_repository)
+
+    with pytest.raises(SkilloRepositoryError):
+        repository.rebuild_index("skillo")
+    document_repository.switch_collection.assert_not_called()
+
+
+def test_rebuild_index_rejects_non_empty_target():
+    target = Mock()
+    target._collection.count.return_value = 5
+    document_repository = Mock()
+    document_repository.vectorstores = {"skillo": Mock()}
+    document_repository.collection_names.return_value = ["skillo_v2"]
+    document_repository.create_vectorstore.return_value = target
+    repository = ChromaManagementRepository(document_repository)
+
+    with pytest.raises(SkilloRepositoryError, match="not empty"):
+        repository.rebuild_index("skillo_v2")
+    document_repository.switch_collection.assert_not_called()
+
+
+def test_migrate_layout_routes_entries_by_document_type():
+    source = Mock()
+    source.get.side_effect = [
+        {
+            "ids": ["cv-1", "job-1", "cv-2"],
+            "embeddings": [[0.1], [0.2], [0.3]],
+            "documents": ["CV 1", "Job", "CV 2"],
+            "metadatas": [
+                {"document_type": "cv"},
+                {"document_type": "job"},
+                {"document_type": "cv"},
+            ],
+        },
+        {"ids": [], "embeddings": [], "documents": [], "metadatas": []},
+    ]
+    targets = {"skillo_cv": Mock(), "skillo_job": Mock()}
+    for target in targets.values():
+        target._collection.count.return_value = 0
+    document_repository = Mock()
+    document_repository.collection_name = "skillo"
+    document_repository.vectorstores = {"skillo": source}
+    document_repository.collection_names.return_value = list(targets)
+    document_repository.partition_name.side_effect = (
+        lambda base, doc_type: f"{base}_{doc_type.value}"
+    )
+    document_repository.create_vectorstore.side_effect = targets.get
+    repository = ChromaManagementRepository(document_repository)
+
+    copied_count = repository.migrate_layout("partitioned")
+
+    assert copied_count == 3
+    cv_upsert = targets["skillo_cv"]._collection.upsert.call_args.kwargs
+    job_upsert = targets["skillo_job"]._collection.upsert.call_args.kwargs
+    assert cv_upsert["ids"] == ["cv-1", "cv-2"]
+    assert cv_upsert["embeddings"] == [[0.1], [0.3]]
+    assert job_upsert["ids"] == ["job-1"]
+    document_repository.switch_collection.assert_called_once_with(
+        "skillo", "partitioned"
+    )
+
+
+def test_migrate_layout_rejects_unknown_layout():
+    repository = ChromaManagementRepository(Mock())
+
+    with pytest.raises(SkilloRepositoryError):
+        repository.migrate_layout("sharded")
+
+
+def test_rebuild_index_publishes_event():
+    management_repository = Mock()
+    management_repository.rebuild_index.return_value = 7
+    publisher = DomainEventPublisher()
+    handler = Mock()
+    publisher.subscribe(IndexRebuiltEvent, handler)
+
+    document_count = RebuildIndex(management_repository, publisher).execute(
+        "skillo_v2"
+    )
+
+    assert document_count == 7
+    event = handler.handle.call_args[0][0]
+    assert event.success is True
+    assert event.collection_name == "skillo_v2"
+
+
+def test_reindex_document_re_embeds_stored_documents():
+    stored = Document(
+        id="cv-1",
+        document_type=DocumentType.CV,
+        content="CV",
+        metadata={"skills": "Python"},
+    )
+    document_repository = Mock()
+    document_repository.get_documents_by_ids.return_value = [stored]
+    publisher = DomainEventPublisher()
+    handler = Mock()
+    publisher.subscribe(DocumentsReindexedEvent, handler)
+
+    count = ReindexDocument(document_repository, publisher).execute_batch(
+        ["cv-1", "cv-404"]
+    )
+
+    assert count == 1
+    document_repository.add_documents.assert_called_once_with([stored])
+    assert handler.handle.call_args[0][0].document_count == 1
+
+
+def test_delete_document_publishes_event():
+    document_repository = Mock()
+    document_repository.delete_documents.return_value = 2
+    publisher = DomainEventPublisher()
+    handler = Mock()
+    publisher.subscribe(DocumentsDeletedEvent, handler)
+
+    count = DeleteDocument(document_repository, publisher).execute_batch(
+        ["cv-1", "job-1"]
+    )
+
+    assert count == 2
+    document_repository.delete_documents.assert_called_once_with(
+        ["cv-1", "job-1"]
+    )
+    assert handler.handle.call_args[0][0].success is True
+
+
+def test_delete_document_failure_raises_repository_error():
+    document_repository = Mock()
+    document_repository.delete_documents.side_effect = Exception("boom")
+
+    with pytest.raises(SkilloRepositoryError):
+        DeleteDocument(document_repository, DomainEventPublisher()).execute(
+            "cv-1"
+        )
+
+
+def test_deleting_documents_deletes_their_stored_matches(tmp_path):
+    from skillo.domain.entities import AgentScores, MatchRecord
+    from skillo.domain.enums import MatchRecommendation
+    from skillo.infrastructure.repositories.sqlite_match_repository import (
+        SqliteMatchRepository,
+    )
+
+    config = Mock()
+    config.MATCH_DB_PATH = str(tmp_path / "matches.db")
+    match_repository = SqliteMatchRepository(config)
+    match_repository.save_matches(
+        [
+            MatchRecord(
+                cv_id=cv_id,
+                job_id=job_id,
+                fingerprint="fp",
+                weighted_final_score=0.5,
+                recommendation=MatchRecommendation.FAIR_MATCH,
+                explanation="",
+                agent_scores=AgentScores(0.5, 0.5, 0.5, 0.5, 0.5),
+                detailed_results={},
+            )
+            for cv_id, job_id in [
+                ("cv-1", "job-1"),
+                ("cv-1", "job-2"),
+                ("cv-2", "job-1"),
+                ("cv-2", "job-2"),
+            ]
+        ]
+    )
+    document_repository = Mock()
+    document_repository.delete_documents.return_value = 2
+
+    DeleteDocument(
+        document_repository, DomainEventPublisher(), match_repository
+    ).execute_batch(["cv-1", "job-1"])
+
+    assert list(match_repository.get_fingerprints()) == [("cv-2", "job-2")]
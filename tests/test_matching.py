@@ -1,7 +1,42 @@
+import threading
+import time
+from functools import partial
 from unittest.mock import Mock, patch
 
+import pytest
+
+from skillo.application.services import IncrementalMatchHandler
+from skillo.application.use_cases import MatchNewDocument
 from skillo.application.use_cases.match_cv_to_jobs import MatchCVToJobs
-from skillo.domain.events import DomainEventPublisher
+from skillo.domain.entities import Document, MatchRecord
+from skillo.domain.enums import DocumentType, MatchRecommendation
+from skillo.domain.events import DocumentUploadedEvent, DomainEventPublisher
+from skillo.domain.factories import MatchResultFactory
+from skillo.domain.services import (
+    BatchMatchingService,
+    CancellationToken,
+    MatchingService,
+)
+from skillo.infrastructure.concurrency.async_event_publisher import (
+    AsyncEventPublisher,
+)
+from skillo.infrastructure.concurrency.circuit_breaker import CircuitBreaker
+from skillo.infrastructure.concurrency.priority_scheduler import (
+    PriorityParallelExecutor,
+    PriorityScheduler,
+    TaskPriority,
+)
+from skillo.infrastructure.concurrency.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+from skillo.infrastructure.concurrency.thread_pool_executor import (
+    ThreadPoolParallelExecutor,
+)
+from skillo.infrastructure.concurrency.worker_pool import WorkerPool
+from skillo.infrastructure.config.settings import Config
+from skillo.infrastructure.repositories.sqlite_match_repository import (
+    SqliteMatchRepository,
+)
 
 
 def test_cv_to_jobs_matching(sample_cv, sample_job):
@@ -49,3 +84,719 @@ def test_cv_to_jobs_matching(sample_cv, sample_job):
         assert len(results) >= 0
 
         mock_matching_svc.match_cv_to_all_jobs.assert_called_once()
+
+
+def _analysis(score=0.7):
+    return {
+        "skills_score": score,
+        "location_score": score,
+        "experience_score": score,
+        "preferences_score": score,
+        "education_score": score,
+        "weighted_final_score": score,
+        "recommendation": MatchRecommendation.GOOD_MATCH.value,
+        "explanation": "Skills: solid overlap",
+        "detailed_results": {"skills": {"score": score}},
+    }
+
+
+@pytest.fixture
+def match_repository(tmp_path):
+    config = Mock(spec=Config)
+    config.MATCH_DB_PATH = str(tmp_path / "matches.db")
+    return SqliteMatchRepository(config)
+
+
+def _document(doc_id, doc_type, content="content"):
+    return Document(id=doc_id, document_type=doc_type, content=content)
+
+
+def test_matching_service_reuses_fresh_stored_match(match_repository):
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = lambda **_: _analysis()
+    service = MatchingService(
+        document_repository=Mock(),
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(),
+        match_repository=match_repository,
+    )
+    cv = _document("cv-1", DocumentType.CV)
+    job = _document("job-1", DocumentType.JOB)
+
+    first = service.analyze_pair(cv, job)
+    second = service.analyze_pair(cv, job)
+    changed = service.analyze_pair(
+        _document("cv-1", DocumentType.CV, "edited"), job
+    )
+
+    assert supervisor.analyze_match.call_count <= 2
+    assert second.weighted_final_score == first.weighted_final_score
+    assert second.detailed_results == {"skills": {"score": 0.7}}
+    assert changed.cv_document.content == "edited"
+
+
+def test_stored_match_goes_stale_when_a_profile_changes(match_repository):
+    cv = _document("cv-1", DocumentType.CV)
+    job = _document("job-1", DocumentType.JOB)
+    record = MatchRecord.from_match_result(
+        MatchResultFactory.from_analysis_result(
+            {**_analysis(), "cv_document": cv, "job_document": job}
+        )
+    )
+    profiled = Document(
+        id="cv-1",
+        document_type=DocumentType.CV,
+        content="content",
+        metadata={"analysis_skills": "Python", "filename": "cv.pdf"},
+    )
+    reprofiled = Document(
+        id="cv-1",
+        document_type=DocumentType.CV,
+        content="content",
+        metadata={"analysis_skills": "Python; Go", "filename": "cv.pdf"},
+    )
+
+    assert record.is_fresh_for(cv, job)
+    assert not record.is_fresh_for(profiled, job)
+    assert MatchRecord.fingerprint_for(profiled, job) != (
+        MatchRecord.fingerprint_for(reprofiled, job)
+    )
+
+
+def test_analyses_with_failed_agent_calls_are_not_stored(match_repository):
+    degraded = {
+        **_analysis(),
+        "detailed_results": {"skills": {"score": 0.0, "failed": True}},
+        "failed_agents": ["skills"],
+        "degraded": True,
+    }
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = [degraded, _analysis()]
+    service = MatchingService(
+        document_repository=Mock(),
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(),
+        match_repository=match_repository,
+    )
+    cv = _document("cv-1", DocumentType.CV)
+    job = _document("job-1", DocumentType.JOB)
+
+    assert service.analyze_pair(cv, job) is None
+    assert match_repository.get_match("cv-1", "job-1") is None
+    assert service.analyze_pair(cv, job).weighted_final_score == 0.7
+    assert supervisor.analyze_match.call_count == 2
+
+    stored = match_repository.get_match("cv-1", "job-1")
+    stored.detailed_results = degraded["detailed_results"]
+    assert stored.degraded and not stored.is_fresh_for(cv, job)
+
+
+def test_batch_matching_computes_only_stale_pairs(match_repository):
+    cvs = [
+        _document("cv-1", DocumentType.CV),
+        _document("cv-2", DocumentType.CV),
+    ]
+    jobs = [_document("job-1", DocumentType.JOB)]
+    document_repository = Mock()
+    document_repository.get_documents_by_type.side_effect = lambda t: (
+        cvs if t == DocumentType.CV else jobs
+    )
+    match_repository.save_matches(
+        [
+            MatchRecord.from_match_result(
+                MatchResultFactory.from_analysis_result(
+                    {
+                        **_analysis(),
+                        "cv_document": cvs[0],
+                        "job_document": jobs[0],
+                    }
+                )
+            )
+        ]
+    )
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = lambda **_: _analysis(0.9)
+    executor = ThreadPoolParallelExecutor(max_workers=2)
+    matching_service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=executor,
+        match_repository=match_repository,
+    )
+    progress = []
+
+    summary = BatchMatchingService(
+        matching_service=matching_service,
+        document_repository=document_repository,
+        match_repository=match_repository,
+        parallel_executor=executor,
+        chunk_size=1,
+    ).run(progress_callback=lambda done, total: progress.append(done))
+
+    assert (summary.total_pairs, summary.reused, summary.computed) == (2, 1, 1)
+    assert supervisor.analyze_match.call_count == 1
+    assert progress == [1]
+    assert [
+        r.cv_id for r in match_repository.get_matches_for_job("job-1")
+    ] == [
+        "cv-2",
+        "cv-1",
+    ]
+
+
+def test_token_bucket_rate_limiter_paces_calls():
+    limiter = TokenBucketRateLimiter(rate_per_second=50, burst=1)
+
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.07
+
+
+def test_shared_worker_pool_caps_concurrency_across_executors():
+    pool = WorkerPool(max_workers=2)
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def task():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return 1
+
+    executors = [ThreadPoolParallelExecutor(pool=pool) for _ in range(2)]
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda e=executor: results.extend(
+                e.execute_tasks_with_progress([task] * 4)
+            )
+        )
+        for executor in executors
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1] * 8
+    assert peak[0] <= 2
+    assert pool.stats()["completed_tasks"] == 8
+
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(task)
+
+
+def test_executor_window_takes_lazy_tasks_as_earlier_ones_finish():
+    executor = ThreadPoolParallelExecutor(max_workers=4)
+    lock = threading.Lock()
+    alive = [0]
+    peak = [0]
+
+    def task(index):
+        time.sleep(0.005)
+        with lock:
+            alive[0] -= 1
+        return index
+
+    def tasks():
+        for index in range(20):
+            with lock:
+                alive[0] += 1
+                peak[0] = max(peak[0], alive[0])
+            yield partial(task, index)
+
+    results = list(executor.iter_task_results(tasks(), max_in_flight=2))
+
+    assert sorted(results) == list(range(20))
+    assert peak[0] <= 2
+    executor.pool.shutdown()
+
+
+def test_priority_scheduler_reserves_workers_and_rotates_flows():
+    scheduler = PriorityScheduler(
+        max_workers=2,
+        shares={TaskPriority.INTERACTIVE: 1.0, TaskPriority.BATCH: 0.5},
+    )
+    release = threading.Event()
+    order = []
+
+    def batch_task(name):
+        release.wait(1)
+        order.append(name)
+
+    futures = [
+        scheduler.submit(partial(batch_task, name), TaskPriority.BATCH, flow)
+        for name, flow in [("a1", "a"), ("a2", "a"), ("a3", "a"), ("b1", "b")]
+    ]
+
+    interactive = PriorityParallelExecutor(scheduler, TaskPriority.INTERACTIVE)
+    started = time.monotonic()
+    assert interactive.execute_tasks_with_progress([lambda: "match"]) == [
+        "match"
+    ]
+    assert time.monotonic() - started < 0.5
+    stats = scheduler.stats()
+    assert stats["batch_active"] <= 1
+    assert stats["batch_active"] + stats["batch_queued"] == 4
+
+    release.set()
+    for future in futures:
+        future.result(timeout=1)
+    scheduler.shutdown()
+    assert sorted(order) == ["a1", "a2", "a3", "b1"]
+    assert order.index("b1") < order.index("a3")
+
+
+def test_uploaded_document_is_matched_against_neighbours(match_repository):
+    cv = _document("cv-new", DocumentType.CV)
+    jobs = [_document("job-1", DocumentType.JOB)]
+    document_repository = Mock()
+    document_repository.get_documents_by_ids.return_value = [cv]
+    document_repository.find_similar_documents.return_value = jobs
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = lambda **_: _analysis()
+    handler = IncrementalMatchHandler(
+        MatchNewDocument(
+            document_repository=document_repository,
+            match_repository=match_repository,
+            supervisor_agent=supervisor,
+            parallel_executor=ThreadPoolParallelExecutor(),
+            rate_limiter=TokenBucketRateLimiter(rate_per_second=0),
+            neighbour_count=3,
+        )
+    )
+    publisher = AsyncEventPublisher()
+    publisher.subscribe(DocumentUploadedEvent, handler)
+
+    event = DocumentUploadedEvent(
+        filename="cv.pdf", document_type="CV", document_id="cv-new"
+    )
+    publisher.publish(event)
+    publisher.wait_until_idle()
+
+    document_repository.find_similar_documents.assert_called_once_with(
+        query="content", doc_type=DocumentType.JOB, limit=3
+    )
+    assert handler.processed_count == 1
+    assert match_repository.get_match("cv-new", "job-1") is not None
+
+    handler.handle_batch([event, event])
+    assert handler.processed_count == 2
+
+
+def test_async_publisher_isolates_handlers_and_batches_backlog():
+    gate = threading.Event()
+    calls = []
+
+    class SlowHandler:
+        def handle(self, event):
+            gate.wait(1)
+            calls.append(("slow", event.document_id))
+
+    class BatchHandler:
+        def handle(self, event):
+            calls.append(("batch", [event.document_id]))
+
+        def handle_batch(self, events):
+            calls.append(("batch", [event.document_id for event in events]))
+
+    failing = Mock(spec=["handle"])
+    failing.handle.side_effect = RuntimeError("sink down")
+
+    publisher = AsyncEventPublisher(max_queue=10, max_batch=10)
+    for handler in (SlowHandler(), failing, BatchHandler()):
+        publisher.subscribe(DocumentUploadedEvent, handler)
+
+    started = time.monotonic()
+    for index in range(4):
+        publisher.publish(
+            DocumentUploadedEvent(
+                filename="cv.pdf",
+                document_type="CV",
+                document_id=f"cv-{index}",
+            )
+        )
+    assert time.monotonic() - started < 0.5
+
+    gate.set()
+    publisher.wait_until_idle()
+
+    assert [name for name, _ in calls].count("slow") == 4
+    batches = [ids for name, ids in calls if name == "batch"]
+    assert sum(batches, []) == ["cv-0", "cv-1", "cv-2", "cv-3"]
+    assert len(batches) < 4
+    stats = publisher.stats()
+    assert stats["published"] == 4
+    assert stats["handler_errors"] == 4
+    assert stats["queued"] == 0
+    assert stats["p95_lag_ms"] > 0
+
+
+def test_async_publisher_lag_includes_handler_time():
+    class SlowHandler:
+        def handle(self, event):
+            time.sleep(0.05)
+
+    publisher = AsyncEventPublisher()
+    publisher.subscribe(DocumentUploadedEvent, SlowHandler())
+    publisher.subscribe(DocumentUploadedEvent, Mock(spec=["handle"]))
+    for index in range(2):
+        publisher.publish(
+            DocumentUploadedEvent(
+                filename="cv.pdf",
+                document_type="CV",
+                document_id=f"cv-{index}",
+            )
+        )
+    publisher.wait_until_idle()
+
+    assert publisher.stats()["p95_lag_ms"] >= 50
+
+
+def test_job_to_cvs_matching_batches_candidates(match_repository):
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [_document(f"cv-{i}", DocumentType.CV) for i in range(5)]
+    document_repository = Mock()
+    document_repository.find_similar_documents.return_value = cvs
+    supervisor = Mock()
+    supervisor.analyze_match_batch.side_effect = (
+        lambda cv_documents, job_document: [_analysis() for _ in cv_documents]
+    )
+    supervisor.analyze_match.side_effect = lambda **_: _analysis()
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(),
+        top_candidates_count=10,
+        match_repository=match_repository,
+        match_batch_size=2,
+    )
+
+    matches = service.match_job_to_all_cvs(job)
+
+    assert len(matches) == 5
+    assert sorted(
+        len(call.kwargs["cv_documents"])
+        for call in supervisor.analyze_match_batch.call_args_list
+    ) == [2, 2]
+    assert supervisor.analyze_match.call_count == 1
+    assert len(match_repository.get_matches_for_job("job-1")) == 5
+
+
+def test_streamed_matching_keeps_bounded_running_top_k():
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [
+        _document(f"cv-{i}", DocumentType.CV, content=str(score))
+        for i, score in enumerate([0.5, 0.9, 0.2, 0.7, 0.8])
+    ]
+    document_repository = Mock()
+    document_repository.find_similar_documents.return_value = cvs
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = lambda cv_document, **_: _analysis(
+        float(cv_document.content)
+    )
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(max_workers=1),
+        top_candidates_count=2,
+        min_match_score=0.3,
+    )
+
+    updates = list(service.stream_job_to_all_cvs(job))
+
+    assert [update.completed for update in updates] == [1, 2, 3, 4, 5]
+    assert all(len(update.new_matches) == 1 for update in updates)
+    assert all(len(update.top_matches) <= 2 for update in updates)
+    assert [m.cv_document.id for m in updates[-1].top_matches] == [
+        "cv-1",
+        "cv-4",
+    ]
+    assert updates[-1].top_matches == service.match_job_to_all_cvs(job)
+
+
+def test_cancelled_matching_skips_pending_analyses():
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [_document(f"cv-{i}", DocumentType.CV) for i in range(6)]
+    document_repository = Mock()
+    document_repository.find_similar_documents.return_value = cvs
+    token = CancellationToken()
+
+    def analyze(**_):
+        token.cancel()
+        time.sleep(0.3)
+        return _analysis()
+
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = analyze
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(max_workers=2),
+        top_candidates_count=6,
+    )
+
+    started = time.monotonic()
+    matches = service.match_job_to_all_cvs_with_progress(
+        job, cancellation_token=token
+    )
+
+    assert time.monotonic() - started < 0.3
+    assert matches == []
+    assert supervisor.analyze_match.call_count <= 2
+
+
+def test_open_circuit_returns_degraded_similarity_ranking(match_repository):
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "test_circuit",
+        failure_threshold=2,
+        reset_timeout=30,
+        clock=lambda: now[0],
+    )
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [_document(f"cv-{i}", DocumentType.CV) for i in range(3)]
+    document_repository = Mock()
+    document_repository.find_similar_documents_with_scores.return_value = [
+        (cvs[1], 0.6),
+        (cvs[0], 0.9),
+        (cvs[2], 0.1),
+    ]
+    supervisor = Mock()
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(),
+        top_candidates_count=3,
+        match_repository=match_repository,
+        circuit_breaker=breaker,
+    )
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.is_open() and not breaker.allow_request()
+
+    matches = service.match_job_to_all_cvs_with_progress(job)
+
+    assert [match.cv_document.id for match in matches] == [
+        "cv-0",
+        "cv-1",
+        "cv-2",
+    ]
+    assert all(match.degraded for match in matches)
+    assert all(
+        match.recommendation == MatchRecommendation.NOT_ANALYSED
+        and match.weighted_final_score == 0.0
+        for match in matches
+    )
+    assert matches[0].detailed_results == {"similarity": 0.9}
+    supervisor.analyze_match.assert_not_called()
+    assert match_repository.get_matches_for_job("job-1") == []
+
+    now[0] = 31.0
+    assert not breaker.is_open()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_stored_matches_are_rescored_under_new_weights(match_repository):
+    from skillo.domain.entities import AgentScores
+    from skillo.infrastructure.services.numpy_match_rescorer import (
+        NumpyMatchRescorer,
+    )
+
+    job = _document("job-1", DocumentType.JOB)
+    documents = [job] + [
+        _document(cv_id, DocumentType.CV)
+        for cv_id in ("cv-skills", "cv-local", "cv-edited")
+    ]
+
+    def record(cv_id, skills, location):
+        return MatchRecord(
+            cv_id=cv_id,
+            job_id="job-1",
+            fingerprint=MatchRecord.fingerprint_for(
+                _document(cv_id, DocumentType.CV), job
+            ),
+            weighted_final_score=skills,
+            recommendation=MatchRecommendation.from_score(skills),
+            explanation="",
+            agent_scores=AgentScores(skills, location, 0.5, 0.5, 0.5),
+        )
+
+    edited = record("cv-edited", 0.1, 1.0)
+    edited.fingerprint = "stale"
+    match_repository.save_matches(
+        [
+            record("cv-skills", 0.9, 0.1),
+            record("cv-local", 0.3, 1.0),
+            record("cv-deleted", 0.1, 1.0),
+            edited,
+        ]
+    )
+    document_repository = Mock()
+    document_repository.get_documents_by_ids.side_effect = lambda ids: [
+        document for document in documents if document.id in ids
+    ]
+
+    summary = NumpyMatchRescorer(
+        match_repository, document_repository
+    ).rescore({"skills_weight": 1.0, "location_weight": 3.0}, top_count=1)
+
+    assert summary.total_pairs == 2
+    assert [pair.cv_id for pair in summary.top_pairs] == ["cv-local"]
+    assert summary.top_pairs[0].weighted_final_score == pytest.approx(0.825)
+    assert summary.top_pairs[0].recommendation == "Strong Match"
+    assert summary.recommendation_counts["Poor Match"] == 1
+    assert summary.changed_recommendations == 2
+
+
+def test_stored_matches_are_restored_under_current_weights(match_repository):
+    from skillo.application.use_cases import GetStoredMatches
+    from skillo.domain.entities import AgentScores
+
+    job = _document("job-1", DocumentType.JOB)
+    cvs = {
+        "cv-skills": AgentScores(0.9, 0.1, 0.5, 0.5, 0.5),
+        "cv-local": AgentScores(0.3, 1.0, 0.5, 0.5, 0.5),
+    }
+    match_repository.save_matches(
+        [
+            MatchRecord(
+                cv_id=cv_id,
+                job_id="job-1",
+                fingerprint=MatchRecord.fingerprint_for(
+                    _document(cv_id, DocumentType.CV), job
+                ),
+                weighted_final_score=0.5,
+                recommendation=MatchRecommendation.FAIR_MATCH,
+                explanation="",
+                agent_scores=scores,
+            )
+            for cv_id, scores in cvs.items()
+        ]
+    )
+    weights = {
+        "skills_weight": 1.0,
+        "location_weight": 0.0,
+        "experience_weight": 0.0,
+        "preferences_weight": 0.0,
+        "education_weight": 0.0,
+    }
+    supervisor = Mock()
+    service = MatchingService(
+        document_repository=Mock(),
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(),
+        match_repository=match_repository,
+        agent_weights=weights,
+    )
+    document_repository = Mock()
+    document_repository.get_documents_by_ids.return_value = [
+        _document(cv_id, DocumentType.CV) for cv_id in cvs
+    ]
+
+    restored = service.analyze_pair(
+        _document("cv-skills", DocumentType.CV), job
+    )
+    stored = GetStoredMatches(
+        document_repository,
+        match_repository,
+        top_candidates_count=5,
+        min_match_score=0.4,
+        agent_weights=weights,
+    ).execute_for_job(job)
+
+    supervisor.analyze_match.assert_not_called()
+    assert restored.weighted_final_score == pytest.approx(0.9)
+    assert restored.recommendation == MatchRecommendation.STRONG_MATCH
+    assert [match.cv_document.id for match in stored] == ["cv-skills"]
+
+
+def test_analyses_are_judged_by_their_own_agent_calls(match_repository):
+    breaker = CircuitBreaker("test_own_calls_circuit", failure_threshold=1)
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [_document(f"cv-{i}", DocumentType.CV) for i in range(2)]
+    document_repository = Mock()
+    document_repository.find_similar_documents.return_value = cvs
+    document_repository.find_similar_documents_with_scores.return_value = [
+        (cvs[0], 0.9),
+        (cvs[1], 0.8),
+    ]
+
+    def analyze_match(cv_document, job_document):
+        if cv_document.id == "cv-0":
+            breaker.record_failure()
+            return _analysis()
+        return {
+            **_analysis(0.0),
+            "detailed_results": {"skills": {"score": 0.0, "failed": True}},
+            "degraded": True,
+        }
+
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = analyze_match
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(max_workers=1),
+        top_candidates_count=2,
+        match_repository=match_repository,
+        circuit_breaker=breaker,
+    )
+
+    matches = service.match_job_to_all_cvs_with_progress(job)
+
+    assert breaker.is_open()
+    assert {m.cv_document.id: m.degraded for m in matches} == {
+        "cv-0": False,
+        "cv-1": True,
+    }
+    assert [
+        r.cv_id for r in match_repository.get_matches_for_job("job-1")
+    ] == ["cv-0"]
+
+
+def test_unanalysed_matches_follow_the_analysed_ranking():
+    breaker = CircuitBreaker("test_unanalysed_circuit", failure_threshold=5)
+    job = _document("job-1", DocumentType.JOB)
+    cvs = [_document(f"cv-{i}", DocumentType.CV) for i in range(2)]
+    document_repository = Mock()
+    document_repository.find_similar_documents.return_value = cvs
+    document_repository.find_similar_documents_with_scores.return_value = [
+        (cvs[1], 0.95),
+        (cvs[0], 0.4),
+    ]
+
+    def analyze_match(cv_document, job_document):
+        if cv_document.id == "cv-1":
+            raise RuntimeError("agent unavailable")
+        return _analysis(0.35)
+
+    supervisor = Mock()
+    supervisor.analyze_match.side_effect = analyze_match
+    service = MatchingService(
+        document_repository=document_repository,
+        supervisor_agent=supervisor,
+        parallel_executor=ThreadPoolParallelExecutor(max_workers=1),
+        top_candidates_count=2,
+        circuit_breaker=breaker,
+    )
+
+    matches = service.match_job_to_all_cvs_with_progress(job)
+
+    assert [(m.cv_document.id, m.degraded) for m in matches] == [
+        ("cv-0", False),
+        ("cv-1", True),
+    ]
+    assert matches[1].recommendation == MatchRecommendation.NOT_ANALYSED
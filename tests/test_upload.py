@@ -26,3 +26,124 @@ def test_document_upload_end_to_end(sample_cv):
         assert result is True
         mock_repository.add_document.assert_called_once()
         mock_mapper.assert_called_once_with(sample_cv)
+
+
+def test_bulk_upload_upserts_extracted_documents_in_batches():
+    from skillo.application.use_cases.process_and_upload_documents import (
+        ProcessUploadedDocuments,
+    )
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.infrastructure.concurrency.thread_pool_executor import (
+        ThreadPoolParallelExecutor,
+    )
+
+    def process_document(file, file_type):
+        if file.name == "broken.pdf":
+            return None
+        return Document(
+            file.name, DocumentType.CV, "text", {"filename": file.name}
+        )
+
+    files = [Mock() for _ in range(6)]
+    for index, file in enumerate(files):
+        file.name = "broken.pdf" if index == 2 else f"cv-{index}.pdf"
+    repository = Mock()
+    repository.add_documents.return_value = True
+    processor = Mock()
+    processor.process_document.side_effect = process_document
+    executor = ThreadPoolParallelExecutor(max_workers=2)
+
+    result = ProcessUploadedDocuments(
+        processor,
+        UploadDocument(repository, DomainEventPublisher()),
+        executor,
+        DomainEventPublisher(),
+        max_in_flight=2,
+        upload_batch_size=2,
+    ).execute_with_progress(files, "cv")
+
+    batches = [
+        [document.id for document in call.args[0]]
+        for call in repository.add_documents.call_args_list
+    ]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(sum(batches, [])) == [f"cv-{i}.pdf" for i in (0, 1, 3, 4, 5)]
+    assert result.successful_uploads == 5
+    assert result.failed_uploads == 1
+    repository.add_document.assert_not_called()
+    executor.pool.shutdown()
+
+
+def test_bulk_upload_releases_files_and_reports_cancelled_ones():
+    import gc
+    import io
+    import weakref
+
+    from skillo.application.use_cases.process_and_upload_documents import (
+        ProcessUploadedDocuments,
+    )
+    from skillo.domain.entities import Document
+    from skillo.domain.enums import DocumentType
+    from skillo.domain.services import CancellationToken
+    from skillo.infrastructure.concurrency.thread_pool_executor import (
+        ThreadPoolParallelExecutor,
+    )
+
+    class Upload(io.BytesIO):
+        def __init__(self, name):
+            super().__init__(b"%PDF")
+            self.name = name
+
+        def close(self):
+            closed.append(self.name)
+            super().close()
+
+    class Processor:
+        def process_document(self, file, file_type):
+            if file.name == "cv-1.pdf":
+                released.append(list(closed))
+                gc.collect()
+                released.append(uploads[0]() is None)
+                token.cancel()
+            return Document(file.name, DocumentType.CV, "text")
+
+    token = CancellationToken()
+    uploads, closed, released = [], [], []
+
+    def files():
+        for index in range(5):
+            upload = Upload(f"cv-{index}.pdf")
+            uploads.append(weakref.ref(upload))
+            yield upload
+
+    repository = Mock()
+    repository.add_documents.return_value = True
+    executor = ThreadPoolParallelExecutor(max_workers=1)
+    progress = []
+
+    result = ProcessUploadedDocuments(
+        Processor(),
+        UploadDocument(repository, DomainEventPublisher()),
+        executor,
+        DomainEventPublisher(),
+        max_in_flight=1,
+        upload_batch_size=16,
+    ).execute_with_progress(
+        files(),
+        "cv",
+        lambda done, total: progress.append((done, total)),
+        token,
+    )
+    executor.pool.shutdown()
+    gc.collect()
+
+    assert released == [["cv-0.pdf"], True]
+    assert progress == [(1, 1), (2, 2)]
+    assert result.successful_uploads == 2
+    assert [r["filename"] for r in result.results if not r["success"]] == [
+        "cv-2.pdf",
+        "cv-3.pdf",
+        "cv-4.pdf",
+    ]
+    assert [upload() for upload in uploads] == [None] * 5
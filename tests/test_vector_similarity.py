@@ -9,6 +9,9 @@ from skillo.infrastructure.config.settings import Config
 from skillo.infrastructure.repositories.chroma_document_repository import (
     ChromaDocumentRepository,
 )
+from skillo.infrastructure.repositories.numpy_document_repository import (
+    NumpyDocumentRepository,
+)
 
 
 @pytest.fixture
@@ -18,6 +21,7 @@ def mock_config():
     config.OPENAI_API_KEY = "test-key-123"
     config.EMBEDDING_MODEL = "text-embedding-3-small"
     config.CHROMA_DB_PATH = "./test_chroma_db"
+    config.CHROMA_HOST = ""
     config.COLLECTION_NAME = "test_documents"
     return config
 
@@ -67,11 +71,34 @@ def test_chroma_repository_initialization(mock_config):
         mock_embeddings.assert_called_once_with(
             api_key=mock_config.OPENAI_API_KEY,
             model=mock_config.EMBEDDING_MODEL,
+            max_retries=0,
         )
         mock_chroma.assert_called_once()
         assert repo.config == mock_config
 
 
+def test_chroma_repository_connects_to_server_when_host_set(mock_config):
+    """Test ChromaDocumentRepository uses a Chroma server instead of a path."""
+    mock_config.CHROMA_HOST = "chroma"
+    mock_config.CHROMA_PORT = 8000
+    with (
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.Chroma"
+        ) as mock_chroma,
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.OpenAIEmbeddings"
+        ),
+        patch("os.makedirs") as mock_makedirs,
+    ):
+        repo = ChromaDocumentRepository(mock_config)
+        kwargs = mock_chroma.call_args.kwargs
+        assert kwargs["host"] == "chroma"
+        assert kwargs["port"] == 8000
+        assert "persist_directory" not in kwargs
+        mock_makedirs.assert_not_called()
+        assert repo.location == "chroma:8000"
+
+
 def test_add_document_successfully(mock_config, sample_cv_document):
     """Test adding document to vector database successfully."""
     with (
@@ -99,6 +126,35 @@ def test_add_document_successfully(mock_config, sample_cv_document):
             == sample_cv_document.document_type.value
         )
         assert result is True
+        assert call_args[1]["ids"] == [sample_cv_document.id]
+
+
+def test_add_documents_upserts_unique_ids(
+    mock_config, sample_cv_document, sample_job_document
+):
+    """Test batch add keys entries by document id and drops repeats."""
+    with (
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.Chroma"
+        ) as mock_chroma,
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.OpenAIEmbeddings"
+        ),
+        patch("os.makedirs"),
+    ):
+        mock_vectorstore = Mock()
+        mock_chroma.return_value = mock_vectorstore
+        repo = ChromaDocumentRepository(mock_config)
+        result = repo.add_documents(
+            [sample_cv_document, sample_job_document, sample_cv_document]
+        )
+        call_args = mock_vectorstore.add_documents.call_args
+        assert len(call_args[0][0]) == 2
+        assert call_args[1]["ids"] == [
+            sample_cv_document.id,
+            sample_job_document.id,
+        ]
+        assert result is True
 
 
 def test_add_document_failure(mock_config, sample_cv_document):
@@ -319,5 +375,239 @@ def test_embedding_model_configuration(mock_config):
         mock_config.OPENAI_API_KEY = "custom-api-key"
         ChromaDocumentRepository(mock_config)
         mock_embeddings.assert_called_once_with(
-            api_key="custom-api-key", model="text-embedding-ada-002"
+            api_key="custom-api-key",
+            model="text-embedding-ada-002",
+            max_retries=0,
+        )
+
+
+def test_partitioned_layout_routes_by_document_type(
+    mock_config, sample_cv_document, sample_job_document
+):
+    """Test partitioned layout keeps one collection per type, unfiltered."""
+    mock_config.CHROMA_COLLECTION_LAYOUT = "partitioned"
+    with (
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.Chroma"
+        ) as mock_chroma,
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.OpenAIEmbeddings"
+        ),
+        patch("os.makedirs"),
+    ):
+        stores = {}
+        mock_chroma.side_effect = lambda collection_name, **kwargs: (
+            stores.setdefault(collection_name, Mock())
+        )
+        repo = ChromaDocumentRepository(mock_config)
+        repo.add_documents([sample_cv_document, sample_job_document])
+        stores["test_documents_cv"].similarity_search.return_value = []
+        repo.find_similar_documents("Python", DocumentType.CV, limit=3)
+
+        assert set(stores) == {"test_documents_cv", "test_documents_job"}
+        cv_ids = stores["test_documents_cv"].add_documents.call_args[1]["ids"]
+        job_ids = stores["test_documents_job"].add_documents.call_args[1][
+            "ids"
+        ]
+        assert cv_ids == [sample_cv_document.id]
+        assert job_ids == [sample_job_document.id]
+        stores["test_documents_cv"].similarity_search.assert_called_once_with(
+            query="Python", k=3, filter=None
+        )
+
+
+def test_delete_documents_removes_all_entries(mock_config):
+    """Test deletion removes every entry stored for the selected ids."""
+    with (
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.Chroma"
+        ) as mock_chroma,
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.OpenAIEmbeddings"
+        ),
+        patch("os.makedirs"),
+    ):
+        mock_vectorstore = Mock()
+        mock_vectorstore.get.return_value = {
+            "ids": ["cv-001", "uuid-a"],
+            "metadatas": [
+                {"document_id": "cv-001"},
+                {"document_id": "cv-001"},
+            ],
+        }
+        mock_chroma.return_value = mock_vectorstore
+        repo = ChromaDocumentRepository(mock_config)
+        deleted_count = repo.delete_documents(["cv-001", "cv-404"])
+
+        mock_vectorstore.get.assert_called_once_with(
+            where={"document_id": {"$in": ["cv-001", "cv-404"]}},
+            include=["metadatas"],
+        )
+        mock_vectorstore.delete.assert_called_once_with(
+            ids=["cv-001", "uuid-a"]
         )
+        assert deleted_count == 1
+
+
+def test_get_documents_by_ids_returns_stored_documents(mock_config):
+    """Test lookup by id restores stored content and metadata."""
+    with (
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.Chroma"
+        ) as mock_chroma,
+        patch(
+            "skillo.infrastructure.repositories.chroma_document_repository.OpenAIEmbeddings"
+        ),
+        patch("os.makedirs"),
+    ):
+        mock_vectorstore = Mock()
+        mock_vectorstore.get.return_value = {
+            "documents": ["Python Developer CV"],
+            "metadatas": [
+                {
+                    "document_id": "cv-001",
+                    "document_type": "cv",
+                    "skills": "Python",
+                }
+            ],
+        }
+        mock_chroma.return_value = mock_vectorstore
+        repo = ChromaDocumentRepository(mock_config)
+        documents = repo.get_documents_by_ids(["cv-001"])
+
+        assert len(documents) == 1
+        assert documents[0].id == "cv-001"
+        assert documents[0].document_type == DocumentType.CV
+        assert documents[0].metadata == {"skills": "Python"}
+
+
+@pytest.fixture
+def numpy_repository(tmp_path):
+    """NumPy repository with deterministic word-count embeddings."""
+    vocabulary = ["python", "django", "java", "spring", "remote"]
+
+    def embed(text):
+        words = text.lower().split()
+        return [float(words.count(word)) + 0.01 for word in vocabulary]
+
+    embeddings = Mock()
+    embeddings.embed_documents.side_effect = lambda texts: [
+        embed(text) for text in texts
+    ]
+    embeddings.embed_query.side_effect = embed
+
+    config = Mock(spec=Config)
+    config.OPENAI_API_KEY = "test-key-123"
+    config.EMBEDDING_MODEL = "text-embedding-3-small"
+    config.NUMPY_INDEX_PATH = str(tmp_path)
+    config.NUMPY_INDEX_TYPE = "flat"
+    config.NUMPY_IVF_NLIST = 2
+    config.NUMPY_IVF_NPROBE = 1
+    with patch(
+        "skillo.infrastructure.repositories.numpy_document_repository.OpenAIEmbeddings",
+        return_value=embeddings,
+    ):
+        yield NumpyDocumentRepository(config)
+
+
+def test_numpy_repository_ranks_by_cosine_similarity(numpy_repository):
+    """Test NumPy backend returns filtered top-k in similarity order."""
+    numpy_repository.add_documents(
+        [
+            Document("cv-java", DocumentType.CV, "java spring java"),
+            Document("cv-python", DocumentType.CV, "python django python"),
+            Document("job-python", DocumentType.JOB, "python django"),
+        ]
+    )
+
+    results = numpy_repository.find_similar_documents(
+        "python django", DocumentType.CV, limit=1
+    )
+
+    assert [doc.id for doc in results] == ["cv-python"]
+    assert results[0].document_type == DocumentType.CV
+
+
+def test_numpy_repository_upserts_and_persists(
+    numpy_repository, sample_cv_document
+):
+    """Test re-adding an id replaces its row and data survives reopening."""
+    numpy_repository.add_document(sample_cv_document)
+    numpy_repository.add_document(sample_cv_document)
+
+    reopened = NumpyDocumentRepository(numpy_repository.config)
+    reopened.embeddings = numpy_repository.embeddings
+    documents = reopened.get_documents_by_type(DocumentType.CV)
+
+    assert [doc.id for doc in documents] == [sample_cv_document.id]
+    assert documents[0].metadata == sample_cv_document.metadata
+    assert reopened.delete_documents([sample_cv_document.id]) == 1
+    assert reopened.get_documents_by_type(DocumentType.CV) == []
+
+
+def test_numpy_repository_ivf_search_matches_flat(numpy_repository):
+    """Test IVF probing finds the nearest neighbour of clustered vectors."""
+    numpy_repository.upsert_embeddings(
+        [Document(f"cv-{i}", DocumentType.CV, f"cv {i}") for i in range(6)],
+        [
+            [1.0, 0.1, 0.0],
+            [0.9, 0.2, 0.0],
+            [1.0, 0.0, 0.1],
+            [0.0, 0.1, 1.0],
+            [0.1, 0.0, 0.9],
+            [0.0, 0.2, 1.0],
+        ],
+    )
+    flat = numpy_repository.search_by_vector(
+        [0.0, 0.0, 1.0], DocumentType.CV, 1
+    )
+    numpy_repository.config.NUMPY_INDEX_TYPE = "ivf"
+    ivf = numpy_repository.search_by_vector(
+        [0.0, 0.0, 1.0], DocumentType.CV, 1
+    )
+
+    assert [doc.id for doc in ivf] == [doc.id for doc in flat]
+
+
+def test_numpy_repository_updates_ivf_lists_and_rows_incrementally(
+    numpy_repository,
+):
+    """Test writes extend trained IVF lists and reuse freed rows safely."""
+    numpy_repository.config.NUMPY_INDEX_TYPE = "ivf"
+    numpy_repository.upsert_embeddings(
+        [Document(f"cv-{i}", DocumentType.CV, f"cv {i}") for i in range(10)],
+        [[1.0, 0.1 * i, 0.0] for i in range(5)]
+        + [[0.0, 0.1 * i, 1.0] for i in range(5)],
+    )
+    numpy_repository.search_by_vector([1.0, 0.0, 0.0], DocumentType.CV, 1)
+    index = numpy_repository._ivf_indexes[DocumentType.CV]
+
+    numpy_repository.delete_documents(["cv-9"])
+    numpy_repository.upsert_embeddings(
+        [Document("cv-new", DocumentType.CV, "new")], [[0.0, -0.5, 1.0]]
+    )
+    found = numpy_repository.search_by_vector(
+        [0.0, -0.5, 1.0], DocumentType.CV, 1
+    )
+
+    assert numpy_repository._ivf_indexes[DocumentType.CV] is index
+    assert [doc.id for doc in found] == ["cv-new"]
+    assert numpy_repository._row_by_id["cv-new"] == 9
+
+    rank = numpy_repository._rank
+
+    def rank_during_row_reuse(*args):
+        if numpy_repository._row_by_id.get("cv-new") == 9:
+            numpy_repository.delete_documents(["cv-new"])
+            numpy_repository.upsert_embeddings(
+                [Document("job-x", DocumentType.JOB, "x")], [[0.0, 0.0, 1.0]]
+            )
+        return rank(*args)
+
+    numpy_repository._rank = rank_during_row_reuse
+    found = numpy_repository.search_by_vector(
+        [0.0, 0.0, 1.0], DocumentType.CV, 1
+    )
+
+    assert [doc.document_type for doc in found] == [DocumentType.CV]
+    assert found[0].id != "job-x"